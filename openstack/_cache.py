@@ -0,0 +1,330 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Book-keeping for the API response cache of a connection."""
+
+import collections
+from collections.abc import Callable, Iterator, Mapping
+import hashlib
+import json
+import threading
+from typing import Any, TYPE_CHECKING
+import urllib.parse
+
+from dogpile.cache import api as cache_api
+
+if TYPE_CHECKING:
+    from dogpile.cache import region as cache_region
+
+    from openstack import _json
+
+#: Default maximum number of response cache keys tracked per connection.
+DEFAULT_MAX_KEYS = 10000
+
+# Request arguments that never change the response.
+_IGNORED_ARGUMENTS = frozenset(
+    {'headers', 'params', 'global_request_id', 'connect_retries'}
+)
+
+# Request headers that never change the response, in lower case.
+_IGNORED_HEADERS = frozenset({'user-agent', 'x-openstack-request-id'})
+
+
+def _iter_params(params: Any) -> Iterator[tuple[str, str]]:
+    if isinstance(params, Mapping):
+        params = params.items()
+    for name, value in params or ():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple, set, frozenset)):
+            for item in value:
+                yield str(name), str(item)
+        else:
+            yield str(name), str(value)
+
+
+def make_cache_key(prefix: str, url: str, kwargs: Mapping[str, Any]) -> str:
+    """Build a canonical cache key for a request.
+
+    Requests that differ only in the order of their query parameters (other
+    than repeated ones), in the case of header names or in headers that don't
+    affect the response, such as the user agent, get the same key. Everything
+    but the prefix is hashed, so keys have a fixed length whatever the size
+    of the request.
+
+    :param prefix: The cache key prefix of the URL, e.g. ``compute.servers``.
+    :param url: The URL of the request, possibly with a query string.
+    :param kwargs: The remaining keyword arguments of the request.
+    :returns: A key of the form ``<prefix>.<sha256 hex digest>``.
+    """
+    parts = urllib.parse.urlsplit(url)
+    query = [
+        *urllib.parse.parse_qsl(parts.query, keep_blank_values=True),
+        *_iter_params(kwargs.get('params')),
+    ]
+    headers = {
+        name.lower(): str(value)
+        for name, value in (kwargs.get('headers') or {}).items()
+        if value is not None and name.lower() not in _IGNORED_HEADERS
+    }
+    others = {
+        name: value
+        for name, value in kwargs.items()
+        if name not in _IGNORED_ARGUMENTS
+    }
+    material = json.dumps(
+        [
+            parts.scheme,
+            parts.netloc,
+            parts.path,
+            # Sort by name only: the order of repeated parameters, such as
+            # sort_key, may matter.
+            sorted(query, key=lambda item: item[0]),
+            headers,
+            others,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(material.encode('utf-8')).hexdigest()
+    return f'{prefix}.{digest}'
+
+
+class CacheStats:
+    """Thread-safe counters of response cache activity."""
+
+    FIELDS = ('hits', 'misses', 'evictions', 'invalidations', 'revalidations')
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+
+    def record(self, name: str, count: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += count
+
+    def get(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = dict.fromkeys(self.FIELDS, 0)
+
+
+class _Node:
+    __slots__ = ('children', 'keys')
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.keys: set[str] = set()
+
+
+class CacheKeyIndex:
+    """Index of the response cache keys of a connection.
+
+    Keys are stored in a trie keyed by the parts of their cache key prefix
+    (``service_type.name.parts``, see :meth:`openstack.proxy.Proxy.request`),
+    so that invalidating a prefix only visits the affected subtree rather than
+    every key ever cached. The last part of the prefix is matched as a string
+    prefix, so invalidating ``compute.server`` also invalidates
+    ``compute.servers``.
+
+    The index is bounded: once it holds ``max_size`` keys, the least recently
+    stored key is evicted and ``on_evict`` is called with it, which should
+    drop it from the cache, since it could no longer be invalidated.
+
+    :param max_size: Maximum number of keys to track, or ``None`` for no limit.
+    :param on_evict: Callable called with each evicted key.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = DEFAULT_MAX_KEYS,
+        on_evict: Callable[[str], object] | None = None,
+    ) -> None:
+        self.max_size = max_size
+        self.on_evict = on_evict
+        self._root = _Node()
+        # key -> prefix parts, in order of last use
+        self._keys: collections.OrderedDict[str, tuple[str, ...]] = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.RLock()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._keys))
+
+    def add(self, key: str, prefix: str) -> None:
+        """Record that ``key`` was stored in the cache under ``prefix``."""
+        evicted = []
+        with self._lock:
+            if key in self._keys:
+                self._keys.move_to_end(key)
+                return
+
+            parts = tuple(prefix.split('.'))
+            node = self._root
+            for part in parts:
+                node = node.children.setdefault(part, _Node())
+            node.keys.add(key)
+            self._keys[key] = parts
+
+            while (
+                self.max_size is not None and len(self._keys) > self.max_size
+            ):
+                old_key = next(iter(self._keys))
+                self._discard(old_key)
+                evicted.append(old_key)
+
+        if self.on_evict:
+            for old_key in evicted:
+                self.on_evict(old_key)
+
+    def discard(self, key: str) -> None:
+        """Forget ``key`` if it is tracked."""
+        with self._lock:
+            self._discard(key)
+
+    def _discard(self, key: str) -> None:
+        parts = self._keys.pop(key, None)
+        if parts is None:
+            return
+
+        path = [self._root]
+        for part in parts:
+            path.append(path[-1].children[part])
+        path[-1].keys.discard(key)
+
+        # Prune the branches left empty.
+        for index in range(len(parts), 0, -1):
+            if path[index].keys or path[index].children:
+                break
+            del path[index - 1].children[parts[index - 1]]
+
+    def pop_prefix(self, prefix: str) -> list[str]:
+        """Forget and return all keys stored under ``prefix``."""
+        *parents, last = prefix.split('.')
+        with self._lock:
+            node = self._root
+            for part in parents:
+                child = node.children.get(part)
+                if child is None:
+                    return []
+                node = child
+
+            keys: list[str] = []
+            for name, child in list(node.children.items()):
+                if not name.startswith(last):
+                    continue
+                stack = [child]
+                while stack:
+                    current = stack.pop()
+                    keys.extend(current.keys)
+                    stack.extend(current.children.values())
+                del node.children[name]
+
+            for key in keys:
+                del self._keys[key]
+            return keys
+
+
+class ResourceCache:
+    """Cache of the resources of one type found under one base URL.
+
+    Resources are cached by ID, whether they were fetched or listed, so that
+    fetching a resource that was just listed doesn't need another request.
+    Entries are stored in the response cache region of the connection and
+    tracked by its :class:`CacheKeyIndex` under the cache key prefix of the
+    resource URL, e.g. ``compute.server``, so that requests modifying
+    resources of that type invalidate them as they do cached responses.
+
+    Entries hold the encoded attributes of the resource along with the
+    microversion they were loaded with, and are only used for that same
+    microversion.
+
+    :param region: The cache region of the connection.
+    :param index: The cache key index of the connection.
+    :param stats: The cache counters of the connection.
+    :param json_backend: The JSON backend used to encode entries.
+    :param prefix: The cache key prefix of the resource URL.
+    :param name: The qualified name of the resource class.
+    :param base_url: The URL the IDs of the resources are appended to.
+    :param expiration_time: The expiration time of entries in seconds, or -1
+        for entries to never expire.
+    """
+
+    def __init__(
+        self,
+        region: 'cache_region.CacheRegion',
+        index: CacheKeyIndex,
+        stats: CacheStats,
+        json_backend: '_json.JSONBackend',
+        prefix: str,
+        name: str,
+        base_url: str,
+        expiration_time: int,
+    ) -> None:
+        self.region = region
+        self.index = index
+        self.stats = stats
+        self.json_backend = json_backend
+        self.prefix = prefix
+        self.name = name
+        self.base_url = base_url
+        self.expiration_time = expiration_time
+
+    def _make_key(self, id: str) -> str:
+        material = json.dumps([self.name, self.base_url, str(id)])
+        digest = hashlib.sha256(material.encode('utf-8')).hexdigest()
+        return f'{self.prefix}.resource.{digest}'
+
+    def get(self, id: str, microversion: str | None) -> Any:
+        """Return the attributes cached for ``id``, or ``None``."""
+        value = self.region.get(
+            self._make_key(id), expiration_time=self.expiration_time
+        )
+        if value is not cache_api.NO_VALUE:
+            entry = self.json_backend.loads(value)
+            if entry['microversion'] == microversion:
+                self.stats.record('hits')
+                return entry['attrs']
+        self.stats.record('misses')
+        return None
+
+    def set(self, id: str, microversion: str | None, attrs: Any) -> None:
+        """Cache the attributes of ``id``."""
+        try:
+            value = self.json_backend.dumps(
+                {'microversion': microversion, 'attrs': attrs}
+            )
+        except (TypeError, ValueError):
+            # Attributes set locally may not be serializable
+            return
+        key = self._make_key(id)
+        self.region.set(key, value)
+        self.index.add(key, self.prefix)
+
+    def delete(self, id: str) -> None:
+        """Drop the attributes cached for ``id``, if any."""
+        key = self._make_key(id)
+        if key in self.index:
+            self.index.discard(key)
+            self.region.delete(key)
+            self.stats.record('invalidations')
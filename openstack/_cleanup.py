@@ -0,0 +1,420 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Project cleanup planned as a graph of individual resources."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import concurrent.futures
+import contextlib
+import dataclasses
+import queue
+import threading
+from typing import Any, TYPE_CHECKING
+
+from openstack import _log
+from openstack import resource
+from openstack import utils
+
+if TYPE_CHECKING:
+    from openstack import proxy as _proxy
+
+LOG = _log.setup_logging('openstack.project_cleanup')
+
+
+@dataclasses.dataclass
+class CleanupNode:
+    """A resource, or a whole service, to clean up."""
+
+    #: The key of the node, see :meth:`CleanupPlan.key`, or the name of the
+    #: service for services cleaned up as a whole.
+    key: str
+    #: The name of the service, such as ``block_storage``.
+    service: str
+    #: The proxy of the service.
+    proxy: _proxy.Proxy | None = None
+    #: The resource to delete.
+    resource: resource.Resource | None = None
+    #: The function deleting the resource.
+    delete: Callable[[Any], Any] | None = None
+    #: Whether to wait for the resource to be gone after deleting it.
+    wait: bool = False
+    #: Whether the filters and evaluation function select the resource, or
+    #: it is deleted along with its owner.
+    evaluate: bool = True
+    #: An evaluation function overriding the one of the cleanup.
+    evaluation_fn: Callable[..., bool] | None = None
+    #: The key of the node the resource is only deleted with.
+    owner: str | None = None
+    #: Whether the resource must be kept, for example when its type is
+    #: skipped.
+    keep: bool = False
+    #: The cleanup function of a service cleaned up as a whole.
+    cleanup: Callable[[], Any] | None = None
+
+
+def _noop(obj: Any) -> None:
+    pass
+
+
+class CleanupPlan:
+    """A graph of the resources of a project, ordered for their deletion.
+
+    Services add their resources with :meth:`add_resource` and declare which
+    resources must be gone before others can be deleted with
+    :meth:`add_dependency`, possibly across services, such as a server before
+    its ports. Services which do not describe their resources are cleaned up
+    as a whole with :meth:`add_service`.
+
+    :meth:`resolve` selects the resources to delete: those selected by the
+    filters of the cleanup, and by their owner for resources deleted along
+    with another, unless a resource that must be deleted before them is
+    kept. :meth:`execute` then deletes every resource as soon as the ones it
+    depends on are gone.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._nodes: dict[str, CleanupNode] = {}
+        self._dependencies: list[tuple[str, str, bool]] = []
+        self._service_dependencies: list[tuple[str, str]] = []
+        # Set by resolve
+        self._steps: list[str] = []
+        self._before: dict[str, set[str]] = {}
+
+    @staticmethod
+    def key(service: str, name: str, resource_id: str) -> str:
+        """Return the key of a resource, such as ``compute.server:<id>``."""
+        return f'{service}.{name}:{resource_id}'
+
+    def add_resource(
+        self,
+        proxy: _proxy.Proxy,
+        name: str,
+        res: resource.Resource,
+        delete: Callable[[Any], Any],
+        *,
+        wait: bool = False,
+        evaluate: bool = True,
+        evaluation_fn: Callable[..., bool] | None = None,
+        owner: str | None = None,
+        keep: bool = False,
+    ) -> str:
+        """Add a resource to the plan.
+
+        :param proxy: The proxy of the service of the resource.
+        :param name: The name of the type of the resource, such as
+            ``server``.
+        :param res: The resource.
+        :param delete: The function deleting the resource.
+        :param wait: Whether to wait for the resource to be gone after
+            deleting it.
+        :param evaluate: Whether the filters and evaluation function of the
+            cleanup select the resource. Otherwise it is deleted whenever its
+            ``owner`` is, or always if it has none.
+        :param evaluation_fn: An evaluation function overriding the one of
+            the cleanup.
+        :param owner: The key of the resource this one is only deleted with.
+        :param keep: Whether the resource must be kept.
+        :returns: The key of the resource.
+        """
+        assert proxy.service_type is not None  # narrow type
+        service = proxy.service_type.replace('-', '_')
+        key = self.key(service, name, res.id)
+        node = CleanupNode(
+            key=key,
+            service=service,
+            proxy=proxy,
+            resource=res,
+            delete=delete,
+            wait=wait,
+            evaluate=evaluate,
+            evaluation_fn=evaluation_fn,
+            owner=owner,
+            keep=keep,
+        )
+        with self._lock:
+            self._nodes[key] = node
+        return key
+
+    def add_service(self, service: str, cleanup: Callable[[], Any]) -> None:
+        """Add a service cleaned up as a whole to the plan.
+
+        Resources of the service which were already added, for example
+        before listing the others failed, are dropped.
+
+        :param service: The name of the service, such as ``dns``.
+        :param cleanup: The function cleaning up the service.
+        """
+        with self._lock:
+            self._nodes = {
+                key: node
+                for key, node in self._nodes.items()
+                if node.service != service
+            }
+            self._nodes[service] = CleanupNode(
+                key=service, service=service, cleanup=cleanup
+            )
+
+    def add_dependency(
+        self, before: str, after: str, required: bool = False
+    ) -> None:
+        """Declare that a resource must be gone before another is deleted.
+
+        :param before: The key of the resource to delete first.
+        :param after: The key of the resource to delete once ``before`` is
+            gone.
+        :param required: Whether ``after`` must be kept when ``before`` is
+            not part of the plan, for example a port owned by a server of
+            another service.
+        """
+        with self._lock:
+            self._dependencies.append((before, after, required))
+
+    def add_service_dependency(self, before: str, after: str) -> None:
+        """Declare that a service must be cleaned up before another.
+
+        Services whose resources are both part of the plan are ordered by
+        the dependencies of their resources instead.
+
+        :param before: The name of the service to clean up first.
+        :param after: The name of the service to clean up next.
+        """
+        with self._lock:
+            self._service_dependencies.append((before, after))
+
+    def _get_service_keys(self, service: str) -> list[str]:
+        if service in self._nodes:
+            return [service]
+        return [
+            key for key, node in self._nodes.items() if node.service == service
+        ]
+
+    def _get_dependencies(self) -> list[tuple[str, str, bool]]:
+        dependencies = list(self._dependencies)
+        planned = {
+            node.service
+            for node in self._nodes.values()
+            if node.cleanup is None
+        }
+        for before, after in self._service_dependencies:
+            if before in planned and after in planned:
+                continue
+            for before_key in self._get_service_keys(before):
+                for after_key in self._get_service_keys(after):
+                    dependencies.append((before_key, after_key, False))
+        return dependencies
+
+    def resolve(
+        self,
+        filters: dict[str, Any] | None = None,
+        resource_evaluation_fn: Callable[..., bool] | None = None,
+        identified_resources: dict[str, resource.Resource] | None = None,
+    ) -> list[str]:
+        """Select the resources to delete.
+
+        :param filters: The filters of the cleanup.
+        :param resource_evaluation_fn: The evaluation function of the
+            cleanup.
+        :param identified_resources: A dict receiving the resources to
+            delete by ID.
+        :returns: The keys of the resources to delete, and of the services
+            to clean up, in the order of their deletion.
+        """
+        if identified_resources is None:
+            identified_resources = {}
+
+        before: dict[str, set[str]] = {key: set() for key in self._nodes}
+        required: dict[str, set[str]] = {key: set() for key in self._nodes}
+        kept: set[str] = set()
+        dag = utils.TinyDAG()
+        for key in self._nodes:
+            dag.add_node(key)
+        for before_key, after_key, is_required in self._get_dependencies():
+            if after_key not in self._nodes:
+                continue
+            if before_key not in self._nodes:
+                if is_required:
+                    kept.add(after_key)
+                continue
+            before[after_key].add(before_key)
+            if is_required:
+                required[after_key].add(before_key)
+            dag.add_edge(before_key, after_key)
+        order = dag.topological_sort()
+
+        # Evaluate resources after the ones they depend on, so evaluation
+        # functions know which of those were identified.
+        selected: set[str] = set()
+        for key in order:
+            node = self._nodes[key]
+            if node.cleanup is not None:
+                selected.add(key)
+                continue
+            if node.keep or key in kept:
+                continue
+            if not required[key] <= selected:
+                continue
+            assert node.proxy is not None and node.resource is not None
+            if node.evaluate:
+                if not node.proxy._service_cleanup_del_res(
+                    _noop,
+                    node.resource,
+                    dry_run=True,
+                    identified_resources=identified_resources,
+                    filters=filters,
+                    resource_evaluation_fn=(
+                        node.evaluation_fn or resource_evaluation_fn
+                    ),
+                ):
+                    continue
+            else:
+                identified_resources[node.resource.id] = node.resource
+            selected.add(key)
+
+        # Keep resources whose owner is kept, or which depend on resources
+        # that are kept, until nothing changes.
+        changed = True
+        while changed:
+            changed = False
+            for key in order:
+                node = self._nodes[key]
+                if key not in selected or node.cleanup is not None:
+                    continue
+                if (
+                    node.owner is not None and node.owner not in selected
+                ) or not before[key] <= selected:
+                    selected.discard(key)
+                    changed = True
+
+        for key, node in self._nodes.items():
+            if node.resource is not None and key not in selected:
+                identified_resources.pop(node.resource.id, None)
+
+        self._steps = [key for key in order if key in selected]
+        self._before = {key: before[key] for key in self._steps}
+        return list(self._steps)
+
+    def get_steps(self) -> list[tuple[str, list[str]]]:
+        """Return the steps of the plan resolved by :meth:`resolve`.
+
+        :returns: A list of the keys of the resources to delete, and of the
+            services to clean up, in the order of their deletion, along with
+            the sorted keys of those which must be gone first.
+        """
+        return [(key, sorted(self._before[key])) for key in self._steps]
+
+    def report(
+        self, status_queue: queue.Queue[resource.Resource] | None
+    ) -> None:
+        """Put the resources to delete in ``status_queue``, and log them."""
+        for key, before in self.get_steps():
+            node = self._nodes[key]
+            if node.cleanup is not None:
+                LOG.debug('Cleaning up service %s', key)
+                continue
+            if before:
+                LOG.debug('Deleting %s after %s', key, ', '.join(before))
+            else:
+                LOG.debug('Deleting %s', key)
+            if status_queue is not None and node.resource is not None:
+                status_queue.put(node.resource)
+
+    def execute(self, dry_run: bool = True, timeout: int = 120) -> None:
+        """Delete the resources resolved by :meth:`resolve`.
+
+        Every resource is deleted as soon as the resources that must be gone
+        first are, with up to the ``cleanup_concurrency`` of its service
+        deleted at once. Resources depending on resources which could not be
+        deleted are kept. Services cleaned up as a whole always run.
+
+        :param dry_run: Only run the cleanup of services, in dry run mode.
+        :param timeout: How long, in seconds, to wait for each resource to be
+            deleted and for each next step to be ready.
+        """
+        dag = utils.TinyDAG()
+        for key in self._steps:
+            dag.add_node(key)
+        for key in self._steps:
+            for before_key in self._before[key]:
+                dag.add_edge(before_key, key)
+
+        # Every service gets its own workers, so resources of a service
+        # waiting for their turn never hold up those of other services
+        services: dict[str, int] = {}
+        for key in self._steps:
+            node = self._nodes[key]
+            if node.service in services:
+                continue
+            services[node.service] = (
+                1
+                if node.proxy is None
+                else node.proxy._get_cleanup_concurrency()
+            )
+        failed: set[str] = set()
+
+        with contextlib.ExitStack() as stack:
+            executors = {
+                service: stack.enter_context(
+                    concurrent.futures.ThreadPoolExecutor(
+                        max_workers=concurrency,
+                        thread_name_prefix=f'openstack-cleanup-{service}',
+                    )
+                )
+                for service, concurrency in services.items()
+            }
+            for key in dag.walk(timeout=timeout):
+                executors[self._nodes[key].service].submit(
+                    self._run, dag, key, dry_run, timeout, failed
+                )
+
+    def _run(
+        self,
+        dag: utils.TinyDAG,
+        key: str,
+        dry_run: bool,
+        timeout: int,
+        failed: set[str],
+    ) -> None:
+        node = self._nodes[key]
+        try:
+            if node.cleanup is not None:
+                node.cleanup()
+                return
+
+            with self._lock:
+                blocked = sorted(self._before[key] & failed)
+            if blocked:
+                LOG.warning(
+                    'Not deleting %s since %s could not be deleted',
+                    key,
+                    ', '.join(blocked),
+                )
+                with self._lock:
+                    failed.add(key)
+                return
+            if dry_run:
+                return
+
+            assert node.delete is not None and node.proxy is not None
+            assert node.resource is not None
+            node.delete(node.resource)
+            if node.wait:
+                resource.wait_for_delete(node.proxy, node.resource, 2, timeout)
+        except Exception:
+            LOG.exception('Cannot clean up %s', key)
+            if node.cleanup is None:
+                with self._lock:
+                    failed.add(key)
+        finally:
+            dag.node_done(key)
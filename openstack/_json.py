@@ -0,0 +1,174 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Pluggable JSON encoding and decoding of API payloads.
+
+By default request bodies are encoded by keystoneauth and responses are
+decoded by ``requests``, both of which use the stdlib :mod:`json` module. When
+the ``json_backend`` cloud option is set, a faster third-party library is used
+instead for resource payloads.
+"""
+
+from collections.abc import Callable
+import datetime
+import functools
+import importlib
+import json
+from typing import Any, TYPE_CHECKING
+import uuid
+
+from openstack import exceptions
+
+if TYPE_CHECKING:
+    import requests
+
+#: Backends tried, in order, when ``json_backend`` is ``auto``.
+AUTO_BACKENDS = ('orjson', 'ujson', 'simplejson')
+
+
+class JSONBackend:
+    """A JSON encoder/decoder pair.
+
+    :param name: The name of the backend, as used in the cloud config.
+    :param loads: A callable decoding ``bytes`` to Python objects.
+    :param dumps: A callable encoding Python objects to ``bytes`` or ``str``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[bytes], Any],
+        dumps: Callable[[Any], bytes | str],
+    ) -> None:
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.name!r})'
+
+    @property
+    def is_default(self) -> bool:
+        return self is DEFAULT_BACKEND
+
+    def load_response(self, response: 'requests.Response') -> Any:
+        """Decode the JSON body of a response."""
+        if self.is_default:
+            # Keep going through requests so that charset detection (and
+            # anything mocking ``Response.json``) behaves as before.
+            return response.json()
+        return self.loads(response.content)
+
+
+def _default(obj: Any) -> Any:
+    # Mirror what keystoneauth's encoder accepts on top of plain JSON types.
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if type(obj).__name__ == 'IPAddress':
+        return str(obj)
+    raise TypeError(
+        f'Object of type {type(obj).__name__} is not JSON serializable'
+    )
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(obj, default=_default)
+
+
+DEFAULT_BACKEND = JSONBackend('json', json.loads, _stdlib_dumps)
+
+
+def _load_orjson() -> JSONBackend:
+    orjson = importlib.import_module('orjson')
+    options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=options)  # type: ignore[no-any-return]
+
+    return JSONBackend('orjson', orjson.loads, dumps)
+
+
+def _load_ujson() -> JSONBackend:
+    ujson = importlib.import_module('ujson')
+
+    def dumps(obj: Any) -> str:
+        return ujson.dumps(  # type: ignore[no-any-return]
+            obj,
+            default=_default,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+        )
+
+    return JSONBackend('ujson', ujson.loads, dumps)
+
+
+def _load_simplejson() -> JSONBackend:
+    simplejson = importlib.import_module('simplejson')
+
+    def dumps(obj: Any) -> str:
+        return simplejson.dumps(obj, default=_default)  # type: ignore[no-any-return]
+
+    return JSONBackend('simplejson', simplejson.loads, dumps)
+
+
+_LOADERS: dict[str, Callable[[], JSONBackend]] = {
+    'orjson': _load_orjson,
+    'ujson': _load_ujson,
+    'simplejson': _load_simplejson,
+}
+
+
+@functools.cache
+def get_backend(name: str | None = None) -> JSONBackend:
+    """Return the JSON backend called ``name``.
+
+    :param name: One of ``json`` (the default), ``orjson``, ``ujson``,
+        ``simplejson`` or ``auto``. ``auto`` picks the first of the
+        third-party libraries that is installed, falling back to ``json``.
+    :returns: A :class:`JSONBackend`.
+    :raises: :class:`~openstack.exceptions.ConfigException` if the backend
+        is unknown or its library is not installed.
+    """
+    if not name or name == 'json':
+        return DEFAULT_BACKEND
+
+    if name == 'auto':
+        for candidate in AUTO_BACKENDS:
+            try:
+                return _LOADERS[candidate]()
+            except ImportError:
+                continue
+        return DEFAULT_BACKEND
+
+    if name not in _LOADERS:
+        raise exceptions.ConfigException(
+            f"Unknown json_backend '{name}'. Valid values are: "
+            f"{', '.join(['json', 'auto', *_LOADERS])}"
+        )
+
+    try:
+        return _LOADERS[name]()
+    except ImportError:
+        raise exceptions.ConfigException(
+            f"json_backend '{name}' was requested but the '{name}' library "
+            f"is not installed"
+        )
+
+
+def backend_for(connection: Any) -> JSONBackend:
+    """Return the backend configured for a connection, if any."""
+    backend = getattr(connection, 'json_backend', None)
+    if isinstance(backend, JSONBackend):
+        return backend
+    return DEFAULT_BACKEND
@@ -0,0 +1,230 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Emission of metrics from a background thread."""
+
+from collections.abc import Callable
+import queue
+import threading
+import time
+import types
+from typing import Any, TYPE_CHECKING
+
+from openstack import _log
+
+if TYPE_CHECKING:
+    import influxdb as influxdb_client  # type: ignore[import-not-found]
+    from statsd.client import base as statsd_client
+
+LOG = _log.setup_logging('openstack.metrics')
+
+#: Default maximum number of records waiting to be emitted.
+DEFAULT_QUEUE_SIZE = 10000
+#: Default maximum number of records emitted at once.
+DEFAULT_BATCH_SIZE = 100
+#: Default maximum time in seconds a record waits for its batch to fill up.
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+_Writer = Callable[[list[Any]], object]
+
+_STOP = object()
+
+
+class MetricsPipeline:
+    """Emit metrics from a background thread, in batches.
+
+    Request threads put records on a bounded queue and return immediately. A
+    single daemon thread, started on demand, hands them to their writer in
+    batches of up to ``batch_size`` records, or of whatever was queued within
+    ``flush_interval`` seconds of the first record of the batch. When the
+    queue is full, records are dropped rather than delaying requests and
+    counted in :attr:`dropped`.
+
+    :param queue_size: Maximum number of records waiting to be emitted.
+    :param batch_size: Maximum number of records emitted at once.
+    :param flush_interval: Maximum time in seconds a record waits for its
+        batch to fill up.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        self.batch_size = max(int(batch_size), 1)
+        self.flush_interval = float(flush_interval)
+        self.dropped = 0
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=int(queue_size))
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, writer: _Writer, record: Any) -> bool:
+        """Queue ``record`` to be emitted by ``writer``.
+
+        :param writer: A callable emitting a list of records.
+        :param record: The record to emit.
+        :returns: Whether the record was queued rather than dropped.
+        """
+        self._start()
+        try:
+            self._queue.put_nowait((writer, record))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                first = self.dropped == 1
+            if first:
+                LOG.warning(
+                    'Metrics queue is full, dropping metrics until it drains'
+                )
+            return False
+        return True
+
+    def flush(self) -> None:
+        """Wait until all queued records have been emitted."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Emit all queued records and stop the background thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join()
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='openstack-metrics', daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batches: dict[_Writer, list[Any]] = {}
+            count = 0
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                count += 1
+                if item is _STOP:
+                    stopping = True
+                    break
+                writer, record = item
+                batches.setdefault(writer, []).append(record)
+                if count >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(
+                        timeout=max(deadline - time.monotonic(), 0)
+                    )
+                except queue.Empty:
+                    break
+
+            for writer, records in batches.items():
+                try:
+                    writer(records)
+                except Exception:
+                    # We do not want errors in metric reporting ever break
+                    # the pipeline
+                    LOG.exception('Exception emitting metrics')
+            for _ in range(count):
+                self._queue.task_done()
+
+
+class _StatsdRecorder:
+    """Records the calls made to a statsd pipeline to replay them later."""
+
+    def __init__(self, client: 'StatsClient') -> None:
+        self._client = client
+        self._calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __enter__(self) -> '_StatsdRecorder':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        if exc_type is None and self._calls:
+            self._client._submit(self._calls)
+
+    def timing(self, *args: Any) -> None:
+        self._calls.append(('timing', args))
+
+    def incr(self, *args: Any) -> None:
+        self._calls.append(('incr', args))
+
+
+class StatsClient:
+    """A statsd client emitting metrics through a :class:`MetricsPipeline`.
+
+    Each batch of metrics is sent through a single statsd pipeline, which
+    packs them in as few packets as possible.
+
+    :param client: The statsd client to emit metrics with.
+    :param pipeline: The pipeline to emit metrics through.
+    """
+
+    def __init__(
+        self,
+        client: 'statsd_client.StatsClientBase',
+        pipeline: MetricsPipeline,
+    ) -> None:
+        self.client = client
+        self._pipeline = pipeline
+
+    def pipeline(self) -> _StatsdRecorder:
+        return _StatsdRecorder(self)
+
+    def _submit(self, calls: list[tuple[str, tuple[Any, ...]]]) -> None:
+        self._pipeline.submit(self._write, calls)
+
+    def _write(self, records: list[list[tuple[str, tuple[Any, ...]]]]) -> None:
+        with self.client.pipeline() as pipe:
+            for calls in records:
+                for name, args in calls:
+                    getattr(pipe, name)(*args)
+
+
+class InfluxDBClient:
+    """An InfluxDB client writing points through a :class:`MetricsPipeline`.
+
+    Each batch of points is written with a single request.
+
+    :param client: The InfluxDB client to write points with.
+    :param pipeline: The pipeline to write points through.
+    """
+
+    def __init__(
+        self,
+        client: 'influxdb_client.InfluxDBClient',
+        pipeline: MetricsPipeline,
+    ) -> None:
+        self.client = client
+        self._pipeline = pipeline
+
+    def write_points(self, points: list[dict[str, Any]]) -> bool:
+        return self._pipeline.submit(self._write, points)
+
+    def _write(self, records: list[list[dict[str, Any]]]) -> None:
+        self.client.write_points(
+            [point for points in records for point in points]
+        )
@@ -10,15 +10,21 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from openstack.accelerator.v2 import _proxy
+from typing import TYPE_CHECKING
+
 from openstack import service_description
 
+if TYPE_CHECKING:
+    from openstack.accelerator.v2 import _proxy  # noqa: F401
+
 
 class AcceleratorService(
-    service_description.ServiceDescription[_proxy.Proxy],
+    service_description.ServiceDescription['_proxy.Proxy'],
 ):
     """The accelerator service."""
 
-    supported_versions = {
-        '2': _proxy.Proxy,
-    }
+    supported_versions = service_description.ProxyVersions(
+        {
+            '2': 'openstack.accelerator.v2._proxy.Proxy',
+        }
+    )
@@ -10,6 +10,20 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from typing import TYPE_CHECKING
+
+from openstack import utils
+
 __all__ = ['Proxy']
 
-from openstack.accelerator.v2._proxy import Proxy
+if TYPE_CHECKING:
+    from openstack.accelerator.v2._proxy import Proxy
+
+
+def __getattr__(name: str) -> object:
+    # Import the proxy, and the many resources it uses, on first use only
+    if name == 'Proxy':
+        from openstack.accelerator.v2._proxy import Proxy
+
+        return Proxy
+    return utils.import_submodule(__name__, name)
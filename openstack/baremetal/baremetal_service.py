@@ -10,13 +10,19 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from openstack.baremetal.v1 import _proxy
+from typing import TYPE_CHECKING
+
 from openstack import service_description
 
+if TYPE_CHECKING:
+    from openstack.baremetal.v1 import _proxy  # noqa: F401
+
 
-class BaremetalService(service_description.ServiceDescription[_proxy.Proxy]):
+class BaremetalService(service_description.ServiceDescription['_proxy.Proxy']):
     """The bare metal service."""
 
-    supported_versions = {
-        '1': _proxy.Proxy,
-    }
+    supported_versions = service_description.ProxyVersions(
+        {
+            '1': 'openstack.baremetal.v1._proxy.Proxy',
+        }
+    )
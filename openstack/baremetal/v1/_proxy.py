@@ -699,6 +699,7 @@ class Proxy(proxy.Proxy):
                 timeout,
                 f"Timeout waiting for nodes {log_nodes} to reach "
                 f"target state '{expected_state}'",
+                **utils.get_polling_options(self, 'Node'),
             ):
                 remaining = []
                 for n in [self.get_node(n) for n in node_refs]:
@@ -100,7 +100,9 @@ class Allocation(resource.Resource):
             return self
 
         for count in utils.iterate_timeout(
-            timeout, f"Timeout waiting for the allocation {self.id}"
+            timeout,
+            f"Timeout waiting for the allocation {self.id}",
+            **utils.get_polling_options(session, 'Allocation'),
         ):
             self.fetch(session)
 
@@ -620,6 +620,7 @@ class Node(_common.Resource):
             timeout,
             f"Timeout waiting for node {self.id} to reach "
             f"power state '{expected_state}'",
+            **utils.get_polling_options(session, 'Node'),
         ):
             self.fetch(session)
             if self.power_state == expected_state:
@@ -642,6 +643,7 @@ class Node(_common.Resource):
         expected_state: str,
         timeout: int | float | None = None,
         abort_on_failed_state: bool = True,
+        strategy: utils.PollingStrategy | None = None,
     ) -> Self:
         """Wait for the node to reach the expected state.
 
@@ -654,6 +656,9 @@ class Node(_common.Resource):
             if the node reaches a failure state which does not match the
             expected one. Note that the failure state for ``enroll`` ->
             ``manageable`` transition is ``enroll`` again.
+        :param strategy: The :class:`~openstack.utils.PollingStrategy`
+            deciding how long to wait between checks. Defaults to the
+            ``polling_strategy`` of the cloud.
 
         :return: This :class:`Node` instance.
         :raises: :class:`~openstack.exceptions.ResourceFailure` if the node
@@ -664,6 +669,7 @@ class Node(_common.Resource):
             timeout,
             f"Timeout waiting for node {self.id} to reach "
             f"target state '{expected_state}'",
+            **utils.get_polling_options(session, 'Node', strategy),
         ):
             self.fetch(session)
             if self._check_state_reached(
@@ -714,6 +720,7 @@ class Node(_common.Resource):
         for count in utils.iterate_timeout(
             timeout,
             f"Timeout waiting for the lock to be released on node {self.id}",
+            **utils.get_polling_options(session, 'Node'),
         ):
             self.fetch(session)
             if self.reservation is None:
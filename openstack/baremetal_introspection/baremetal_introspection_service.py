@@ -10,15 +10,21 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from openstack.baremetal_introspection.v1 import _proxy
+from typing import TYPE_CHECKING
+
 from openstack import service_description
 
+if TYPE_CHECKING:
+    from openstack.baremetal_introspection.v1 import _proxy  # noqa: F401
+
 
 class BaremetalIntrospectionService(
-    service_description.ServiceDescription[_proxy.Proxy]
+    service_description.ServiceDescription['_proxy.Proxy']
 ):
     """The bare metal introspection service."""
 
-    supported_versions = {
-        '1': _proxy.Proxy,
-    }
+    supported_versions = service_description.ProxyVersions(
+        {
+            '1': 'openstack.baremetal_introspection.v1._proxy.Proxy',
+        }
+    )
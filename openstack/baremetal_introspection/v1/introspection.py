@@ -127,7 +127,9 @@ class Introspection(resource.Resource):
             return self
 
         for count in utils.iterate_timeout(
-            timeout, f"Timeout waiting for introspection on node {self.id}"
+            timeout,
+            f"Timeout waiting for introspection on node {self.id}",
+            **utils.get_polling_options(session, 'Introspection'),
         ):
             self.fetch(session)
             if self._check_state(ignore_error):
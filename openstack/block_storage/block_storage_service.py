@@ -10,17 +10,23 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from openstack.block_storage.v2 import _proxy as _v2_proxy
-from openstack.block_storage.v3 import _proxy as _v3_proxy
+from typing import TYPE_CHECKING
+
 from openstack import service_description
 
+if TYPE_CHECKING:
+    from openstack.block_storage.v2 import _proxy as _v2_proxy  # noqa: F401
+    from openstack.block_storage.v3 import _proxy as _v3_proxy  # noqa: F401
+
 
 class BlockStorageService(
-    service_description.ServiceDescription[_v2_proxy.Proxy | _v3_proxy.Proxy]
+    service_description.ServiceDescription['_v2_proxy.Proxy | _v3_proxy.Proxy']
 ):
     """The block storage service."""
 
-    supported_versions = {
-        '3': _v3_proxy.Proxy,
-        '2': _v2_proxy.Proxy,
-    }
+    supported_versions = service_description.ProxyVersions(
+        {
+            '3': 'openstack.block_storage.v3._proxy.Proxy',
+            '2': 'openstack.block_storage.v2._proxy.Proxy',
+        }
+    )
@@ -2411,6 +2411,51 @@ class Proxy(proxy.Proxy):
             self, res, status, failures, interval, wait, attribute, callback
         )
 
+    def wait_for_volumes(
+        self,
+        volumes: Iterable[_volume.Volume],
+        status: str | None = 'available',
+        failures: list[str] | None = None,
+        interval: int | float | None = 2,
+        wait: int | None = None,
+        **query: Any,
+    ) -> dict[str, _volume.Volume | exceptions.SDKException]:
+        """Wait for many volumes to be in a particular status or deleted.
+
+        The volumes are refreshed with one listing of volumes per interval
+        rather than one request per volume.
+
+        :param volumes: The :class:`~openstack.block_storage.v2.volume.Volume`
+            instances to wait on.
+        :param status: Desired status, or ``None`` to wait for the volumes to
+            be deleted.
+        :param failures: Statuses that would indicate the transition
+            failed. Defaults to ``['error']``.
+        :param interval: Number of seconds to wait between checks.
+        :param wait: Maximum number of seconds to wait for transition.
+            Set to ``None`` to wait forever.
+        :param query: Additional query parameters of the listing of volumes,
+            such as ``all_projects``, which must not filter out the volumes.
+
+        :returns: A dict of the ID of each volume to the updated volume, or
+            to the :class:`~openstack.exceptions.ResourceFailure` or
+            :class:`~openstack.exceptions.ResourceTimeout` exception raised
+            for it.
+        """
+        if failures is None:
+            failures = ['error']
+
+        return resource.wait_for_many(
+            self,
+            volumes,
+            status,
+            failures,
+            interval,
+            wait,
+            base_path='/volumes/detail',
+            **query,
+        )
+
     def wait_for_delete(
         self,
         res: resource.ResourceT,
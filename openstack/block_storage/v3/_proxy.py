@@ -17,6 +17,7 @@ import warnings
 
 import requests
 
+from openstack import _cleanup
 from openstack._utils import renamed_param
 from openstack.block_storage.v3 import attachment as _attachment
 from openstack.block_storage.v3 import availability_zone
@@ -3799,6 +3800,51 @@ class Proxy(proxy.Proxy):
             self, res, status, failures, interval, wait, attribute, callback
         )
 
+    def wait_for_volumes(
+        self,
+        volumes: Iterable[_volume.Volume],
+        status: str | None = 'available',
+        failures: list[str] | None = None,
+        interval: int | float | None = 2,
+        wait: int | None = None,
+        **query: Any,
+    ) -> dict[str, _volume.Volume | exceptions.SDKException]:
+        """Wait for many volumes to be in a particular status or deleted.
+
+        The volumes are refreshed with one listing of volumes per interval
+        rather than one request per volume.
+
+        :param volumes: The :class:`~openstack.block_storage.v3.volume.Volume`
+            instances to wait on.
+        :param status: Desired status, or ``None`` to wait for the volumes to
+            be deleted.
+        :param failures: Statuses that would indicate the transition
+            failed. Defaults to ``['error']``.
+        :param interval: Number of seconds to wait between checks.
+        :param wait: Maximum number of seconds to wait for transition.
+            Set to ``None`` to wait forever.
+        :param query: Additional query parameters of the listing of volumes,
+            such as ``all_projects``, which must not filter out the volumes.
+
+        :returns: A dict of the ID of each volume to the updated volume, or
+            to the :class:`~openstack.exceptions.ResourceFailure` or
+            :class:`~openstack.exceptions.ResourceTimeout` exception raised
+            for it.
+        """
+        if failures is None:
+            failures = ['error']
+
+        return resource.wait_for_many(
+            self,
+            volumes,
+            status,
+            failures,
+            interval,
+            wait,
+            base_path='/volumes/detail',
+            **query,
+        )
+
     def wait_for_delete(
         self,
         res: resource.ResourceT,
@@ -3854,16 +3900,15 @@ class Proxy(proxy.Proxy):
         if not self.should_skip_resource_cleanup("backup", skip_resources):
             if dry_run:
                 # Just iterate and evaluate backups in dry_run mode
-                for obj in self.backups(details=False):
-                    need_delete = self._service_cleanup_del_res(
-                        self.delete_backup,
-                        obj,
-                        dry_run=dry_run,
-                        client_status_queue=client_status_queue,
-                        identified_resources=identified_resources,
-                        filters=filters,
-                        resource_evaluation_fn=resource_evaluation_fn,
-                    )
+                self._service_cleanup_del_many(
+                    self.delete_backup,
+                    self.backups(details=False),
+                    dry_run=dry_run,
+                    client_status_queue=client_status_queue,
+                    identified_resources=identified_resources,
+                    filters=filters,
+                    resource_evaluation_fn=resource_evaluation_fn,
+                )
             else:
                 # Set initial iterations conditions
                 need_backup_iteration = True
@@ -3872,7 +3917,7 @@ class Proxy(proxy.Proxy):
                     # Reset iteration controls
                     need_backup_iteration = False
                     max_iterations -= 1
-                    backups = []
+                    independent_backups = []
                     # To increase success chance sort backups by age, dependent
                     # backups are logically younger.
                     for obj in self.backups(
@@ -3880,60 +3925,113 @@ class Proxy(proxy.Proxy):
                     ):
                         if not obj.has_dependent_backups:
                             # If no dependent backups - go with it
-                            need_delete = self._service_cleanup_del_res(
-                                self.delete_backup,
-                                obj,
-                                dry_run=dry_run,
-                                client_status_queue=client_status_queue,
-                                identified_resources=identified_resources,
-                                filters=filters,
-                                resource_evaluation_fn=resource_evaluation_fn,
-                            )
-                            if not dry_run and need_delete:
-                                backups.append(obj)
+                            independent_backups.append(obj)
                         else:
                             # Otherwise we need another iteration
                             need_backup_iteration = True
+                    backups = self._service_cleanup_del_many(
+                        self.delete_backup,
+                        independent_backups,
+                        dry_run=dry_run,
+                        client_status_queue=client_status_queue,
+                        identified_resources=identified_resources,
+                        filters=filters,
+                        resource_evaluation_fn=resource_evaluation_fn,
+                    )
 
-                    # Before proceeding need to wait for backups to be deleted
-                    for obj in backups:
-                        try:
-                            self.wait_for_delete(obj)
-                        except exceptions.SDKException:
-                            # Well, did our best, still try further
-                            pass
+                    # Before proceeding need to wait for backups to be deleted.
+                    # Failures are ignored: we did our best, still try further
+                    self._service_cleanup_wait_for_many(backups)
 
         if not self.should_skip_resource_cleanup("snapshot", skip_resources):
-            snapshots = []
-            for snap_obj in self.snapshots(details=False):
-                need_delete = self._service_cleanup_del_res(
-                    self.delete_snapshot,
-                    snap_obj,
-                    dry_run=dry_run,
-                    client_status_queue=client_status_queue,
-                    identified_resources=identified_resources,
-                    filters=filters,
-                    resource_evaluation_fn=resource_evaluation_fn,
-                )
-                if not dry_run and need_delete:
-                    snapshots.append(snap_obj)
+            snapshots = self._service_cleanup_del_many(
+                self.delete_snapshot,
+                self.snapshots(details=False),
+                dry_run=dry_run,
+                client_status_queue=client_status_queue,
+                identified_resources=identified_resources,
+                filters=filters,
+                resource_evaluation_fn=resource_evaluation_fn,
+            )
 
-            # Before deleting volumes need to wait for snapshots to be deleted
-            for snap_obj in snapshots:
-                try:
-                    self.wait_for_delete(snap_obj)
-                except exceptions.SDKException:
-                    # Well, did our best, still try further
-                    pass
+            # Before deleting volumes need to wait for snapshots to be deleted.
+            # Failures are ignored: we did our best, still try further
+            if not dry_run:
+                self._service_cleanup_wait_for_many(snapshots)
 
         if not self.should_skip_resource_cleanup("volume", skip_resources):
-            for vol_obj in self.volumes(details=True):
-                self._service_cleanup_del_res(
-                    self.delete_volume,
-                    vol_obj,
-                    dry_run=dry_run,
-                    client_status_queue=client_status_queue,
-                    identified_resources=identified_resources,
-                    filters=filters,
-                    resource_evaluation_fn=resource_evaluation_fn,
-                )
+            self._service_cleanup_del_many(
+                self.delete_volume,
+                self.volumes(details=True),
+                dry_run=dry_run,
+                client_status_queue=client_status_queue,
+                identified_resources=identified_resources,
+                filters=filters,
+                resource_evaluation_fn=resource_evaluation_fn,
+            )
+
+    def _plan_cleanup(
+        self,
+        plan: _cleanup.CleanupPlan,
+        skip_resources: Sequence[str] | None = None,
+    ) -> None:
+        keep_volumes = self.should_skip_resource_cleanup(
+            "volume", skip_resources
+        )
+        for vol_obj in self.volumes(details=True):
+            key = plan.add_resource(
+                self,
+                'volume',
+                vol_obj,
+                self.delete_volume,
+                wait=True,
+                keep=keep_volumes,
+            )
+            # Attached volumes can only be deleted once their server is gone
+            for attachment in vol_obj.attachments or []:
+                if attachment.get('server_id'):
+                    plan.add_dependency(
+                        plan.key('compute', 'server', attachment['server_id']),
+                        key,
+                        required=True,
+                    )
+
+        keep_snapshots = self.should_skip_resource_cleanup(
+            "snapshot", skip_resources
+        )
+        for snap_obj in self.snapshots(details=True):
+            key = plan.add_resource(
+                self,
+                'snapshot',
+                snap_obj,
+                self.delete_snapshot,
+                wait=True,
+                keep=keep_snapshots,
+            )
+            plan.add_dependency(
+                key, plan.key('block_storage', 'volume', snap_obj.volume_id)
+            )
+
+        keep_backups = self.should_skip_resource_cleanup(
+            "backup", skip_resources
+        )
+        # Backups with dependent backups can only be deleted once those are
+        # gone. The API does not tell which backups they are, but they are
+        # younger incremental backups of the same volume.
+        younger: dict[str, list[str]] = {}
+        for obj in self.backups(
+            details=True, sort_key='created_at', sort_dir='desc'
+        ):
+            key = plan.add_resource(
+                self,
+                'backup',
+                obj,
+                self.delete_backup,
+                wait=True,
+                keep=keep_backups,
+            )
+            if obj.has_dependent_backups:
+                for dependent_key in younger.get(obj.volume_id, []):
+                    plan.add_dependency(dependent_key, key)
+            if obj.is_incremental:
+                younger.setdefault(obj.volume_id, []).append(key)
@@ -21,7 +21,6 @@ from openstack.cloud import _network_common
 from openstack.cloud import _utils
 from openstack.cloud import exc
 from openstack.cloud import meta
-from openstack.compute.v2 import server as _server
 from openstack import exceptions
 from openstack import resource
 from openstack import utils
@@ -1238,6 +1237,7 @@ class ComputeCloudMixin(_network_common.NetworkCommonCloudMixin):
             timeout,
             timeout_message,
             wait=min(5, timeout),
+            **utils.get_polling_options(self, 'Server'),
         ):
             try:
                 server = self.get_server(server_id)
@@ -1501,6 +1501,8 @@ class ComputeCloudMixin(_network_common.NetworkCommonCloudMixin):
         if not wait:
             return True
 
+        from openstack.compute.v2 import server as _server
+
         if not isinstance(server, _server.Server):
             # We might come here with Munch object (at the moment).
             # If this is the case - convert it into real server to be able to
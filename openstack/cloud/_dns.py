@@ -12,7 +12,6 @@
 
 from openstack.cloud import _utils
 from openstack.cloud import openstackcloud
-from openstack.dns.v2 import zone as _zone
 from openstack import exceptions
 
 
@@ -151,6 +150,8 @@ class DnsCloudMixin(openstackcloud._OpenStackCloudMixin):
         :returns: A list of recordsets.
 
         """
+        from openstack.dns.v2 import zone as _zone
+
         if isinstance(zone, _zone.Zone):
             zone_obj = zone
         else:
@@ -170,6 +171,8 @@ class DnsCloudMixin(openstackcloud._OpenStackCloudMixin):
             found.
 
         """
+        from openstack.dns.v2 import zone as _zone
+
         if isinstance(zone, _zone.Zone):
             zone_obj = zone
         else:
@@ -201,6 +204,8 @@ class DnsCloudMixin(openstackcloud._OpenStackCloudMixin):
         :raises: :class:`~openstack.exceptions.SDKException` on operation
             error.
         """
+        from openstack.dns.v2 import zone as _zone
+
         if isinstance(zone, _zone.Zone):
             zone_obj = zone
         else:
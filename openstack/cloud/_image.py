@@ -89,7 +89,7 @@ class ImageCloudMixin(openstackcloud._OpenStackCloudMixin):
             filter_deleted = False
         # First, try to actually get images from glance, it's more efficient
         images = []
-        params = {}
+        params: dict[str, Any] = {}
         image_list = []
         if utils.supports_version(self.image, '2'):
             if show_all:
@@ -222,7 +222,9 @@ class ImageCloudMixin(openstackcloud._OpenStackCloudMixin):
     def wait_for_image(self, image, timeout=3600):
         image_id = image['id']
         for count in utils.iterate_timeout(
-            timeout, "Timeout waiting for image to snapshot"
+            timeout,
+            "Timeout waiting for image to snapshot",
+            **utils.get_polling_options(self, 'Image'),
         ):
             image = self.get_image(image_id)
             if not image:
@@ -274,7 +276,9 @@ class ImageCloudMixin(openstackcloud._OpenStackCloudMixin):
 
         if wait:
             for count in utils.iterate_timeout(
-                timeout, "Timeout waiting for the image to be deleted."
+                timeout,
+                "Timeout waiting for the image to be deleted.",
+                **utils.get_polling_options(self, 'Image'),
             ):
                 if self.get_image(image.id) is None:
                     break
@@ -381,7 +385,9 @@ class ImageCloudMixin(openstackcloud._OpenStackCloudMixin):
 
         try:
             for count in utils.iterate_timeout(
-                timeout, "Timeout waiting for the image to finish."
+                timeout,
+                "Timeout waiting for the image to finish.",
+                **utils.get_polling_options(self, 'Image'),
             ):
                 image_obj = self.get_image(image.id)
                 if image_obj and image_obj.status not in ('queued', 'saving'):
@@ -839,6 +839,7 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
                         timeout,
                         "Timeout waiting for the floating IP to be ACTIVE",
                         wait=min(5, timeout),
+                        **utils.get_polling_options(self, 'FloatingIP'),
                     ):
                         fip = self.get_floating_ip(fip_id)
                         if fip and fip['status'] == 'ACTIVE':
@@ -1076,6 +1077,7 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
                 timeout,
                 "Timeout waiting for the floating IP to be attached.",
                 wait=min(5, timeout),
+                **utils.get_polling_options(self, 'Server'),
             ):
                 server = self.compute.get_server(server_id)
                 ext_ip = meta.get_server_ip(
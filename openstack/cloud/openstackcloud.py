@@ -15,6 +15,7 @@ import concurrent.futures
 import copy
 import functools
 import queue
+import threading
 import types
 from typing import Any, Optional, Self, TYPE_CHECKING
 from collections.abc import Callable
@@ -27,6 +28,9 @@ from keystoneauth1.identity import base as ks_plugin_base
 import requests.models
 import urllib3.exceptions
 
+from openstack import _cache
+from openstack import _cleanup
+from openstack import _json
 from openstack import _log
 from openstack import _services_mixin
 from openstack.cloud import _utils
@@ -270,7 +274,25 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
         for expire_key in expirations.keys():
             self._cache_expirations[expire_key] = expirations[expire_key]
 
-        self._api_cache_keys: set[str] = set()
+        self._cache_revalidate = self.config.get_cache_revalidate()
+        self._cache_stats = _cache.CacheStats()
+        self._polling_stats = utils.PollingStats()
+        # Set to a resource.WaiterRegistry for waiters to receive resource
+        # changes from event sources instead of polling
+        self.waiter_registry: resource.WaiterRegistry | None = None
+        # Guards the resources identified by project cleanups
+        self._cleanup_lock = threading.Lock()
+        cache_max_keys = self.config.get_cache_max_keys()
+        self._api_cache_keys = _cache.CacheKeyIndex(
+            max_size=(
+                _cache.DEFAULT_MAX_KEYS
+                if cache_max_keys is None
+                else int(cache_max_keys) or None
+            ),
+            on_evict=self._evict_cache_key,
+        )
+
+        self.json_backend = _json.get_backend(self.config.get_json_backend())
 
         self._local_ipv6 = (
             _utils.localhost_supports_ipv6() if not self.force_ipv4 else False
@@ -300,6 +322,7 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
     def close(self) -> None:
         """Release any resources held open."""
         self.config.set_auth_cache()
+        self.config.close_metrics()
         if self.__pool_executor:
             self.__pool_executor.shutdown()
         atexit.unregister(self.close)
@@ -368,6 +391,43 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
         new_conn.set_global_request_id(global_request_id)
         return new_conn
 
+    def get_cache_stats(self) -> dict[str, int]:
+        """Return counters of the API response cache of this connection.
+
+        :returns: A dict with the number of cache ``hits`` and ``misses`` of
+            GET requests and resource fetches, the number of entries dropped
+            from the cache to stay within ``cache.max_keys`` (``evictions``)
+            or because of other requests to the same resources
+            (``invalidations``), the number of expired responses found to be
+            unchanged by a conditional request when ``cache.revalidate`` is
+            set (``revalidations``), and the number of entries currently
+            tracked (``keys``).
+        """
+        stats = self._cache_stats.get()
+        stats['keys'] = len(self._api_cache_keys)
+        return stats
+
+    def reset_cache_stats(self) -> None:
+        """Reset the counters returned by :meth:`get_cache_stats`."""
+        self._cache_stats.reset()
+
+    def get_polling_stats(self) -> dict[str, dict[str, int]]:
+        """Return counters of the polls issued by waiters of this connection.
+
+        :returns: A dict of the names of the classes of waited resources,
+            such as ``Server``, to a dict with the number of ``waiters`` that
+            finished and the number of ``polls`` they issued in total.
+        """
+        return self._polling_stats.get()
+
+    def reset_polling_stats(self) -> None:
+        """Reset the counters returned by :meth:`get_polling_stats`."""
+        self._polling_stats.reset()
+
+    def _evict_cache_key(self, key: str) -> None:
+        self._cache.delete(key)
+        self._cache_stats.record('evictions')
+
     def _make_cache(
         self,
         cache_class: str,
@@ -719,11 +779,18 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
         filters=None,
         resource_evaluation_fn=None,
         skip_resources=None,
+        pipeline=False,
     ):
         """Cleanup the project resources.
 
         Cleanup all resources in all services, which provide cleanup methods.
 
+        By default, services are cleaned up one after the other, in the order
+        of their dependencies. With ``pipeline``, the individual resources of
+        the compute, network and block storage services are listed up front
+        and each of them is deleted as soon as the resources depending on it,
+        such as the servers using a port, are gone.
+
         :param bool dry_run: Cleanup or only list identified resources.
         :param int wait_timeout: Maximum amount of time given to each service
             to comlete the cleanup.
@@ -737,7 +804,28 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
             whether resource need to be deleted or not.
         :param skip_resources: List of specific resources whose cleanup should
             be skipped.
+        :param bool pipeline: Delete individual resources as soon as the
+            resources depending on them are gone, rather than one service
+            after the other. Services whose resources cannot be listed are
+            cleaned up as a whole, and
+            :class:`~openstack.exceptions.ResourceTimeout` is raised before
+            deleting anything if listing them takes longer than
+            ``wait_timeout``.
+        :returns: With ``pipeline``, the plan of the cleanup, as a list of the
+            resources to delete in order, such as ``compute.server:<id>``, or
+            of services cleaned up as a whole, each along with the list of
+            those which must be gone first. Otherwise ``None``.
         """
+        if pipeline:
+            return self._project_cleanup_pipeline(
+                dry_run=dry_run,
+                wait_timeout=wait_timeout,
+                status_queue=status_queue,
+                filters=filters,
+                resource_evaluation_fn=resource_evaluation_fn,
+                skip_resources=skip_resources,
+            )
+
         dependencies = {}
         get_dep_fn_name = '_get_cleanup_dependencies'
         cleanup_fn_name = '_service_cleanup'
@@ -807,6 +895,95 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
             if dep_graph.is_complete():
                 return
 
+    def _project_cleanup_pipeline(
+        self,
+        dry_run=True,
+        wait_timeout=120,
+        status_queue=None,
+        filters=None,
+        resource_evaluation_fn=None,
+        skip_resources=None,
+    ):
+        plan = _cleanup.CleanupPlan()
+        cleanup_resources: dict[str, resource.Resource] = {}
+        listings = {}
+        for service in self.config.get_enabled_services():
+            try:
+                if not hasattr(self, service):
+                    continue
+                proxy = getattr(self, service)
+                if not proxy:
+                    continue
+                cleanup_fn = functools.partial(
+                    proxy._service_cleanup,
+                    dry_run=dry_run,
+                    client_status_queue=status_queue,
+                    identified_resources=cleanup_resources,
+                    filters=filters,
+                    resource_evaluation_fn=resource_evaluation_fn,
+                    skip_resources=skip_resources,
+                )
+                plan_fn = getattr(proxy, '_plan_cleanup', None)
+                if plan_fn:
+                    # List the resources of all services concurrently
+                    listing = self._pool_executor.submit(
+                        plan_fn, plan, skip_resources=skip_resources
+                    )
+                    listings[listing] = (service, cleanup_fn)
+                deps = proxy._get_cleanup_dependencies()
+                if not deps:
+                    continue
+                if not plan_fn:
+                    plan.add_service(service, cleanup_fn)
+                for k, v in deps.items():
+                    for dep in v['before']:
+                        plan.add_service_dependency(k, dep)
+                    for dep in v.get('after', []):
+                        plan.add_service_dependency(dep, k)
+            except (
+                exceptions.NotSupported,
+                exceptions.ServiceDisabledException,
+            ):
+                # Cloud may include endpoint in catalog but not
+                # implement the service or disable it
+                pass
+
+        try:
+            for listing in concurrent.futures.as_completed(
+                listings, timeout=wait_timeout
+            ):
+                service, cleanup_fn = listings[listing]
+                try:
+                    listing.result()
+                except (
+                    exceptions.NotSupported,
+                    exceptions.ServiceDisabledException,
+                ):
+                    # same reason as above
+                    pass
+                except Exception:
+                    # Clean up the service as a whole instead
+                    self.log.exception(
+                        'Cannot list the resources of %s', service
+                    )
+                    plan.add_service(service, cleanup_fn)
+        except concurrent.futures.TimeoutError:
+            for listing in listings:
+                listing.cancel()
+            # Nothing is deleted from an incomplete plan
+            raise exceptions.ResourceTimeout(
+                'Timeout waiting for the resources of the cleanup to be listed'
+            )
+
+        plan.resolve(
+            filters=filters,
+            resource_evaluation_fn=resource_evaluation_fn,
+            identified_resources=cleanup_resources,
+        )
+        plan.report(status_queue)
+        plan.execute(dry_run=dry_run, timeout=wait_timeout)
+        return plan.get_steps()
+
 
 def cleanup_task(graph, service, fn):
     try:
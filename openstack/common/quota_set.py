@@ -141,7 +141,7 @@ class QuotaSet(resource.Resource):
         self._header.attributes.update(headers)
         self._header.clean()
         self._update_location()
-        dict.update(self, self.to_dict())
+        self._update_dict_mirror()
 
     def _prepare_request_body(
         self,
@@ -16,6 +16,7 @@ import queue
 from typing import Any, ClassVar, Literal, TypeVar, cast, overload
 import warnings
 
+from openstack import _cleanup
 from openstack._utils import renamed_param
 from openstack.block_storage.v3 import volume as _volume
 from openstack.compute.v2 import aggregate as _aggregate
@@ -3291,6 +3292,49 @@ class Proxy(proxy.Proxy):
             callback=callback,
         )
 
+    def wait_for_servers(
+        self,
+        servers: Iterable[_server.Server],
+        status: str | None = 'ACTIVE',
+        failures: list[str] | None = None,
+        interval: int | float | None = 2,
+        wait: int | None = 120,
+        **query: Any,
+    ) -> dict[str, _server.Server | exceptions.SDKException]:
+        """Wait for many servers to be in a particular status or deleted.
+
+        The servers are refreshed with one listing of servers per interval
+        rather than one request per server.
+
+        :param servers: The :class:`~openstack.compute.v2.server.Server`
+            instances to wait on.
+        :param status: Desired status, or ``None`` to wait for the servers to
+            be deleted.
+        :param failures: Statuses that would be interpreted as failures.
+            Defaults to ``['ERROR']``.
+        :param interval: Number of seconds to wait before to consecutive
+            checks. Default to 2.
+        :param wait: Maximum number of seconds to wait before the change.
+            Default to 120.
+        :param query: Additional query parameters of the listing of servers,
+            such as ``all_projects``, which must not filter out the servers.
+
+        :returns: A dict of the ID of each server to the updated server, or
+            to the :class:`~openstack.exceptions.ResourceFailure` or
+            :class:`~openstack.exceptions.ResourceTimeout` exception raised
+            for it.
+        """
+        return resource.wait_for_many(
+            self,
+            servers,
+            status,
+            failures,
+            interval,
+            wait,
+            base_path='/servers/detail',
+            **query,
+        )
+
     def wait_for_status(
         self,
         res: resource.ResourceT,
@@ -3382,44 +3426,76 @@ class Proxy(proxy.Proxy):
         if identified_resources is None:
             identified_resources = {}
 
-        servers = []
-        for obj in self.servers():
-            need_delete = self._service_cleanup_del_res(
-                self.delete_server,
-                obj,
-                dry_run=dry_run,
-                client_status_queue=client_status_queue,
-                identified_resources=identified_resources,
-                filters=filters,
-                resource_evaluation_fn=resource_evaluation_fn,
-            )
-            if not dry_run and need_delete:
-                # In the dry run we identified, that server will go. To propely
-                # identify consequences we need to tell others, that the port
-                # will disappear as well
-                for port in self._connection.network.ports(device_id=obj.id):
+        servers = self._service_cleanup_del_many(
+            self.delete_server,
+            self.servers(),
+            dry_run=dry_run,
+            client_status_queue=client_status_queue,
+            identified_resources=identified_resources,
+            filters=filters,
+            resource_evaluation_fn=resource_evaluation_fn,
+        )
+        # Servers are only deleted, and waited for, in a real run
+        if dry_run:
+            servers = []
+        for obj in servers:
+            # In the dry run we identified, that server will go. To propely
+            # identify consequences we need to tell others, that the port
+            # will disappear as well
+            for port in self._connection.network.ports(device_id=obj.id):
+                with self._get_cleanup_lock():
                     identified_resources[port.id] = port
-                servers.append(obj)
 
         # We actually need to wait for servers to really disappear, since they
         # might be still holding ports on the subnet
-        for server in servers:
-            self.wait_for_delete(server)
-
-        for sg_obj in self.server_groups():
+        for result in self._service_cleanup_wait_for_many(
+            servers, base_path='/servers/detail'
+        ).values():
+            if isinstance(result, exceptions.SDKException):
+                raise result
+
+        self._service_cleanup_del_many(
+            self.delete_server_group,
             # Do not delete server groups that still have members
-            if sg_obj.member_ids:
-                continue
+            (
+                sg_obj
+                for sg_obj in self.server_groups()
+                if not sg_obj.member_ids
+            ),
+            dry_run=dry_run,
+            client_status_queue=client_status_queue,
+            identified_resources=identified_resources,
+            filters=filters,
+            resource_evaluation_fn=resource_evaluation_fn,
+        )
 
-            self._service_cleanup_del_res(
-                self.delete_server_group,
+    def _plan_cleanup(
+        self,
+        plan: _cleanup.CleanupPlan,
+        skip_resources: Sequence[str] | None = None,
+    ) -> None:
+        keep = self.should_skip_resource_cleanup("server", skip_resources)
+
+        for obj in self.servers():
+            plan.add_resource(
+                self, 'server', obj, self.delete_server, wait=True, keep=keep
+            )
+
+        for sg_obj in self.server_groups():
+            key = plan.add_resource(
+                self,
+                'server_group',
                 sg_obj,
-                dry_run=dry_run,
-                client_status_queue=client_status_queue,
-                identified_resources=identified_resources,
-                filters=filters,
-                resource_evaluation_fn=resource_evaluation_fn,
+                self.delete_server_group,
+                keep=keep,
             )
+            # Server groups can only be deleted once their members are gone
+            for member_id in sg_obj.member_ids or []:
+                plan.add_dependency(
+                    plan.key('compute', 'server', member_id),
+                    key,
+                    required=True,
+                )
 
     # ========== Server Share ==========
 
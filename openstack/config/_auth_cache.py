@@ -0,0 +1,267 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Authentication state shared between processes."""
+
+import abc
+from collections.abc import Iterator
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, cast
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
+import dogpile.cache
+from dogpile.cache import api as cache_api
+from keystoneauth1 import access
+from keystoneauth1.identity import base as ks_identity_base
+from keystoneauth1 import session as ks_session
+
+from openstack import _log
+
+LOG = _log.setup_logging('openstack.config')
+
+#: The supported values of the ``cache.auth_backend`` setting.
+BACKENDS = ('keyring', 'file', 'dogpile')
+
+
+class AuthCache(abc.ABC):
+    """Storage for the authentication state of keystoneauth plugins.
+
+    States are the strings returned by
+    :meth:`~keystoneauth1.identity.base.BaseIdentityPlugin.get_auth_state`,
+    stored by the cache ID of their plugin.
+    """
+
+    @abc.abstractmethod
+    def get(self, cache_id: str) -> str | None:
+        """Return the state stored for ``cache_id``, if any."""
+
+    @abc.abstractmethod
+    def set(self, cache_id: str, state: str) -> None:
+        """Store the state of ``cache_id``."""
+
+    @contextlib.contextmanager
+    def lock(self, cache_id: str) -> Iterator[None]:
+        """Hold a lock shared with the other users of the cache.
+
+        Processes hold it while they authenticate so that, when a token needs
+        to be refreshed, only one of them requests a new one from Keystone
+        while the others wait for and reuse it.
+        """
+        yield
+
+
+class KeyringAuthCache(AuthCache):
+    """Store states in the system keyring.
+
+    :param keyring: The ``keyring`` module.
+    """
+
+    def __init__(self, keyring: Any) -> None:
+        self._keyring = keyring
+
+    def get(self, cache_id: str) -> str | None:
+        try:
+            return cast(
+                str | None,
+                self._keyring.get_password('openstacksdk', cache_id),
+            )
+        except RuntimeError:  # the fail backend raises this
+            return None
+
+    def set(self, cache_id: str, state: str) -> None:
+        try:
+            self._keyring.set_password('openstacksdk', cache_id, state)
+        except RuntimeError:  # the fail backend raises this
+            LOG.debug('Failed to set auth into keyring')
+
+
+class FileAuthCache(AuthCache):
+    """Store states in files only readable by their owner.
+
+    :param path: The directory to store the files in.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def _get_path(self, cache_id: str) -> str:
+        digest = hashlib.sha256(cache_id.encode('utf-8')).hexdigest()
+        return os.path.join(self.path, digest)
+
+    def get(self, cache_id: str) -> str | None:
+        try:
+            with open(self._get_path(cache_id)) as fh:
+                return fh.read() or None
+        except FileNotFoundError:
+            return None
+        except OSError:
+            LOG.debug('Failed to read auth from %s', self.path, exc_info=True)
+            return None
+
+    def set(self, cache_id: str, state: str) -> None:
+        try:
+            os.makedirs(self.path, mode=0o700, exist_ok=True)
+            # mkstemp creates files only readable by their owner
+            fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix='.auth-')
+            try:
+                with os.fdopen(fd, 'w') as fh:
+                    fh.write(state)
+                # Readers only ever see a complete file
+                os.replace(tmp_path, self._get_path(cache_id))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            LOG.debug('Failed to write auth to %s', self.path, exc_info=True)
+
+    @contextlib.contextmanager
+    def lock(self, cache_id: str) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        try:
+            os.makedirs(self.path, mode=0o700, exist_ok=True)
+            fd = os.open(
+                self._get_path(cache_id) + '.lock',
+                os.O_RDWR | os.O_CREAT,
+                0o600,
+            )
+        except OSError:
+            LOG.debug('Failed to lock auth in %s', self.path, exc_info=True)
+            yield
+            return
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+
+class DogpileAuthCache(AuthCache):
+    """Store states in a dogpile.cache backend.
+
+    :param cache_class: The dogpile.cache backend to use.
+    :param arguments: The arguments of the backend.
+    """
+
+    def __init__(
+        self, cache_class: str, arguments: dict[str, Any] | None
+    ) -> None:
+        self._region = dogpile.cache.make_region().configure(
+            cache_class, arguments=arguments
+        )
+
+    @staticmethod
+    def _get_key(cache_id: str) -> str:
+        return f'openstacksdk.auth.{cache_id}'
+
+    def get(self, cache_id: str) -> str | None:
+        # The region has no expiration time: tokens carry their own
+        state = self._region.get(self._get_key(cache_id))
+        if state is cache_api.NO_VALUE:
+            return None
+        return cast(str, state)
+
+    def set(self, cache_id: str, state: str) -> None:
+        self._region.set(self._get_key(cache_id), state)
+
+    @contextlib.contextmanager
+    def lock(self, cache_id: str) -> Iterator[None]:
+        # Only some backends, such as memcached with distributed_lock, have a
+        # mutex shared between processes.
+        mutex = self._region.backend.get_mutex(self._get_key(cache_id))
+        if mutex is None:
+            yield
+            return
+        mutex.acquire()
+        try:
+            yield
+        finally:
+            mutex.release()
+
+
+def is_fresh(state: str | None, refresh_time: int) -> bool:
+    """Return whether a state holds a token valid for ``refresh_time``.
+
+    :param state: A state returned by ``get_auth_state``.
+    :param refresh_time: How long, in seconds, the token must still be valid.
+    """
+    if not state:
+        return False
+    try:
+        data = json.loads(state)
+        auth_ref = access.create(
+            body=data['body'], auth_token=data['auth_token']
+        )
+        return not auth_ref.will_expire_soon(refresh_time)
+    except (ValueError, KeyError, TypeError):
+        return False
+
+
+def share(
+    auth: ks_identity_base.BaseIdentityPlugin,
+    cache: AuthCache,
+    refresh_time: int,
+) -> None:
+    """Share the tokens of ``auth`` with other processes through ``cache``.
+
+    Whenever the plugin needs a token, because it has none yet or because
+    its token expires within ``refresh_time`` seconds, it uses the token
+    stored in the cache if it is still valid for ``refresh_time``. Otherwise
+    it authenticates, holding the lock of the cache so that other processes
+    wait for the new token rather than requesting their own, and stores the
+    new token.
+
+    :param auth: The plugin to share tokens of.
+    :param cache: The cache to share tokens through.
+    :param refresh_time: How long, in seconds, before their expiration tokens
+        are refreshed.
+    """
+    cache_id = auth.get_cache_id()
+    # skip if the plugin does not support caching
+    if not cache_id:
+        return
+
+    get_auth_ref = auth.get_auth_ref
+
+    def get_shared_auth_ref(
+        session: ks_session.Session, **kwargs: Any
+    ) -> access.AccessInfo:
+        with cache.lock(cache_id):
+            state = cache.get(cache_id)
+            if is_fresh(state, refresh_time):
+                LOG.debug('Reusing authentication from auth cache')
+                auth.set_auth_state(state)
+                assert auth.auth_ref is not None  # narrow type
+                return auth.auth_ref
+
+            auth_ref = get_auth_ref(session, **kwargs)
+            auth.auth_ref = auth_ref
+            new_state = auth.get_auth_state()
+            if new_state:
+                cache.set(cache_id, new_state)
+            return auth_ref
+
+    # keystoneauth calls get_auth_ref, holding the lock of the plugin, when
+    # its token is missing or valid for less than MIN_TOKEN_LIFE_SECONDS.
+    auth.get_auth_ref = get_shared_auth_ref  # type: ignore[method-assign]
+    auth.MIN_TOKEN_LIFE_SECONDS = max(
+        refresh_time, auth.MIN_TOKEN_LIFE_SECONDS
+    )
@@ -0,0 +1,113 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Loading of YAML configuration files, compiled to JSON across processes."""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, TextIO
+
+import yaml
+
+from openstack import _log
+
+if hasattr(yaml, 'CSafeLoader'):
+    yaml_loader = yaml.CSafeLoader
+else:
+    yaml_loader = yaml.SafeLoader  # type: ignore
+
+LOG = _log.setup_logging('openstack.config')
+
+
+def load_yaml(stream: TextIO) -> Any:
+    """Parse a YAML document, with libyaml when it is available."""
+    return yaml.load(stream, Loader=yaml_loader)  # noqa: S506
+
+
+def _get_compiled_path(cache_path: str, path: str) -> str:
+    digest = hashlib.sha256(os.path.abspath(path).encode('utf-8'))
+    return os.path.join(cache_path, f'{digest.hexdigest()}.json')
+
+
+def load(stream: TextIO, cache_path: str | None = None) -> Any:
+    """Parse a YAML configuration file, reusing its compiled form if any.
+
+    The first process to parse a file stores its content as JSON in
+    ``cache_path``, along with the modification time, size and inode of the
+    file. Other processes load that JSON, which is much faster than parsing
+    the YAML again, for as long as the file is unchanged.
+
+    :param stream: The opened configuration file.
+    :param cache_path: The directory to store compiled files in. Files are
+        always parsed if it is not set.
+    :returns: The content of the configuration file.
+    """
+    if not cache_path:
+        return load_yaml(stream)
+
+    stat = os.fstat(stream.fileno())
+    stamp = [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+    compiled_path = _get_compiled_path(cache_path, stream.name)
+    try:
+        with open(compiled_path) as fh:
+            compiled = json.load(fh)
+        if (
+            compiled['path'] == os.path.abspath(stream.name)
+            and compiled['stamp'] == stamp
+        ):
+            return compiled['data']
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError, TypeError):
+        LOG.debug(
+            'Ignoring compiled config file %s', compiled_path, exc_info=True
+        )
+
+    data = load_yaml(stream)
+    try:
+        text = json.dumps(
+            {
+                'path': os.path.abspath(stream.name),
+                'stamp': stamp,
+                'data': data,
+            }
+        )
+    except (TypeError, ValueError):
+        # For example, YAML timestamps have no JSON equivalent
+        LOG.debug('Cannot compile config file %s', stream.name, exc_info=True)
+        return data
+    if json.loads(text)['data'] != data:
+        # For example, YAML allows keys that are not strings
+        LOG.debug('Cannot compile config file %s', stream.name)
+        return data
+
+    try:
+        os.makedirs(cache_path, mode=0o700, exist_ok=True)
+        # Configuration files can hold secrets: mkstemp creates files only
+        # readable by their owner.
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path, prefix='.compiled-')
+        try:
+            with os.fdopen(fd, 'w') as fh:
+                fh.write(text)
+            os.replace(tmp_path, compiled_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        LOG.debug(
+            'Failed to store compiled config file %s',
+            compiled_path,
+            exc_info=True,
+        )
+    return data
@@ -0,0 +1,133 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Version discovery results shared between processes through a file."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any
+
+from keystoneauth1 import discover
+
+from openstack import _log
+
+LOG = _log.setup_logging('openstack.config')
+
+
+def get_path(cache_path: str, auth_url: str | None) -> str:
+    """Return the file caching the discovery results of a cloud.
+
+    :param cache_path: The ``cache.path`` directory.
+    :param auth_url: The auth URL of the cloud, if any.
+    """
+    digest = hashlib.sha256((auth_url or '').encode('utf-8')).hexdigest()
+    return os.path.join(cache_path, 'discovery', f'{digest}.json')
+
+
+class _CachedDiscover(discover.Discover):
+    """A discovery result read back from the file, without a request."""
+
+    def __init__(self, url: str, data: list[dict[str, Any]]) -> None:
+        # These are all the attributes set by Discover.__init__, which would
+        # fetch the version data instead.
+        self._url = url
+        self._data = data
+
+
+class DiscoveryCache(dict[str, discover.Discover]):
+    """A keystoneauth discovery cache persisted to a file.
+
+    keystoneauth keeps the version discovery result of every URL it
+    discovers in the discovery cache of its session. This cache starts with
+    the results found in ``path`` that are younger than ``expiration_time``
+    seconds, and adds the results of new discoveries to it, so that other
+    processes using the same cloud do not need to discover them again.
+
+    :param path: The file to read and write the discovery results from.
+    :param expiration_time: How long, in seconds, discovery results are
+        used for. ``-1`` means forever.
+    """
+
+    def __init__(self, path: str, expiration_time: float) -> None:
+        super().__init__()
+        self.path = path
+        self.expiration_time = expiration_time
+        self._lock = threading.Lock()
+        for url, entry in self._load().items():
+            super().__setitem__(url, _CachedDiscover(url, entry['data']))
+
+    def __setitem__(self, url: str, disc: discover.Discover) -> None:
+        # keystoneauth stores results in every cache it looked in, including
+        # the one it found them in, so only write results that are new.
+        is_new = self.get(url) is not disc
+        super().__setitem__(url, disc)
+        if is_new:
+            self._store(url, disc)
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.path) as fh:
+                entries = json.load(fh)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            LOG.debug(
+                'Failed to read discovery cache %s', self.path, exc_info=True
+            )
+            return {}
+
+        if not isinstance(entries, dict):
+            return {}
+        now = time.time()
+        return {
+            url: entry
+            for url, entry in entries.items()
+            if isinstance(entry, dict)
+            and isinstance(entry.get('data'), list)
+            and (
+                self.expiration_time < 0
+                or now - entry.get('time', 0) < self.expiration_time
+            )
+        }
+
+    def _store(self, url: str, disc: discover.Discover) -> None:
+        data = disc.raw_version_data(
+            allow_experimental=True, allow_deprecated=True, allow_unknown=True
+        )
+        directory = os.path.dirname(self.path)
+        with self._lock:
+            # Merge with what other processes stored in the meantime
+            entries = self._load()
+            entries[url] = {'time': time.time(), 'data': data}
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=directory, prefix='.discovery-'
+                )
+                try:
+                    with os.fdopen(fd, 'w') as fh:
+                        json.dump(entries, fh)
+                    # Readers only ever see a complete file
+                    os.replace(tmp_path, self.path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+            except (OSError, TypeError, ValueError):
+                LOG.debug(
+                    'Failed to write discovery cache %s',
+                    self.path,
+                    exc_info=True,
+                )
@@ -59,10 +59,14 @@ except ImportError:
     influxdb_client = None
 
 from openstack import _log
+from openstack import _metrics
+from openstack.config import _auth_cache
+from openstack.config import _discovery_cache
 from openstack.config import _util
 from openstack.config import defaults as config_defaults
 from openstack import exceptions
 from openstack import proxy
+from openstack import utils
 from openstack import warnings as os_warnings
 
 if TYPE_CHECKING:
@@ -307,13 +311,19 @@ class CloudRegion:
     :param cache_path:
     :param cache_class:
     :param cache_arguments:
+    :param cache_max_keys:
+    :param cache_revalidate:
+    :param cache_discovery_expiration_time:
     :param password_callback:
     :param statsd_host:
     :param statsd_port:
     :param statsd_prefix:
     :param influxdb_config:
+    :param metrics_pipeline_config:
     :param collector_registry:
     :param cache_auth:
+    :param cache_auth_backend:
+    :param cache_auth_refresh_time:
     """
 
     def __init__(
@@ -335,16 +345,22 @@ class CloudRegion:
         cache_path: str | None = None,
         cache_class: str = 'dogpile.cache.null',
         cache_arguments: dict[str, Any] | None = None,
+        cache_max_keys: int | None = None,
+        cache_revalidate: bool = False,
+        cache_discovery_expiration_time: int = 0,
         password_callback: _PasswordCallback | None = None,
         statsd_host: str | None = None,
         statsd_port: str | None = None,
         statsd_prefix: str | None = None,
         # TODO(stephenfin): Add better types
         influxdb_config: dict[str, Any] | None = None,
+        metrics_pipeline_config: dict[str, Any] | None = None,
         collector_registry: Optional[
             'prometheus_client.CollectorRegistry'
         ] = None,
         cache_auth: bool = False,
+        cache_auth_backend: str = 'keyring',
+        cache_auth_refresh_time: int = 300,
     ) -> None:
         self._name = name
         self.config = _util.normalize_keys(config or {})
@@ -358,7 +374,10 @@ class CloudRegion:
         self._force_ipv4 = force_ipv4
         self._auth = auth_plugin
         self._cache_auth = cache_auth
-        self.load_auth_from_cache()
+        self._cache_auth_backend = cache_auth_backend
+        self._cache_auth_refresh_time = cache_auth_refresh_time
+        self._auth_cache: _auth_cache.AuthCache | None = None
+        self._polling_strategy: utils.PollingStrategy | None = None
         self._openstack_config = openstack_config
         self._keystone_session = session
         self._session_constructor = session_constructor or ks_session.Session
@@ -370,6 +389,10 @@ class CloudRegion:
         self._cache_path = cache_path
         self._cache_class = cache_class
         self._cache_arguments = cache_arguments
+        self._cache_max_keys = cache_max_keys
+        self._cache_revalidate = cache_revalidate
+        self._cache_discovery_expiration_time = cache_discovery_expiration_time
+        self.load_auth_from_cache()
         self._password_callback = password_callback
         self._statsd_host = statsd_host
         self._statsd_port = statsd_port
@@ -392,6 +415,12 @@ class CloudRegion:
                 os_warnings.RemovedInSDK60Warning,
             )
 
+        self._metrics_pipeline = (
+            _metrics.MetricsPipeline(**metrics_pipeline_config)
+            if metrics_pipeline_config is not None
+            else None
+        )
+
         self._collector_registry = collector_registry
 
         self._service_type_manager = os_service_types.ServiceTypes()
@@ -790,6 +819,13 @@ class CloudRegion:
         )
         return int(value) if value is not None else value
 
+    def get_cleanup_concurrency(self, service_type: str) -> int:
+        """Return how many resources project cleanup deletes at once."""
+        value = self._get_config(
+            'cleanup_concurrency', service_type, fallback_to_unprefixed=True
+        )
+        return max(int(value), 1) if value is not None else 1
+
     @property
     def prefer_ipv6(self) -> bool:
         return not self._force_ipv4
@@ -803,7 +839,23 @@ class CloudRegion:
         return self._auth
 
     def skip_auth_cache(self) -> bool:
-        return not keyring or not self._auth or not self._cache_auth
+        if not self._auth or not self._cache_auth:
+            return True
+        return self._cache_auth_backend == 'keyring' and not keyring
+
+    def _get_auth_cache(self) -> _auth_cache.AuthCache:
+        if self._auth_cache is None:
+            if self._cache_auth_backend == 'file':
+                self._auth_cache = _auth_cache.FileAuthCache(
+                    os.path.join(self._cache_path or '', 'auth')
+                )
+            elif self._cache_auth_backend == 'dogpile':
+                self._auth_cache = _auth_cache.DogpileAuthCache(
+                    self._cache_class, self._cache_arguments
+                )
+            else:
+                self._auth_cache = _auth_cache.KeyringAuthCache(keyring)
+        return self._auth_cache
 
     def load_auth_from_cache(self) -> None:
         if self.skip_auth_cache():
@@ -817,16 +869,25 @@ class CloudRegion:
         if not cache_id:
             return
 
-        try:
-            state = keyring.get_password('openstacksdk', cache_id)
-        except RuntimeError:  # the fail backend raises this
-            state = None
+        if isinstance(self._auth, ks_identity_base.BaseIdentityPlugin):
+            # Use tokens other processes got when this one needs a new one
+            _auth_cache.share(
+                self._auth,
+                self._get_auth_cache(),
+                self._cache_auth_refresh_time,
+            )
+
+        state = self._get_auth_cache().get(cache_id)
 
         if not state:
-            self.log.debug('Failed to fetch auth from keyring')
+            self.log.debug(
+                'Failed to fetch auth from %s', self._cache_auth_backend
+            )
             return
 
-        self.log.debug('Reusing authentication from keyring')
+        self.log.debug(
+            'Reusing authentication from %s', self._cache_auth_backend
+        )
         self._auth.set_auth_state(state)
 
     def set_auth_cache(self) -> None:
@@ -840,14 +901,11 @@ class CloudRegion:
         # object
         state = cast(str, self._auth.get_auth_state())
 
-        try:
-            if cache_id and state:
-                # NOTE: under some conditions the method may be invoked when
-                # auth is empty. This may lead to exception in the keyring lib,
-                # thus do nothing.
-                keyring.set_password('openstacksdk', cache_id, state)
-        except RuntimeError:  # the fail backend raises this
-            self.log.debug('Failed to set auth into keyring')
+        if cache_id and state:
+            # NOTE: under some conditions the method may be invoked when
+            # auth is empty. This may lead to exception in the keyring lib,
+            # thus do nothing.
+            self._get_auth_cache().set(cache_id, state)
 
     def insert_user_agent(self) -> None:
         """Set sdk information into the user agent of the Session.
@@ -896,6 +954,9 @@ class CloudRegion:
                 category=urllib3.exceptions.InsecureRequestWarning,
             )
 
+        if self._discovery_cache is None:
+            self._discovery_cache = self._get_persistent_discovery_cache()
+
         self._keystone_session = self._session_constructor(
             auth=self._auth,
             verify=verify,
@@ -916,6 +977,17 @@ class CloudRegion:
 
         return self._keystone_session
 
+    def _get_persistent_discovery_cache(
+        self,
+    ) -> _discovery_cache.DiscoveryCache | None:
+        expiration_time = self.get_cache_discovery_expiration_time()
+        if not expiration_time or not self._cache_path:
+            return None
+        path = _discovery_cache.get_path(
+            self._cache_path, self.config.get('auth', {}).get('auth_url')
+        )
+        return _discovery_cache.DiscoveryCache(path, expiration_time)
+
     def get_service_catalog(
         self,
     ) -> ks_service_catalog.ServiceCatalog | None:
@@ -1254,6 +1326,21 @@ class CloudRegion:
     def get_cache_expirations(self) -> dict[str, int]:
         return copy.deepcopy(self._cache_expirations)
 
+    def get_cache_max_keys(self) -> int | None:
+        return self._cache_max_keys
+
+    def get_cache_revalidate(self) -> bool:
+        return self._cache_revalidate
+
+    def get_cache_discovery_expiration_time(self) -> int:
+        return int(self._cache_discovery_expiration_time)
+
+    def get_cache_auth_backend(self) -> str:
+        return self._cache_auth_backend
+
+    def get_cache_auth_refresh_time(self) -> int:
+        return int(self._cache_auth_refresh_time)
+
     def get_cache_resource_expiration(
         self, resource: str, default: float | None = None
     ) -> float | None:
@@ -1409,9 +1496,37 @@ class CloudRegion:
             'concurrency', service_type=service_type
         )
 
+    def get_json_backend(self) -> str | None:
+        return self.config.get('json_backend')
+
+    def get_polling_strategy(self) -> utils.PollingStrategy | None:
+        """Return the polling strategy of waiters, if one is configured."""
+        name = self.config.get('polling_strategy')
+        if not name and self.config.get('polling_initial_delays'):
+            name = 'fixed'
+        if not name:
+            return None
+        if self._polling_strategy is None:
+            try:
+                strategy_class = utils.POLLING_STRATEGIES[name]
+            except KeyError:
+                raise exceptions.ConfigException(
+                    f'Invalid polling_strategy {name!r}, valid strategies '
+                    f'are: {", ".join(utils.POLLING_STRATEGIES)}'
+                )
+            kwargs: dict[str, Any] = {
+                'initial_delays': self.config.get('polling_initial_delays'),
+            }
+            if strategy_class is not utils.PollingStrategy:
+                max_interval = self.config.get('polling_max_interval')
+                if max_interval is not None:
+                    kwargs['max_interval'] = float(max_interval)
+            self._polling_strategy = strategy_class(**kwargs)
+        return self._polling_strategy
+
     def get_statsd_client(
         self,
-    ) -> Optional['statsd_client.StatsClientBase']:
+    ) -> Optional['statsd_client.StatsClientBase | _metrics.StatsClient']:
         if not statsd_client:
             if self._statsd_host:
                 self.log.warning(
@@ -1426,13 +1541,24 @@ class CloudRegion:
             statsd_args['port'] = self._statsd_port
         if statsd_args:
             try:
-                return statsd_client.StatsClient(**statsd_args)
+                client = statsd_client.StatsClient(**statsd_args)
             except Exception:
                 self.log.warning('Cannot establish connection to statsd')
                 return None
+            if self._metrics_pipeline is not None:
+                return _metrics.StatsClient(client, self._metrics_pipeline)
+            return client
         else:
             return None
 
+    def get_metrics_pipeline(self) -> _metrics.MetricsPipeline | None:
+        return self._metrics_pipeline
+
+    def close_metrics(self) -> None:
+        """Emit pending metrics and stop the background metrics thread."""
+        if self._metrics_pipeline is not None:
+            self._metrics_pipeline.close()
+
     def get_statsd_prefix(self) -> str:
         return self._statsd_prefix or 'openstack.api'
 
@@ -1514,7 +1640,7 @@ class CloudRegion:
 
     def get_influxdb_client(
         self,
-    ) -> Optional['influxdb_client.InfluxDBClient']:
+    ) -> Optional['influxdb_client.InfluxDBClient | _metrics.InfluxDBClient']:
         influx_args: dict[str, Any] = {}
         if not self._influxdb_config:
             return None
@@ -1541,9 +1667,15 @@ class CloudRegion:
                 influx_args[key] = self._influxdb_config[key]
         if influxdb_client and influx_args:
             try:
-                return influxdb_client.InfluxDBClient(**influx_args)
+                client = influxdb_client.InfluxDBClient(**influx_args)
             except Exception:
                 self.log.warning('Cannot establish connection to InfluxDB')
+            else:
+                if self._metrics_pipeline is not None:
+                    return _metrics.InfluxDBClient(
+                        client, self._metrics_pipeline
+                    )
+                return client
         else:
             self.log.warning(
                 'InfluxDB configuration is present, '
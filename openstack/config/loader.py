@@ -31,6 +31,8 @@ import platformdirs
 import yaml
 
 from openstack import _log
+from openstack.config import _auth_cache
+from openstack.config import _compiled
 from openstack.config import _util
 from openstack.config import cloud_region
 from openstack.config import defaults
@@ -106,6 +108,19 @@ def get_boolean(value: Any) -> bool:
     return False
 
 
+def _get_metrics_pipeline_config(
+    metrics_config: dict[str, Any],
+) -> dict[str, Any] | None:
+    """Get the background metrics pipeline settings of a metrics section."""
+    if not get_boolean(metrics_config.get('async')):
+        return None
+    return {
+        key: metrics_config[key]
+        for key in ('queue_size', 'batch_size', 'flush_interval')
+        if key in metrics_config
+    }
+
+
 def _auth_update(
     old_dict: dict[str, Any], new_dict_source: dict[str, Any]
 ) -> dict[str, Any]:
@@ -186,6 +201,7 @@ class OpenStackConfig:
         statsd_port: str | None = None,
         statsd_prefix: str | None = None,
         influxdb_config: dict[str, Any] | None = None,
+        config_cache_path: str | None = None,
     ):
         self.log = _log.setup_logging('openstack.config')
         self._session_constructor = session_constructor
@@ -223,6 +239,16 @@ class OpenStackConfig:
         if secure_file_override:
             self._secure_files.insert(0, secure_file_override)
 
+        # Directory to store the parsed YAML files in, for other processes
+        config_cache_path = config_cache_path or self._get_envvar(
+            'OS_CLIENT_CONFIG_CACHE'
+        )
+        self._config_cache_path = (
+            os.path.expanduser(config_cache_path)
+            if config_cache_path
+            else None
+        )
+
         self.defaults = self._defaults_module.get_defaults()
         if override_defaults:
             self.defaults.update(override_defaults)
@@ -323,18 +349,38 @@ class OpenStackConfig:
             self.default_cloud = 'defaults'
 
         self._cache_auth = False
+        self._cache_auth_backend = 'keyring'
+        self._cache_auth_refresh_time = 300
         self._cache_expiration_time = 0
         self._cache_path = CACHE_PATH
         self._cache_class = 'dogpile.cache.null'
         self._cache_arguments: dict[str, Any] = {}
         self._cache_expirations: dict[str, int] = {}
+        self._cache_max_keys: int | None = None
+        self._cache_revalidate = False
+        self._cache_discovery_expiration_time = 0
         self._influxdb_config = {}
+        self._metrics_pipeline_config: dict[str, Any] | None = None
         if 'cache' in self.cloud_config:
             cache_settings = _util.normalize_keys(self.cloud_config['cache'])
 
             self._cache_auth = get_boolean(
                 cache_settings.get('auth', self._cache_auth)
             )
+            self._cache_auth_backend = cache_settings.get(
+                'auth_backend', self._cache_auth_backend
+            )
+            if self._cache_auth_backend not in _auth_cache.BACKENDS:
+                raise exceptions.ConfigException(
+                    f'Invalid cache.auth_backend '
+                    f'{self._cache_auth_backend!r}, valid backends are: '
+                    f'{", ".join(_auth_cache.BACKENDS)}'
+                )
+            self._cache_auth_refresh_time = int(
+                cache_settings.get(
+                    'auth_refresh_time', self._cache_auth_refresh_time
+                )
+            )
 
             # expiration_time used to be 'max_age' but the dogpile setting
             # is expiration_time. Support max_age for backwards compat.
@@ -360,6 +406,16 @@ class OpenStackConfig:
             self._cache_expirations = cache_settings.get(
                 'expiration', self._cache_expirations
             )
+            self._cache_max_keys = cache_settings.get(
+                'max_keys', self._cache_max_keys
+            )
+            self._cache_revalidate = get_boolean(
+                cache_settings.get('revalidate', self._cache_revalidate)
+            )
+            self._cache_discovery_expiration_time = cache_settings.get(
+                'discovery_expiration_time',
+                self._cache_discovery_expiration_time,
+            )
 
         if load_yaml_config:
             metrics_config = self.cloud_config.get('metrics', {})
@@ -367,6 +423,9 @@ class OpenStackConfig:
             statsd_host = statsd_host or statsd_config.get('host')
             statsd_port = statsd_port or statsd_config.get('port')
             statsd_prefix = statsd_prefix or statsd_config.get('prefix')
+            self._metrics_pipeline_config = _get_metrics_pipeline_config(
+                metrics_config
+            )
 
             influxdb_cfg = metrics_config.get('influxdb', {})
             # Parse InfluxDB configuration
@@ -453,6 +512,7 @@ class OpenStackConfig:
             'OS_REGION_NAME',
             'OS_CLIENT_CONFIG_FILE',
             'OS_CLIENT_SECURE_FILE',
+            'OS_CLIENT_CONFIG_CACHE',
             'OS_CLOUD_NAME',
         }
         if set(environkeys) - selectors:
@@ -506,7 +566,9 @@ class OpenStackConfig:
                         if path.endswith('json'):
                             return path, json.load(f)
                         else:
-                            return path, yaml.safe_load(f)
+                            return path, _compiled.load(
+                                f, self._config_cache_path
+                            )
                 except OSError as e:
                     if e.errno == errno.EACCES:
                         # Can't access file so let's continue to the next
@@ -1399,6 +1461,12 @@ class OpenStackConfig:
         statsd_host = statsd_config.get('host') or self._statsd_host
         statsd_port = statsd_config.get('port') or self._statsd_port
         statsd_prefix = statsd_config.get('prefix') or self._statsd_prefix
+        if 'async' in metrics_config:
+            metrics_pipeline_config = _get_metrics_pipeline_config(
+                metrics_config
+            )
+        else:
+            metrics_pipeline_config = self._metrics_pipeline_config
         influxdb_config = metrics_config.get('influxdb', {})
         if influxdb_config:
             merged_influxdb = copy.deepcopy(self._influxdb_config)
@@ -1423,8 +1491,15 @@ class OpenStackConfig:
             app_name=self._app_name,
             app_version=self._app_version,
             cache_auth=self._cache_auth,
+            cache_auth_backend=self._cache_auth_backend,
+            cache_auth_refresh_time=self._cache_auth_refresh_time,
             cache_expiration_time=self._cache_expiration_time,
             cache_expirations=self._cache_expirations,
+            cache_max_keys=self._cache_max_keys,
+            cache_revalidate=self._cache_revalidate,
+            cache_discovery_expiration_time=(
+                self._cache_discovery_expiration_time
+            ),
             cache_path=self._cache_path,
             cache_class=self._cache_class,
             cache_arguments=self._cache_arguments,
@@ -1433,6 +1508,7 @@ class OpenStackConfig:
             statsd_port=statsd_port,
             statsd_prefix=statsd_prefix,
             influxdb_config=influxdb_config,
+            metrics_pipeline_config=metrics_pipeline_config,
         )
 
     def get_one_cloud(
@@ -1546,8 +1622,15 @@ class OpenStackConfig:
             auth_plugin=auth_plugin,
             openstack_config=self,
             cache_auth=self._cache_auth,
+            cache_auth_backend=self._cache_auth_backend,
+            cache_auth_refresh_time=self._cache_auth_refresh_time,
             cache_expiration_time=self._cache_expiration_time,
             cache_expirations=self._cache_expirations,
+            cache_max_keys=self._cache_max_keys,
+            cache_revalidate=self._cache_revalidate,
+            cache_discovery_expiration_time=(
+                self._cache_discovery_expiration_time
+            ),
             cache_path=self._cache_path,
             cache_class=self._cache_class,
             cache_arguments=self._cache_arguments,
@@ -19,8 +19,8 @@ from typing import Any
 import urllib
 
 import requests
-import yaml
 
+from openstack.config import _compiled
 from openstack.config import _util
 from openstack import exceptions
 
@@ -35,7 +35,7 @@ def _get_vendor_defaults() -> dict[str, dict[str, Any]]:
     if not _VENDOR_DEFAULTS:
         for vendor in glob.glob(os.path.join(_VENDORS_PATH, '*.yaml')):
             with open(vendor) as f:
-                vendor_data = yaml.safe_load(f)
+                vendor_data = _compiled.load_yaml(f)
                 _VENDOR_DEFAULTS[vendor_data['name']] = vendor_data['profile']
 
         for vendor in glob.glob(os.path.join(_VENDORS_PATH, '*.json')):
@@ -279,6 +279,7 @@ import argparse
 import concurrent.futures
 import copy
 import importlib.metadata as importlib_metadata
+import time
 from typing import Any, Optional, Self, TYPE_CHECKING, cast
 
 import keystoneauth1.exceptions
@@ -581,6 +582,81 @@ class Connection(
         except keystoneauth1.exceptions.ClientException as e:
             raise exceptions.SDKException(str(e))
 
+    def warmup(
+        self, service_types: list[str] | None = None
+    ) -> dict[str, float]:
+        """Create the proxies of several services concurrently.
+
+        Proxies are otherwise created the first time each service is used,
+        one after the other, and creating one discovers the versions of its
+        service. Programs that use many services can call this method first
+        so that these discoveries happen in parallel, on the connection's
+        thread pool.
+
+        .. code-block:: python
+
+            conn = openstack.connect(cloud='example')
+            conn.warmup(['compute', 'network', 'block-storage'])
+
+        :param service_types: The service types, or aliases, of the services
+            to create proxies for. Defaults to every service of the service
+            catalog supported by openstacksdk.
+        :returns: A dict of the time, in seconds, taken to create the proxy
+            of each service, by service type. Services whose proxy could not
+            be created are logged and left out, and will fail again when
+            used.
+        :raises: ValueError if a service type is not known to the Connection.
+        """
+        attr_names: dict[str, str] = {}
+        if service_types is None:
+            catalog = self.config.get_service_catalog()
+            service_types = list(catalog.get_endpoints()) if catalog else []
+            ignore_unknown = True
+        else:
+            ignore_unknown = False
+
+        for service_type in service_types:
+            attr_name = service_type.replace('-', '_')
+            descriptor = getattr(type(self), attr_name, None)
+            if isinstance(descriptor, service_description.ServiceDescription):
+                # Aliases share the descriptor of their service
+                attr_names.setdefault(descriptor.service_type, attr_name)
+            elif isinstance(descriptor, property):
+                # Services added with add_service
+                attr_names.setdefault(service_type, attr_name)
+            elif not ignore_unknown:
+                raise ValueError(f'Unknown service type {service_type}')
+
+        # Authenticate once rather than in every thread
+        self.session.get_auth_headers()
+
+        def create_proxy(attr_name: str) -> float:
+            start = time.monotonic()
+            getattr(self, attr_name)
+            return time.monotonic() - start
+
+        futures = {
+            service_type: self._pool_executor.submit(create_proxy, attr_name)
+            for service_type, attr_name in attr_names.items()
+        }
+        latencies = {}
+        for service_type, future in futures.items():
+            try:
+                latencies[service_type] = future.result()
+            except Exception:
+                self.log.warning(
+                    'Failed to create the proxy of the %s service',
+                    service_type,
+                    exc_info=True,
+                )
+                continue
+            self.log.debug(
+                'Created the proxy of the %s service in %.3f seconds',
+                service_type,
+                latencies[service_type],
+            )
+        return latencies
+
     def connect_as(self, **kwargs: Any) -> Self:
         """Make a new Connection object with new auth context.
 
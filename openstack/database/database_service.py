@@ -10,13 +10,19 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from openstack.database.v1 import _proxy
+from typing import TYPE_CHECKING
+
 from openstack import service_description
 
+if TYPE_CHECKING:
+    from openstack.database.v1 import _proxy  # noqa: F401
+
 
-class DatabaseService(service_description.ServiceDescription[_proxy.Proxy]):
+class DatabaseService(service_description.ServiceDescription['_proxy.Proxy']):
     """The database service."""
 
-    supported_versions = {
-        '1': _proxy.Proxy,
-    }
+    supported_versions = service_description.ProxyVersions(
+        {
+            '1': 'openstack.database.v1._proxy.Proxy',
+        }
+    )
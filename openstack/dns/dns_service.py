@@ -10,13 +10,19 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from openstack.dns.v2 import _proxy
+from typing import TYPE_CHECKING
+
 from openstack import service_description
 
+if TYPE_CHECKING:
+    from openstack.dns.v2 import _proxy  # noqa: F401
+
 
-class DnsService(service_description.ServiceDescription[_proxy.Proxy]):
+class DnsService(service_description.ServiceDescription['_proxy.Proxy']):
     """The DNS service."""
 
-    supported_versions = {
-        '2': _proxy.Proxy,
-    }
+    supported_versions = service_description.ProxyVersions(
+        {
+            '2': 'openstack.dns.v2._proxy.Proxy',
+        }
+    )
@@ -1277,29 +1277,27 @@ class Proxy(proxy.Proxy):
     ) -> None:
         if not self.should_skip_resource_cleanup("zone", skip_resources):
             # Delete all zones
-            for obj in self.zones():
-                self._service_cleanup_del_res(
-                    self.delete_zone,
-                    obj,
-                    dry_run=dry_run,
-                    client_status_queue=client_status_queue,
-                    identified_resources=identified_resources,
-                    filters=filters,
-                    resource_evaluation_fn=resource_evaluation_fn,
-                )
+            self._service_cleanup_del_many(
+                self.delete_zone,
+                self.zones(),
+                dry_run=dry_run,
+                client_status_queue=client_status_queue,
+                identified_resources=identified_resources,
+                filters=filters,
+                resource_evaluation_fn=resource_evaluation_fn,
+            )
 
         if not self.should_skip_resource_cleanup(
             "floating_ip", skip_resources
         ):
             # Unset all floatingIPs
             # NOTE: FloatingIPs are not cleaned when filters are set
-            for fip_obj in self.floating_ips():
-                self._service_cleanup_del_res(
-                    self.unset_floating_ip,
-                    fip_obj,
-                    dry_run=dry_run,
-                    client_status_queue=client_status_queue,
-                    identified_resources=identified_resources,
-                    filters=filters,
-                    resource_evaluation_fn=resource_evaluation_fn,
-                )
+            self._service_cleanup_del_many(
+                self.unset_floating_ip,
+                self.floating_ips(),
+                dry_run=dry_run,
+                client_status_queue=client_status_queue,
+                identified_resources=identified_resources,
+                filters=filters,
+                resource_evaluation_fn=resource_evaluation_fn,
+            )
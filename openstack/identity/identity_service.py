@@ -10,17 +10,23 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from openstack.identity.v2 import _proxy as _proxy_v2
-from openstack.identity.v3 import _proxy as _proxy_v3
+from typing import TYPE_CHECKING
+
 from openstack import service_description
 
+if TYPE_CHECKING:
+    from openstack.identity.v2 import _proxy as _proxy_v2  # noqa: F401
+    from openstack.identity.v3 import _proxy as _proxy_v3  # noqa: F401
+
 
 class IdentityService(
-    service_description.ServiceDescription[_proxy_v2.Proxy | _proxy_v3.Proxy]
+    service_description.ServiceDescription['_proxy_v2.Proxy | _proxy_v3.Proxy']
 ):
     """The identity service."""
 
-    supported_versions = {
-        '2': _proxy_v2.Proxy,
-        '3': _proxy_v3.Proxy,
-    }
+    supported_versions = service_description.ProxyVersions(
+        {
+            '2': 'openstack.identity.v2._proxy.Proxy',
+            '3': 'openstack.identity.v3._proxy.Proxy',
+        }
+    )
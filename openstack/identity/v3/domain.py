@@ -35,6 +35,7 @@ class Domain(resource.Resource, tag.TagMixin):
     allow_commit = True
     allow_delete = True
     allow_list = True
+    _cache_listed_resources = True
     commit_method = 'PATCH'
 
     _query_mapping = resource.QueryParameters(
@@ -36,6 +36,7 @@ class Project(resource.Resource, tag.TagMixin):
     allow_commit = True
     allow_delete = True
     allow_list = True
+    _cache_listed_resources = True
     commit_method = 'PATCH'
 
     _allow_unknown_attrs_in_body = True
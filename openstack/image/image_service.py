@@ -10,17 +10,23 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from openstack.image.v1 import _proxy as _proxy_v1
-from openstack.image.v2 import _proxy as _proxy_v2
+from typing import TYPE_CHECKING
+
 from openstack import service_description
 
+if TYPE_CHECKING:
+    from openstack.image.v1 import _proxy as _proxy_v1  # noqa: F401
+    from openstack.image.v2 import _proxy as _proxy_v2  # noqa: F401
+
 
 class ImageService(
-    service_description.ServiceDescription[_proxy_v1.Proxy | _proxy_v2.Proxy]
+    service_description.ServiceDescription['_proxy_v1.Proxy | _proxy_v2.Proxy']
 ):
     """The image service."""
 
-    supported_versions = {
-        '1': _proxy_v1.Proxy,
-        '2': _proxy_v2.Proxy,
-    }
+    supported_versions = service_description.ProxyVersions(
+        {
+            '1': 'openstack.image.v1._proxy.Proxy',
+            '2': 'openstack.image.v2._proxy.Proxy',
+        }
+    )
@@ -10,7 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
 import io
 import os
 import queue
@@ -1013,14 +1013,24 @@ class Proxy(proxy.Proxy):
         """
         return self._get(_image.Image, image)
 
-    def images(self, **query: Any) -> Generator[_image.Image, None, None]:
+    def images(
+        self,
+        partitions: Iterable[dict[str, Any]] | None = None,
+        **query: Any,
+    ) -> Generator[_image.Image, None, None]:
         """Return a generator of images
 
+        :param partitions: Optional query parameters, such as ``visibility``
+            or ``owner``, splitting the listing into partitions listed
+            concurrently. Images are yielded in the order of the partitions.
+            See :meth:`~openstack.resource.Resource.parallel_list`.
         :param query: Optional query parameters to be sent to limit
             the resources being returned.
 
         :returns: A generator of image objects
         """
+        if partitions is not None:
+            return self._parallel_list(_image.Image, partitions, **query)
         return self._list(_image.Image, **query)
 
     def update_image(
@@ -2197,7 +2207,10 @@ class Proxy(proxy.Proxy):
         msg = f"Timeout waiting for {name} to transition to {status}"
 
         for count in utils.iterate_timeout(
-            timeout=wait, message=msg, wait=interval
+            timeout=wait,
+            message=msg,
+            wait=interval,
+            **utils.get_polling_options(self, 'Task'),
         ):
             task = task.fetch(self)
 
@@ -2345,13 +2358,12 @@ class Proxy(proxy.Proxy):
         project_id = self.get_project_id()
 
         # Note that images cannot be deleted when they are still being used
-        for obj in self.images(owner=project_id):
-            self._service_cleanup_del_res(
-                self.delete_image,
-                obj,
-                dry_run=dry_run,
-                client_status_queue=client_status_queue,
-                identified_resources=identified_resources,
-                filters=filters,
-                resource_evaluation_fn=resource_evaluation_fn,
-            )
+        self._service_cleanup_del_many(
+            self.delete_image,
+            self.images(owner=project_id),
+            dry_run=dry_run,
+            client_status_queue=client_status_queue,
+            identified_resources=identified_resources,
+            filters=filters,
+            resource_evaluation_fn=resource_evaluation_fn,
+        )
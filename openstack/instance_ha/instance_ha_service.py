@@ -12,13 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from openstack.instance_ha.v1 import _proxy
+from typing import TYPE_CHECKING
+
 from openstack import service_description
 
+if TYPE_CHECKING:
+    from openstack.instance_ha.v1 import _proxy  # noqa: F401
+
 
-class InstanceHaService(service_description.ServiceDescription[_proxy.Proxy]):
+class InstanceHaService(
+    service_description.ServiceDescription['_proxy.Proxy']
+):
     """The HA service."""
 
-    supported_versions = {
-        '1': _proxy.Proxy,
-    }
+    supported_versions = service_description.ProxyVersions(
+        {
+            '1': 'openstack.instance_ha.v1._proxy.Proxy',
+        }
+    )
@@ -10,15 +10,21 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from openstack.load_balancer.v2 import _proxy
+from typing import TYPE_CHECKING
+
 from openstack import service_description
 
+if TYPE_CHECKING:
+    from openstack.load_balancer.v2 import _proxy  # noqa: F401
+
 
 class LoadBalancerService(
-    service_description.ServiceDescription[_proxy.Proxy]
+    service_description.ServiceDescription['_proxy.Proxy']
 ):
     """The load balancer service."""
 
-    supported_versions = {
-        '2': _proxy.Proxy,
-    }
+    supported_versions = service_description.ProxyVersions(
+        {
+            '2': 'openstack.load_balancer.v2._proxy.Proxy',
+        }
+    )
@@ -0,0 +1,142 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Resource changes received from a Zaqar queue."""
+
+from collections.abc import Callable
+from typing import Any, TYPE_CHECKING
+import urllib.parse
+
+from openstack import _log
+from openstack import resource
+
+if TYPE_CHECKING:
+    from openstack.message.v2 import _proxy
+
+LOG = _log.setup_logging('openstack.message')
+
+#: A change, as ``(resource_type, resource_id, attrs)``, with ``attrs``
+#: ``None`` when the resource was deleted.
+Event = tuple[str, str, dict[str, Any] | None]
+
+
+def parse_event(body: Any) -> Event | None:
+    """Parse the body of a message into a resource change.
+
+    Bodies are dicts with the ``resource_type`` and ``id`` of the resource,
+    along with either the ``attributes`` that changed or ``deleted`` set to
+    true, for example::
+
+        {
+            "resource_type": "Server",
+            "id": "8a1a5b2c-...",
+            "attributes": {"status": "ACTIVE"},
+        }
+
+    :param body: The body of a message.
+    :returns: The change, or ``None`` if the body is not a change.
+    """
+    if not isinstance(body, dict):
+        return None
+    resource_type = body.get('resource_type')
+    resource_id = body.get('id')
+    if not resource_type or not resource_id:
+        return None
+    if body.get('deleted'):
+        return resource_type, resource_id, None
+    attrs = body.get('attributes')
+    if not isinstance(attrs, dict):
+        return None
+    return resource_type, resource_id, attrs
+
+
+class MessageEventSource(resource.EventSource):
+    """Publish resource changes posted as messages to a Zaqar queue.
+
+    Messages are claimed and published to the registry. Messages of changes
+    a waiter of the registry was waiting on are deleted, while the others
+    are left for other sources reading the queue, such as those of other
+    processes, to claim once the claim expires after ``ttl`` seconds.
+    Messages nobody waits on are therefore only removed by the expiry of
+    the messages themselves.
+
+    :param registry: The registry to publish changes to.
+    :param proxy: The message proxy, such as ``conn.message``.
+    :param queue_name: The name of the queue changes are posted to.
+    :param parse: A function parsing the body of a message into a
+        ``(resource_type, resource_id, attrs)`` tuple, or ``None`` to skip
+        the message. Defaults to :func:`parse_event`.
+    :param interval: How long, in seconds, to wait before claiming messages
+        again when the queue was empty.
+    :param limit: The number of messages to claim at once.
+    :param ttl: The lifetime, in seconds, of claims.
+    :param grace: The grace period, in seconds, of claimed messages.
+    """
+
+    def __init__(
+        self,
+        registry: resource.WaiterRegistry,
+        proxy: '_proxy.Proxy',
+        queue_name: str,
+        parse: Callable[[Any], Event | None] | None = None,
+        interval: float = 1.0,
+        limit: int = 20,
+        ttl: int = 60,
+        grace: int = 60,
+    ) -> None:
+        super().__init__(registry)
+        self.proxy = proxy
+        self.queue_name = queue_name
+        self.parse = parse or parse_event
+        self.interval = interval
+        self.limit = limit
+        self.ttl = ttl
+        self.grace = grace
+
+    @staticmethod
+    def _get_message_id(message: dict[str, Any]) -> str | None:
+        if message.get('id'):
+            return str(message['id'])
+        href = message.get('href')
+        if not href:
+            return None
+        # /v2/queues/{queue_name}/messages/{message_id}?claim_id={claim_id}
+        path = urllib.parse.urlsplit(href).path
+        return path.rstrip('/').rsplit('/', 1)[-1] or None
+
+    def poll(self) -> None:
+        claim = self.proxy.create_claim(
+            self.queue_name, limit=self.limit, ttl=self.ttl, grace=self.grace
+        )
+        messages = claim.messages or []
+        if not messages:
+            self._stopped.wait(self.interval)
+            return
+
+        for message in messages:
+            event = self.parse(message.get('body'))
+            if event is None:
+                LOG.debug(
+                    'Ignoring message of queue %s which is not a resource '
+                    'change',
+                    self.queue_name,
+                )
+                continue
+            if not self.registry.publish(*event):
+                # Let another source claim it, in case it has a waiter
+                continue
+
+            message_id = self._get_message_id(message)
+            if message_id:
+                self.proxy.delete_message(
+                    self.queue_name, message_id, claim=claim.id
+                )
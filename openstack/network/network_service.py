@@ -10,13 +10,19 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from openstack.network.v2 import _proxy
+from typing import TYPE_CHECKING
+
 from openstack import service_description
 
+if TYPE_CHECKING:
+    from openstack.network.v2 import _proxy  # noqa: F401
+
 
-class NetworkService(service_description.ServiceDescription[_proxy.Proxy]):
+class NetworkService(service_description.ServiceDescription['_proxy.Proxy']):
     """The network service."""
 
-    supported_versions = {
-        '2': _proxy.Proxy,
-    }
+    supported_versions = service_description.ProxyVersions(
+        {
+            '2': 'openstack.network.v2._proxy.Proxy',
+        }
+    )
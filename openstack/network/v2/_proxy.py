@@ -14,6 +14,7 @@ from collections.abc import Callable, Generator, Iterable, Sequence
 import queue
 from typing import Any, ClassVar, Literal, overload
 
+from openstack import _cleanup
 from openstack._utils import renamed_param
 from openstack import exceptions
 from openstack import fields as _fields
@@ -9853,105 +9854,101 @@ class Proxy(proxy.Proxy):
             if not self.should_skip_resource_cleanup(
                 "vpn_ipsec_site_connection", skip_resources
             ):
-                for obj in self.vpn_ipsec_site_connections():
-                    self._service_cleanup_del_res(
-                        self.delete_vpn_ipsec_site_connection,
-                        obj,
-                        dry_run=dry_run,
-                        client_status_queue=client_status_queue,
-                        identified_resources=identified_resources,
-                        filters=filters,
-                        resource_evaluation_fn=resource_evaluation_fn,
-                    )
+                self._service_cleanup_del_many(
+                    self.delete_vpn_ipsec_site_connection,
+                    self.vpn_ipsec_site_connections(),
+                    dry_run=dry_run,
+                    client_status_queue=client_status_queue,
+                    identified_resources=identified_resources,
+                    filters=filters,
+                    resource_evaluation_fn=resource_evaluation_fn,
+                )
 
             if not self.should_skip_resource_cleanup(
                 "vpn_service", skip_resources
             ):
-                for vpn_svc in self.vpn_services():
-                    self._service_cleanup_del_res(
-                        self.delete_vpn_service,
-                        vpn_svc,
-                        dry_run=dry_run,
-                        client_status_queue=client_status_queue,
-                        identified_resources=identified_resources,
-                        filters=filters,
-                        resource_evaluation_fn=resource_evaluation_fn,
-                    )
+                self._service_cleanup_del_many(
+                    self.delete_vpn_service,
+                    self.vpn_services(),
+                    dry_run=dry_run,
+                    client_status_queue=client_status_queue,
+                    identified_resources=identified_resources,
+                    filters=filters,
+                    resource_evaluation_fn=resource_evaluation_fn,
+                )
 
             if not self.should_skip_resource_cleanup(
                 "vpn_endpoint_group", skip_resources
             ):
-                for vpn_eg in self.vpn_endpoint_groups():
-                    self._service_cleanup_del_res(
-                        self.delete_vpn_endpoint_group,
-                        vpn_eg,
-                        dry_run=dry_run,
-                        client_status_queue=client_status_queue,
-                        identified_resources=identified_resources,
-                        filters=filters,
-                        resource_evaluation_fn=resource_evaluation_fn,
-                    )
+                self._service_cleanup_del_many(
+                    self.delete_vpn_endpoint_group,
+                    self.vpn_endpoint_groups(),
+                    dry_run=dry_run,
+                    client_status_queue=client_status_queue,
+                    identified_resources=identified_resources,
+                    filters=filters,
+                    resource_evaluation_fn=resource_evaluation_fn,
+                )
 
             if not self.should_skip_resource_cleanup(
                 "vpn_ike_policy", skip_resources
             ):
-                for vpn_ike in self.vpn_ike_policies():
-                    self._service_cleanup_del_res(
-                        self.delete_vpn_ike_policy,
-                        vpn_ike,
-                        dry_run=dry_run,
-                        client_status_queue=client_status_queue,
-                        identified_resources=identified_resources,
-                        filters=filters,
-                        resource_evaluation_fn=resource_evaluation_fn,
-                    )
+                self._service_cleanup_del_many(
+                    self.delete_vpn_ike_policy,
+                    self.vpn_ike_policies(),
+                    dry_run=dry_run,
+                    client_status_queue=client_status_queue,
+                    identified_resources=identified_resources,
+                    filters=filters,
+                    resource_evaluation_fn=resource_evaluation_fn,
+                )
 
             if not self.should_skip_resource_cleanup(
                 "vpn_ipsec_policy", skip_resources
             ):
-                for vpn_ipsec in self.vpn_ipsec_policies():
-                    self._service_cleanup_del_res(
-                        self.delete_vpn_ipsec_policy,
-                        vpn_ipsec,
-                        dry_run=dry_run,
-                        client_status_queue=client_status_queue,
-                        identified_resources=identified_resources,
-                        filters=filters,
-                        resource_evaluation_fn=resource_evaluation_fn,
-                    )
+                self._service_cleanup_del_many(
+                    self.delete_vpn_ipsec_policy,
+                    self.vpn_ipsec_policies(),
+                    dry_run=dry_run,
+                    client_status_queue=client_status_queue,
+                    identified_resources=identified_resources,
+                    filters=filters,
+                    resource_evaluation_fn=resource_evaluation_fn,
+                )
 
         if not self.should_skip_resource_cleanup(
             "floating_ip", skip_resources
         ):
             # Delete floating_ips in the project if no filters defined OR all
             # filters are matching and port_id is empty
-            for fip_obj in self.ips(project_id=project_id):
-                self._service_cleanup_del_res(
-                    self.delete_ip,
-                    fip_obj,
-                    dry_run=dry_run,
-                    client_status_queue=client_status_queue,
-                    identified_resources=identified_resources,
-                    filters=filters,
-                    resource_evaluation_fn=fip_cleanup_evaluation,  # type: ignore[arg-type]
-                )
+            self._service_cleanup_del_many(
+                self.delete_ip,
+                self.ips(project_id=project_id),
+                dry_run=dry_run,
+                client_status_queue=client_status_queue,
+                identified_resources=identified_resources,
+                filters=filters,
+                resource_evaluation_fn=fip_cleanup_evaluation,  # type: ignore[arg-type]
+            )
 
         if not self.should_skip_resource_cleanup(
             "security_group", skip_resources
         ):
             # Delete (try to delete) all security groups in the project
             # Let's hope we can't drop SG in use
-            for sg_obj in self.security_groups(project_id=project_id):
-                if sg_obj.name != 'default':
-                    self._service_cleanup_del_res(
-                        self.delete_security_group,
-                        sg_obj,
-                        dry_run=dry_run,
-                        client_status_queue=client_status_queue,
-                        identified_resources=identified_resources,
-                        filters=filters,
-                        resource_evaluation_fn=resource_evaluation_fn,
-                    )
+            self._service_cleanup_del_many(
+                self.delete_security_group,
+                (
+                    sg_obj
+                    for sg_obj in self.security_groups(project_id=project_id)
+                    if sg_obj.name != 'default'
+                ),
+                dry_run=dry_run,
+                client_status_queue=client_status_queue,
+                identified_resources=identified_resources,
+                filters=filters,
+                resource_evaluation_fn=resource_evaluation_fn,
+            )
 
         if not (
             self.should_skip_resource_cleanup("network", skip_resources)
@@ -10013,27 +10010,10 @@ class Proxy(proxy.Proxy):
 
                     router = self.get_router(port.device_id)
                     if not dry_run:
-                        # Router interfaces cannot be deleted when the router
-                        # has static routes, so remove those first
-                        if len(router.routes) > 0:
-                            try:
-                                self.remove_extra_routes_from_router(
-                                    router,
-                                    {"router": {"routes": router.routes}},
-                                )
-                            except exceptions.SDKException:
-                                self.log.error(
-                                    "Cannot delete routes %s from router %s",
-                                    router.routes,
-                                    router,
-                                )
-
                         try:
-                            self.remove_interface_from_router(
-                                router=port.device_id, port=port.id
-                            )
+                            self._remove_router_interface(port, router)
                         except exceptions.SDKException:
-                            self.log.error('Cannot delete object %s', obj)
+                            self.log.error('Cannot delete object %s', port)
                     # router disconnected, drop it
                     self._service_cleanup_del_res(
                         self.delete_router,
@@ -10045,33 +10025,32 @@ class Proxy(proxy.Proxy):
                         resource_evaluation_fn=None,
                     )
                 # Drop ports not belonging to anybody
-                for port in self.ports(
-                    project_id=project_id, network_id=net.id
-                ):
-                    if port.device_owner is None or port.device_owner == '':
-                        self._service_cleanup_del_res(
-                            self.delete_port,
-                            port,
-                            dry_run=dry_run,
-                            client_status_queue=client_status_queue,
-                            identified_resources=identified_resources,
-                            filters=None,
-                            resource_evaluation_fn=None,
+                self._service_cleanup_del_many(
+                    self.delete_port,
+                    (
+                        port
+                        for port in self.ports(
+                            project_id=project_id, network_id=net.id
                         )
+                        if port.device_owner is None or port.device_owner == ''
+                    ),
+                    dry_run=dry_run,
+                    client_status_queue=client_status_queue,
+                    identified_resources=identified_resources,
+                    filters=None,
+                    resource_evaluation_fn=None,
+                )
 
                 # Drop all subnets in the net (no further conditions)
-                for sub_obj in self.subnets(
-                    project_id=project_id, network_id=net.id
-                ):
-                    self._service_cleanup_del_res(
-                        self.delete_subnet,
-                        sub_obj,
-                        dry_run=dry_run,
-                        client_status_queue=client_status_queue,
-                        identified_resources=identified_resources,
-                        filters=None,
-                        resource_evaluation_fn=None,
-                    )
+                self._service_cleanup_del_many(
+                    self.delete_subnet,
+                    self.subnets(project_id=project_id, network_id=net.id),
+                    dry_run=dry_run,
+                    client_status_queue=client_status_queue,
+                    identified_resources=identified_resources,
+                    filters=None,
+                    resource_evaluation_fn=None,
+                )
 
                 # And now the network itself (we are here definitely only if we
                 # need that)
@@ -10106,6 +10085,252 @@ class Proxy(proxy.Proxy):
                         resource_evaluation_fn=None,
                     )
 
+    def _remove_router_interface(
+        self,
+        port: _port.Port,
+        router: _router.Router | None = None,
+    ) -> None:
+        if router is None:
+            router = self.get_router(port.device_id)
+        # Router interfaces cannot be deleted when the router has static
+        # routes, so remove those first
+        if router.routes:
+            try:
+                self.remove_extra_routes_from_router(
+                    router, {"router": {"routes": router.routes}}
+                )
+            except exceptions.SDKException:
+                self.log.error(
+                    "Cannot delete routes %s from router %s",
+                    router.routes,
+                    router,
+                )
+
+        self.remove_interface_from_router(router=port.device_id, port=port.id)
+
+    def _plan_cleanup(
+        self,
+        plan: _cleanup.CleanupPlan,
+        skip_resources: Sequence[str] | None = None,
+    ) -> None:
+        project_id = self.get_project_id()
+
+        def network_key(network_id: str) -> str:
+            return plan.key('network', 'network', network_id)
+
+        vpn_plugin = list(self.service_providers(service_type="VPN"))
+        if vpn_plugin:
+            self._plan_vpn_cleanup(plan, skip_resources)
+
+        # Networks, routers, ports and subnets are cleaned up together: a
+        # network is only deleted with all of its subnets and ports
+        keep_networks = any(
+            self.should_skip_resource_cleanup(name, skip_resources)
+            for name in ('network', 'router', 'port', 'subnet')
+        )
+        for net in self.networks(project_id=project_id):
+            plan.add_resource(
+                self, 'network', net, self.delete_network, keep=keep_networks
+            )
+
+        for sub_obj in self.subnets(project_id=project_id):
+            key = plan.add_resource(
+                self,
+                'subnet',
+                sub_obj,
+                self.delete_subnet,
+                evaluate=False,
+                owner=network_key(sub_obj.network_id),
+                keep=keep_networks,
+            )
+            plan.add_dependency(key, network_key(sub_obj.network_id))
+
+        ports: dict[str, tuple[str, str]] = {}
+        interfaces: dict[str, list[tuple[str, str]]] = {}
+        for port in self.ports(project_id=project_id):
+            device_owner = port.device_owner or ''
+            if device_owner in _CLEANUP_ROUTER_INTERFACE_OWNERS:
+                key = plan.add_resource(
+                    self,
+                    'router_interface',
+                    port,
+                    self._remove_router_interface,
+                    evaluate=False,
+                    owner=network_key(port.network_id),
+                    keep=keep_networks,
+                )
+                plan.add_dependency(
+                    key, plan.key('network', 'router', port.device_id)
+                )
+                interfaces.setdefault(port.device_id, []).append(
+                    (port.network_id, key)
+                )
+            elif device_owner in _CLEANUP_IGNORED_OWNERS:
+                # These go away with the resource owning them
+                continue
+            else:
+                key = plan.add_resource(
+                    self,
+                    'port',
+                    port,
+                    self.delete_port,
+                    evaluate=False,
+                    owner=network_key(port.network_id),
+                    # Ports of resources which are not cleaned up are kept
+                    keep=keep_networks
+                    or (
+                        bool(device_owner)
+                        and not device_owner.startswith('compute:')
+                    ),
+                )
+                if device_owner.startswith('compute:'):
+                    plan.add_dependency(
+                        plan.key('compute', 'server', port.device_id),
+                        key,
+                        required=True,
+                    )
+                for sg_id in port.security_group_ids or []:
+                    plan.add_dependency(
+                        key, plan.key('network', 'security_group', sg_id)
+                    )
+            for fixed_ip in port.fixed_ips or []:
+                if fixed_ip.get('subnet_id'):
+                    plan.add_dependency(
+                        key,
+                        plan.key('network', 'subnet', fixed_ip['subnet_id']),
+                    )
+            plan.add_dependency(key, network_key(port.network_id))
+            ports[port.id] = (port.network_id, key)
+
+        # Routers are deleted with the networks of their interfaces, which
+        # must all be removed first. Routers without interfaces are selected
+        # by the filters.
+        for rtr_obj in self.routers(project_id=project_id):
+            router_interfaces = interfaces.get(rtr_obj.id)
+            plan.add_resource(
+                self,
+                'router',
+                rtr_obj,
+                self.delete_router,
+                evaluate=not router_interfaces,
+                owner=(
+                    network_key(router_interfaces[0][0])
+                    if router_interfaces
+                    else None
+                ),
+                keep=keep_networks,
+            )
+
+        keep_fips = self.should_skip_resource_cleanup(
+            "floating_ip", skip_resources
+        )
+        for fip_obj in self.ips(project_id=project_id):
+            key = plan.add_resource(
+                self,
+                'floating_ip',
+                fip_obj,
+                self.delete_ip,
+                # Evaluation functions are called with the filters first
+                evaluation_fn=lambda obj, filters, identified: (
+                    fip_cleanup_evaluation(obj, identified, filters)
+                ),
+                keep=keep_fips,
+            )
+            if fip_obj.port_id not in ports:
+                continue
+            port_network_id, port_key = ports[fip_obj.port_id]
+            # The port is evaluated, and identified, before the floating IP
+            plan.add_dependency(port_key, key)
+            # Interfaces cannot be removed from routers while floating IPs
+            # use them to reach ports
+            for network_id, interface_key in interfaces.get(
+                fip_obj.router_id, []
+            ):
+                if network_id == port_network_id:
+                    plan.add_dependency(key, interface_key)
+
+        keep_sgs = self.should_skip_resource_cleanup(
+            "security_group", skip_resources
+        )
+        for sg_obj in self.security_groups(project_id=project_id):
+            if sg_obj.name != 'default':
+                plan.add_resource(
+                    self,
+                    'security_group',
+                    sg_obj,
+                    self.delete_security_group,
+                    keep=keep_sgs,
+                )
+
+    def _plan_vpn_cleanup(
+        self,
+        plan: _cleanup.CleanupPlan,
+        skip_resources: Sequence[str] | None = None,
+    ) -> None:
+        for name, resources, delete in (
+            (
+                'vpn_ipsec_site_connection',
+                self.vpn_ipsec_site_connections(),
+                self.delete_vpn_ipsec_site_connection,
+            ),
+            ('vpn_service', self.vpn_services(), self.delete_vpn_service),
+            (
+                'vpn_endpoint_group',
+                self.vpn_endpoint_groups(),
+                self.delete_vpn_endpoint_group,
+            ),
+            (
+                'vpn_ike_policy',
+                self.vpn_ike_policies(),
+                self.delete_vpn_ike_policy,
+            ),
+            (
+                'vpn_ipsec_policy',
+                self.vpn_ipsec_policies(),
+                self.delete_vpn_ipsec_policy,
+            ),
+        ):
+            keep = self.should_skip_resource_cleanup(name, skip_resources)
+            for obj in resources:
+                key = plan.add_resource(self, name, obj, delete, keep=keep)
+                if name == 'vpn_ipsec_site_connection':
+                    # Connections use all the other VPN resources
+                    for dep_name, dep_id in (
+                        ('vpn_service', obj.vpnservice_id),
+                        ('vpn_ike_policy', obj.ikepolicy_id),
+                        ('vpn_ipsec_policy', obj.ipsecpolicy_id),
+                        ('vpn_endpoint_group', obj.local_ep_group_id),
+                        ('vpn_endpoint_group', obj.peer_ep_group_id),
+                    ):
+                        if dep_id:
+                            plan.add_dependency(
+                                key, plan.key('network', dep_name, dep_id)
+                            )
+                elif name == 'vpn_service':
+                    plan.add_dependency(
+                        key, plan.key('network', 'router', obj.router_id)
+                    )
+                    if obj.subnet_id:
+                        plan.add_dependency(
+                            key, plan.key('network', 'subnet', obj.subnet_id)
+                        )
+
+
+#: The owners of router interface ports.
+_CLEANUP_ROUTER_INTERFACE_OWNERS = (
+    'network:router_interface',
+    'network:router_interface_distributed',
+    'network:ha_router_replicated_interface',
+)
+#: The owners of ports which go away with the resource owning them.
+_CLEANUP_IGNORED_OWNERS = (
+    'network:dhcp',
+    'network:floatingip',
+    'network:router_gateway',
+    'network:router_ha_interface',
+    'network:router_centralized_snat',
+)
+
 
 def fip_cleanup_evaluation(
     obj: _floating_ip.FloatingIP,
@@ -31,6 +31,7 @@ class FloatingIP(_base.NetworkResource, _base.TagMixinNetwork):
     allow_commit = True
     allow_delete = True
     allow_list = True
+    _cache_listed_resources = True
 
     # For backward compatibility include tenant_id as query param
     _query_mapping = resource.QueryParameters(
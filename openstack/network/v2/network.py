@@ -25,6 +25,7 @@ class Network(_base.NetworkResource, _base.TagMixinNetwork):
     allow_commit = True
     allow_delete = True
     allow_list = True
+    _cache_listed_resources = True
 
     # NOTE: We don't support query on list or datetime fields yet
     _query_mapping = resource.QueryParameters(
@@ -25,6 +25,7 @@ class Port(_base.NetworkResource, _base.TagMixinNetwork):
     allow_commit = True
     allow_delete = True
     allow_list = True
+    _cache_listed_resources = True
 
     # NOTE: we skip query on list or datetime fields for now
     _query_mapping = resource.QueryParameters(
@@ -31,6 +31,7 @@ class Router(_base.NetworkResource, _base.TagMixinNetwork):
     allow_commit = True
     allow_delete = True
     allow_list = True
+    _cache_listed_resources = True
 
     # NOTE: We don't support query on datetime, list or dict fields
     _query_mapping = resource.QueryParameters(
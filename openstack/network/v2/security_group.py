@@ -25,6 +25,7 @@ class SecurityGroup(_base.NetworkResource, _base.TagMixinNetwork):
     allow_commit = True
     allow_delete = True
     allow_list = True
+    _cache_listed_resources = True
 
     _query_mapping = resource.QueryParameters(
         'description',
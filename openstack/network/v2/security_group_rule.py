@@ -27,6 +27,7 @@ class SecurityGroupRule(_base.NetworkResource, _base.TagMixinNetwork):
     allow_commit = False
     allow_delete = True
     allow_list = True
+    _cache_listed_resources = True
 
     _query_mapping = resource.QueryParameters(
         'description',
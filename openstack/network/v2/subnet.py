@@ -25,6 +25,7 @@ class Subnet(_base.NetworkResource, _base.TagMixinNetwork):
     allow_commit = True
     allow_delete = True
     allow_list = True
+    _cache_listed_resources = True
 
     # NOTE: Query on list or datetime fields are currently not supported.
     _query_mapping = resource.QueryParameters(
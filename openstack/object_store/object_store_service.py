@@ -10,13 +10,21 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from openstack.object_store.v1 import _proxy
+from typing import TYPE_CHECKING
+
 from openstack import service_description
 
+if TYPE_CHECKING:
+    from openstack.object_store.v1 import _proxy  # noqa: F401
+
 
-class ObjectStoreService(service_description.ServiceDescription[_proxy.Proxy]):
+class ObjectStoreService(
+    service_description.ServiceDescription['_proxy.Proxy']
+):
     """The object store service."""
 
-    supported_versions = {
-        '1': _proxy.Proxy,
-    }
+    supported_versions = service_description.ProxyVersions(
+        {
+            '1': 'openstack.object_store.v1._proxy.Proxy',
+        }
+    )
@@ -243,24 +243,42 @@ class Proxy(proxy.Proxy):
     def objects(
         self,
         container: str | _container.Container,
+        partitions: Iterable[dict[str, Any]] | None = None,
         **query: Any,
     ) -> Generator[_obj.Object, None, None]:
         """Return a generator that yields the Container's objects.
 
         :param container: A container object or the name of a container
             that you want to retrieve objects from.
+        :param partitions: Optional query parameters, such as ``prefix`` or
+            ``marker`` and ``end_marker``, splitting the listing into
+            partitions listed concurrently. Objects are yielded in the order
+            of the partitions. See
+            :meth:`~openstack.resource.Resource.parallel_list`.
         :param query: Optional query parameters to be sent to limit
             the resources being returned.
         """
         container = self._get_container_name(container=container)
 
-        for obj in self._list(
-            _obj.Object,
-            container=container,
-            paginated=True,
-            format='json',
-            **query,
-        ):
+        if partitions is not None:
+            objects = self._parallel_list(
+                _obj.Object,
+                partitions,
+                container=container,
+                paginated=True,
+                format='json',
+                **query,
+            )
+        else:
+            objects = self._list(
+                _obj.Object,
+                container=container,
+                paginated=True,
+                format='json',
+                **query,
+            )
+
+        for obj in objects:
             obj.container = container
             yield obj
 
@@ -1337,30 +1355,25 @@ class Proxy(proxy.Proxy):
 
         elements = []
         for cont in self.containers():
-            # Iterate over objects inside container
-            objects_remaining = False
-            for obj in self.objects(cont):
-                need_delete = self._service_cleanup_del_res(
-                    self.delete_object,
-                    obj,
-                    dry_run=True,
-                    client_status_queue=client_status_queue,
-                    identified_resources=identified_resources,
-                    filters=filters,
-                    resource_evaluation_fn=resource_evaluation_fn,
-                )
-                if need_delete:
-                    if dry_run:
-                        continue
-                    elif is_bulk_delete_supported:
-                        elements.append(f"{cont.name}/{obj.name}")
-                        if len(elements) >= bulk_delete_max_per_request:
-                            self._bulk_delete(elements)
-                            elements.clear()
-                    else:
-                        self.delete_object(obj, container=cont)
-                else:
-                    objects_remaining = True
+            # Iterate over objects inside container. Without bulk deletion,
+            # objects are deleted one request each, concurrently.
+            objects = list(self.objects(cont))
+            to_delete = self._service_cleanup_del_many(
+                functools.partial(self.delete_object, container=cont),
+                objects,
+                dry_run=dry_run or is_bulk_delete_supported,
+                client_status_queue=client_status_queue,
+                identified_resources=identified_resources,
+                filters=filters,
+                resource_evaluation_fn=resource_evaluation_fn,
+            )
+            objects_remaining = len(to_delete) < len(objects)
+            if not dry_run and is_bulk_delete_supported:
+                for obj in to_delete:
+                    elements.append(f"{cont.name}/{obj.name}")
+                    if len(elements) >= bulk_delete_max_per_request:
+                        self._bulk_delete(elements)
+                        elements.clear()
 
             if len(elements) > 0:
                 self._bulk_delete(elements)
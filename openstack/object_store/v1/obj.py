@@ -52,6 +52,7 @@ class Object(_base.BaseResource):
     _query_mapping = resource.QueryParameters(
         'prefix',
         'format',
+        'end_marker',
         'temp_url_sig',
         'temp_url_expires',
         'filename',
@@ -724,19 +724,20 @@ class Proxy(proxy.Proxy):
         if self.should_skip_resource_cleanup("stack", skip_resources):
             return
 
-        stacks = []
-        for obj in self.stacks():
-            need_delete = self._service_cleanup_del_res(
-                self.delete_stack,
-                obj,
-                dry_run=dry_run,
-                client_status_queue=client_status_queue,
-                identified_resources=identified_resources,
-                filters=filters,
-                resource_evaluation_fn=resource_evaluation_fn,
-            )
-            if not dry_run and need_delete:
-                stacks.append(obj)
+        stacks = self._service_cleanup_del_many(
+            self.delete_stack,
+            self.stacks(),
+            dry_run=dry_run,
+            client_status_queue=client_status_queue,
+            identified_resources=identified_resources,
+            filters=filters,
+            resource_evaluation_fn=resource_evaluation_fn,
+        )
+        if dry_run:
+            return
 
-        for stack in stacks:
-            self.wait_for_delete(stack)
+        # Wait for all stacks at once, with one listing per interval
+        results = self._service_cleanup_wait_for_many(stacks)
+        for result in results.values():
+            if isinstance(result, exceptions.SDKException):
+                raise result
@@ -14,7 +14,9 @@
 # nova (and possibly others) expose
 from __future__ import annotations
 
-from collections.abc import MutableMapping, Sequence
+from collections.abc import Iterable, MutableMapping, Sequence
+import concurrent.futures
+import contextlib
 import functools
 import logging
 import queue
@@ -44,6 +46,8 @@ import jmespath
 from keystoneauth1 import adapter
 from keystoneauth1 import session
 
+from openstack import _cache
+from openstack import _json
 from openstack import _log
 from openstack import exceptions
 from openstack import resource
@@ -61,6 +65,10 @@ if TYPE_CHECKING:
 
 
 ProxyT = TypeVar('ProxyT', bound='Proxy')
+ResourceT = TypeVar('ResourceT', bound=resource.Resource)
+
+# How long, in seconds, project cleanup waits for each deleted resource.
+_CLEANUP_WAIT_PER_RESOURCE = 120
 
 
 def normalize_metric_name(name: str) -> str:
@@ -201,10 +209,84 @@ class Proxy(adapter.Adapter):
         key_prefix: str,
     ) -> None:
         """Invalidate all cache entries starting with given prefix"""
-        for k in set(conn._api_cache_keys):
-            if k.startswith(key_prefix):
-                conn._cache.delete(k)
-                conn._api_cache_keys.remove(k)
+        keys = conn._api_cache_keys.pop_prefix(key_prefix)
+        for k in keys:
+            conn._cache.delete(k)
+        conn._cache_stats.record('invalidations', len(keys))
+
+    def _get_resource_cache(
+        self,
+        resource_type: type[resource.Resource],
+        base_url: str,
+    ) -> _cache.ResourceCache | None:
+        """Get the cache of resources of a type found under ``base_url``.
+
+        Resources are cached for the expiration time configured for the URL
+        of a single resource, e.g. ``compute.server``. ``None`` is returned
+        when caching is disabled, or no such expiration time is configured.
+        """
+        conn = self._get_connection()
+        if not conn or not conn.cache_enabled:
+            return None
+
+        key_prefix = self._get_cache_key_prefix(utils.urljoin(base_url, 'id'))
+        expiration_time = int(conn._cache_expirations.get(key_prefix, 0))
+        if not expiration_time:
+            return None
+
+        return _cache.ResourceCache(
+            conn._cache,
+            conn._api_cache_keys,
+            conn._cache_stats,
+            _json.backend_for(conn),
+            key_prefix,
+            f'{resource_type.__module__}.{resource_type.__qualname__}',
+            base_url,
+            expiration_time,
+        )
+
+    def _revalidate_cached(
+        self,
+        conn: connection.Connection,
+        key: str,
+        request: Callable[..., requests.Response],
+        url: str,
+        method: str,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send a GET request, conditional on an expired cached response.
+
+        If an expired response is still in the cache and carries an ``ETag``
+        or ``Last-Modified`` header, the request is sent with the matching
+        ``If-None-Match`` or ``If-Modified-Since`` header. When the server
+        answers ``304 Not Modified``, the expired response is returned, to be
+        cached again, rather than downloading it again.
+        """
+        stale = conn._cache.get(key, ignore_expiration=True)
+        # Errors aren't worth revalidating, and nothing may be cached at all
+        if not getattr(stale, 'ok', False):
+            return request(url, method, **kwargs)
+        stale = cast('requests.Response', stale)
+
+        headers = dict(kwargs.get('headers') or {})
+        etag = stale.headers.get('ETag')
+        last_modified = stale.headers.get('Last-Modified')
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        if not (etag or last_modified):
+            return request(url, method, **kwargs)
+
+        response = request(url, method, **{**kwargs, 'headers': headers})
+        if response.status_code != 304:
+            return response
+
+        for name in ('ETag', 'Last-Modified', 'Date'):
+            if name in response.headers:
+                stale.headers[name] = response.headers[name]
+        conn._cache_stats.record('revalidations')
+        return stale
 
     def request(
         self,
@@ -231,12 +313,7 @@ class Proxy(adapter.Adapter):
         # The caller might want to force cache bypass.
         skip_cache = kwargs.pop('skip_cache', False)
         if conn.cache_enabled:
-            # Construct cache key. It consists of:
-            # service.name_parts.URL.str(kwargs)
-            key = '.'.join([key_prefix, url, str(kwargs)])
-
-            # Track cache key for invalidating possibility
-            conn._api_cache_keys.add(key)
+            key = _cache.make_cache_key(key_prefix, url, kwargs)
 
         try:
             request_kwargs = {
@@ -246,6 +323,19 @@ class Proxy(adapter.Adapter):
             }
             if connect_retries is not None:
                 request_kwargs["connect_retries"] = connect_retries
+            json_backend = _json.backend_for(conn)
+            if (
+                not json_backend.is_default
+                and request_kwargs.get('json') is not None
+            ):
+                # Encode the body ourselves rather than letting keystoneauth
+                # do it with the stdlib encoder.
+                headers = dict(request_kwargs.get('headers') or {})
+                headers.setdefault('Content-Type', 'application/json')
+                request_kwargs['headers'] = headers
+                request_kwargs['data'] = json_backend.dumps(
+                    request_kwargs.pop('json')
+                )
             if conn.cache_enabled and not skip_cache and method == 'GET':
                 assert key is not None  # type narrow
                 # Get the object expiration time from config
@@ -253,14 +343,29 @@ class Proxy(adapter.Adapter):
                 expiration_time = int(
                     conn._cache_expirations.get(key_prefix, 0)
                 )
+                request = super().request
+                missed = False
+
+                def creator(*args: Any, **kwargs: Any) -> requests.Response:
+                    nonlocal missed
+                    missed = True
+                    if conn._cache_revalidate:
+                        return self._revalidate_cached(
+                            conn, key, request, *args, **kwargs
+                        )
+                    return request(*args, **kwargs)
+
                 # Get from cache or execute and cache
                 _response = conn._cache.get_or_create(
                     key=key,
-                    creator=super().request,
+                    creator=creator,
                     creator_args=([url, method], request_kwargs),
                     expiration_time=expiration_time,
                 )
                 response = cast('requests.Response', _response)
+                conn._cache_stats.record('misses' if missed else 'hits')
+                # Track cache key for invalidating possibility
+                conn._api_cache_keys.add(key, key_prefix)
             else:
                 # invalidate cache if we send modification request or user
                 # asked for cache bypass
@@ -576,6 +681,9 @@ class Proxy(adapter.Adapter):
             URL, if needed.
         """
         conn = self._get_connection()
+        if isinstance(value, resource._CompactResource):
+            # A record from a compact listing
+            value = value._upgrade()
         if value is None:
             # Create a bare resource
             res = resource_type.new(connection=conn, **attrs)
@@ -913,6 +1021,39 @@ class Proxy(adapter.Adapter):
 
         return data
 
+    def _parallel_list(
+        self,
+        resource_type: type[resource.ResourceT],
+        partitions: Iterable[dict[str, Any]],
+        paginated: bool = True,
+        base_path: str | None = None,
+        **attrs: Any,
+    ) -> Generator[resource.ResourceT, None, None]:
+        """List a resource concurrently by partition
+
+        :param resource_type: The type of resource to list. This should
+            be a :class:`~openstack.resource.Resource`
+            subclass with a ``from_id`` method.
+        :param partitions: Query parameters for each partition of the
+            listing. See :meth:`~openstack.resource.Resource.parallel_list`.
+        :param paginated: When set to ``False``, expect all of the data to be
+            returned in one response. When set to ``True``, the resource
+            supports data being returned across multiple pages.
+        :param base_path: Base part of the URI for listing resources, if
+            different from :data:`~openstack.resource.Resource.base_path`.
+        :param attrs: Attributes to be passed onto the
+            :meth:`~openstack.resource.Resource.parallel_list` method.
+
+        :returns: A generator of fetched resources
+        """
+        return resource_type.parallel_list(
+            self,
+            partitions,
+            paginated=paginated,
+            base_path=base_path,
+            **attrs,
+        )
+
     def _head(
         self,
         resource_type: type[resource.ResourceT],
@@ -1019,13 +1160,109 @@ class Proxy(adapter.Adapter):
                     # Put into internal dict shared between threads so that
                     # other services might know which other resources were
                     # identified
-                    identified_resources[obj.id] = obj
+                    with self._get_cleanup_lock():
+                        identified_resources[obj.id] = obj
                 if not dry_run:
                     del_fn(obj)
         except Exception as e:
             self.log.exception('Cannot delete resource %s: %s', obj, str(e))
         return need_delete
 
+    def _get_cleanup_lock(self) -> contextlib.AbstractContextManager[Any]:
+        """Return the lock guarding the resources identified for cleanup.
+
+        Services, and the resources of a service, are cleaned up
+        concurrently while sharing the resources they identified. The lock
+        is that of the connection, so that cleanups of different connections
+        don't wait for each other.
+        """
+        lock = getattr(self._get_connection(), '_cleanup_lock', None)
+        return lock if lock is not None else contextlib.nullcontext()
+
+    def _get_cleanup_concurrency(self) -> int:
+        conn = self._get_connection()
+        get_concurrency = getattr(
+            getattr(conn, 'config', None), 'get_cleanup_concurrency', None
+        )
+        if self.service_type and callable(get_concurrency):
+            concurrency = get_concurrency(self.service_type)
+            if isinstance(concurrency, int):
+                return max(concurrency, 1)
+        return 1
+
+    def _service_cleanup_del_many(
+        self,
+        del_fn: Callable[..., Any],
+        objs: Iterable[ResourceT],
+        dry_run: bool = True,
+        client_status_queue: queue.Queue[resource.Resource] | None = None,
+        identified_resources: dict[str, resource.Resource] | None = None,
+        filters: dict[str, Any] | None = None,
+        resource_evaluation_fn: Callable[
+            [
+                resource.Resource,
+                dict[str, Any] | None,
+                dict[str, resource.Resource] | None,
+            ],
+            bool,
+        ]
+        | None = None,
+    ) -> list[ResourceT]:
+        """Clean up resources with :meth:`_service_cleanup_del_res`.
+
+        Up to the ``cleanup_concurrency`` configured for the service are
+        deleted at once.
+
+        :returns: The resources which need to be deleted, in order.
+        """
+        del_res = functools.partial(
+            self._service_cleanup_del_res,
+            del_fn,
+            dry_run=dry_run,
+            client_status_queue=client_status_queue,
+            identified_resources=identified_resources,
+            filters=filters,
+            resource_evaluation_fn=resource_evaluation_fn,
+        )
+        concurrency = self._get_cleanup_concurrency()
+        if concurrency == 1:
+            return [obj for obj in objs if del_res(obj)]
+
+        # List all resources first: deleting resources while paginating
+        # through them could skip some
+        objs = list(objs)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=concurrency,
+            thread_name_prefix=f'openstack-cleanup-{self.service_type}',
+        ) as executor:
+            need_deletes = list(executor.map(del_res, objs))
+        return [
+            obj for obj, need_delete in zip(objs, need_deletes) if need_delete
+        ]
+
+    def _service_cleanup_wait_for_many(
+        self, objs: list[ResourceT], **query: Any
+    ) -> dict[str, ResourceT | exceptions.SDKException]:
+        """Wait for resources deleted by a cleanup to be gone.
+
+        Resources are waited for all at once, with one listing per interval,
+        but each of them is given as long as if they were waited for one after
+        the other.
+
+        :param objs: The deleted resources.
+        :param query: Additional arguments of
+            :func:`~openstack.resource.wait_for_many`, such as ``base_path``.
+        :returns: A dict of the ID of each resource to the resource, or to the
+            exception raised for it.
+        """
+        return resource.wait_for_many(
+            self,
+            objs,
+            None,
+            wait=_CLEANUP_WAIT_PER_RESOURCE * len(objs),
+            **query,
+        )
+
     def _service_cleanup_resource_filters_evaluation(
         self,
         obj: resource.Resource,
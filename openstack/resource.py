@@ -34,9 +34,11 @@ and then returned to the caller.
 
 from __future__ import annotations
 
+import abc
 import builtins
 from collections.abc import (
     Callable,
+    Container,
     Generator,
     Iterable,
     Iterator,
@@ -44,10 +46,17 @@ from collections.abc import (
     Mapping,
     MutableMapping,
 )
+import concurrent.futures
+import contextlib
+import copy
 import dataclasses
+import functools
 import inspect
 import itertools
 import operator
+import queue
+import threading
+import time
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -57,6 +66,7 @@ from typing import (
     NotRequired,
     Protocol,
     Self,
+    SupportsIndex,
     TypeVar,
     TypedDict,
     Union,
@@ -71,7 +81,10 @@ import jsonpatch
 from keystoneauth1 import adapter
 from keystoneauth1 import discover
 import requests
+from requests import structures
 
+from openstack import _cache
+from openstack import _json
 from openstack import _log
 from openstack import exceptions
 from openstack import fields
@@ -86,6 +99,7 @@ LOG = _log.setup_logging(__name__)
 
 AdapterT = TypeVar('AdapterT', bound=adapter.Adapter)
 ResourceT = TypeVar('ResourceT', bound='Resource')
+_T = TypeVar('_T')
 
 
 # TODO(stephenfin): We should deprecate the 'type' and 'list_type' arguments
@@ -430,6 +444,842 @@ class CreateOpts:
     has_body: bool | types.Unset = types.UNSET
 
 
+class _AttrLookup:
+    """Precompiled lookup table for a server-name to attribute mapping.
+
+    :meth:`Resource._consume_attrs` accepts both client-side attribute names
+    and server-side names, matched case-insensitively once a key is known to
+    be relevant. Rather than scanning the whole mapping for every key, fold
+    the mapping once into tables keyed by the names a caller may pass.
+    """
+
+    __slots__ = ('exact', 'folded')
+
+    def __init__(self, mapping: Mapping[str, str]) -> None:
+        folded: dict[str, list[str]] = {}
+        for map_key, map_value in mapping.items():
+            for name in {map_key.lower(), map_value.lower()}:
+                folded.setdefault(name, []).append(map_key)
+
+        #: Names accepted verbatim, mapped to the server-side keys they set.
+        self.exact: dict[str, tuple[str, ...]] = {
+            name: tuple(folded[name.lower()])
+            for name in itertools.chain(mapping.keys(), mapping.values())
+        }
+        #: Case-folded server-side names, for case-insensitive mappings
+        #: such as headers.
+        self.folded: dict[str, tuple[str, ...]] | None = None
+        if isinstance(mapping, structures.CaseInsensitiveDict):
+            self.folded = {
+                name.lower(): tuple(folded[name.lower()])
+                for name in mapping.keys()
+            }
+
+    def match(self, key: str) -> tuple[str, ...] | None:
+        """Return the server-side keys set by ``key``, if any."""
+        matches = self.exact.get(key)
+        if matches is None and self.folded is not None:
+            matches = self.folded.get(key.lower())
+        return matches
+
+
+class _ResourceSchema:
+    """Attribute layout of a Resource subclass, compiled once per class.
+
+    Every piece of information here is derived from the class definition
+    alone, so it is built lazily on first use and then shared by all
+    instances. See :meth:`Resource._get_schema`.
+    """
+
+    def __init__(self, cls: type[Resource]) -> None:
+        self.resource_type = cls
+
+        # Since we're looking at class definitions we need to include
+        # subclasses, so check the whole MRO. Entries overridden in a
+        # subclass are deliberately kept: callers rely on the MRO order to
+        # let subclasses win.
+        self.fields: tuple[tuple[str, fields._BaseComponent], ...] = tuple(
+            (attr, component)
+            for klass in cls.__mro__
+            for attr, component in klass.__dict__.items()
+            if isinstance(component, fields._BaseComponent)
+        )
+
+        #: Name of the alternate ID. Only the class itself is considered.
+        self.alternate_id = ''
+        for value in cls.__dict__.values():
+            if isinstance(value, fields.Body) and value.alternate_id:
+                self.alternate_id = value.name
+                break
+
+        #: Aliases (``aka``) for body and header attributes.
+        self.akas: dict[str, str] = {}
+        for attr, component in self.fields:
+            if component.aka and isinstance(
+                component, (fields.Body, fields.Header)
+            ):
+                self.akas[component.aka] = attr
+
+        #: Body server-side names to the first attribute using them.
+        self.body_attrs: dict[str, str] = {}
+        for attr, component in self.fields:
+            if isinstance(component, fields.Body):
+                self.body_attrs.setdefault(component.name, attr)
+
+        #: Body attributes which may be used as client-side filters.
+        self.filter_fields: dict[str, fields._BaseComponent] = {}
+        overridden = set()
+        for attr, component in self.fields:
+            if attr in overridden:
+                continue
+            overridden.add(attr)
+            if isinstance(component, fields.Body):
+                self.filter_fields[attr] = component
+
+        self._mappings: dict[
+            type[fields._BaseComponent], MutableMapping[str, Any]
+        ] = {}
+        self._lookups: dict[type[fields._BaseComponent], _AttrLookup] = {}
+        self._attributes: dict[
+            tuple[bool, tuple[type[fields._BaseComponent], ...], bool],
+            tuple[str, ...],
+        ] = {}
+        self._dict_keys: dict[
+            tuple[tuple[type[fields._BaseComponent], ...], bool],
+            tuple[tuple[str, str], ...],
+        ] = {}
+        self._compact_layout: _CompactLayout | None = None
+        self._compact_checked = False
+
+    def iter_fields(
+        self,
+        components: (
+            type[fields._BaseComponent]
+            | tuple[type[fields._BaseComponent], ...]
+        ),
+    ) -> Iterator[tuple[str, fields._BaseComponent]]:
+        for attr, component in self.fields:
+            if isinstance(component, components):
+                yield attr, component
+
+    def mapping(
+        self, component: type[fields._BaseComponent]
+    ) -> MutableMapping[str, Any]:
+        """Return the server-name to attribute mapping of a component.
+
+        The returned mapping is shared and must not be modified.
+        """
+        try:
+            return self._mappings[component]
+        except KeyError:
+            pass
+
+        mapping = component._map_cls()
+        ret = component._map_cls()
+        for key, value in self.iter_fields(component):
+            # Make sure base classes don't end up overwriting
+            # mappings we've found previously in subclasses.
+            if key not in mapping:
+                # Make it this way first, to get MRO stuff correct.
+                mapping[key] = value.name
+        for k, v in mapping.items():
+            ret[v] = k
+
+        self._mappings[component] = ret
+        self._lookups[component] = _AttrLookup(ret)
+        return ret
+
+    def lookup(self, mapping: Mapping[str, Any]) -> _AttrLookup:
+        """Return the lookup table for a mapping.
+
+        Mappings produced by :meth:`mapping` are served from the cache, while
+        anything else is compiled on the fly.
+        """
+        for component, known in self._mappings.items():
+            if known is mapping:
+                return self._lookups[component]
+        return _AttrLookup(mapping)
+
+    def attributes(
+        self,
+        remote_names: bool,
+        components: tuple[type[fields._BaseComponent], ...],
+        include_aliases: bool,
+    ) -> tuple[str, ...]:
+        cache_key = (remote_names, components, include_aliases)
+        try:
+            return self._attributes[cache_key]
+        except KeyError:
+            pass
+
+        attributes = []
+        for attr, component in self.iter_fields(components):
+            key = attr if not remote_names else component.name
+            attributes.append(key)
+            if include_aliases and component.aka:
+                attributes.append(component.aka)
+
+        result = self._attributes[cache_key] = tuple(attributes)
+        return result
+
+    def dict_keys(
+        self,
+        components: tuple[type[fields._BaseComponent], ...],
+        original_names: bool,
+    ) -> tuple[tuple[str, str], ...]:
+        """Return the ``(key, attribute)`` pairs rendered by ``to_dict``."""
+        cache_key = (components, original_names)
+        try:
+            return self._dict_keys[cache_key]
+        except KeyError:
+            pass
+
+        pairs: dict[tuple[str, str], None] = {}
+        for attr, component in self.iter_fields(components):
+            key = component.name if original_names else attr
+            for key in filter(None, (key, component.aka)):
+                pairs[(key, attr)] = None
+
+        result = self._dict_keys[cache_key] = tuple(pairs)
+        return result
+
+    def compact_layout(self) -> _CompactLayout | None:
+        """Return the layout of compact records for this class.
+
+        ``None`` is returned if the class customizes how attributes are
+        consumed or stored, in which case only full resources can represent
+        it faithfully.
+        """
+        if not self._compact_checked:
+            cls = self.resource_type
+            if not (
+                cls._store_unknown_attrs_as_properties
+                or any(
+                    getattr(cls, name) is not getattr(Resource, name)
+                    for name in _COMPACT_INCOMPATIBLE_HOOKS
+                )
+            ):
+                self._compact_layout = _CompactLayout(self)
+            self._compact_checked = True
+        return self._compact_layout
+
+
+# Resource methods which, when overridden, mean a class can't be listed as
+# compact records since attributes wouldn't end up where we expect them.
+_COMPACT_INCOMPATIBLE_HOOKS = (
+    '__init__',
+    '__getattribute__',
+    '_collect_attrs',
+    '_compute_attributes',
+    '_consume_attrs',
+    '_consume_body_attrs',
+    '_consume_header_attrs',
+    '_consume_mapped_attrs',
+    '_consume_uri_attrs',
+)
+
+
+class _Missing:
+    def __reduce__(self) -> str:
+        # Pickle by reference so that the placeholder stays unique.
+        return '_MISSING'
+
+
+# Placeholder for attributes absent from a compact record
+_MISSING = _Missing()
+
+# Components stored by compact records, in the order in which attributes
+# are consumed by Resource._collect_attrs
+_COMPACT_COMPONENTS: tuple[type[fields._BaseComponent], ...] = (
+    fields.Body,
+    fields.Header,
+    fields.URI,
+)
+
+
+class _CompactLayout:
+    """Key table shared by all compact records of a Resource subclass.
+
+    Each component attribute known to the class gets a fixed column, so a
+    record only needs to store a tuple of values. See
+    :class:`_CompactResource`.
+    """
+
+    def __init__(self, schema: _ResourceSchema) -> None:
+        self.schema = schema
+        self.resource_type = schema.resource_type
+
+        #: ``(component, server-side name)`` of each column.
+        self.columns: tuple[tuple[type[fields._BaseComponent], str], ...] = (
+            tuple(
+                (component, name)
+                for component in _COMPACT_COMPONENTS
+                for name in schema.mapping(component)
+            )
+        )
+        index = {column: i for i, column in enumerate(self.columns)}
+
+        #: Attribute names (and aliases) to their field and column.
+        self.fields: dict[str, tuple[fields._BaseComponent, int]] = {}
+        overridden: set[str] = set()
+        for attr, field in schema.fields:
+            if attr in self.fields or attr in overridden:
+                continue
+            for component in _COMPACT_COMPONENTS:
+                if isinstance(field, component):
+                    self.fields[attr] = (field, index[(component, field.name)])
+                    break
+            else:
+                # Subclasses win, whatever their kind of field
+                overridden.add(attr)
+        for aka, attr in schema.akas.items():
+            self.fields.setdefault(aka, self.fields[attr])
+
+        self.id_column = index.get((fields.Body, 'id'))
+        self.alternate_id_column = index.get(
+            (fields.Body, schema.alternate_id)
+        )
+
+        # Names passed by the server (or the caller) to the columns they
+        # fill, resolved on first sight
+        self._keys: dict[str, tuple[int, ...]] = {}
+        self._index = index
+
+    def _columns_for(self, key: str) -> tuple[int, ...]:
+        try:
+            return self._keys[key]
+        except KeyError:
+            pass
+
+        columns: tuple[int, ...] = ()
+        for component in _COMPACT_COMPONENTS:
+            matches = self.schema.lookup(self.schema.mapping(component)).match(
+                key
+            )
+            if matches:
+                columns = tuple(
+                    self._index[(component, match)] for match in matches
+                )
+                break
+
+        self._keys[key] = columns
+        return columns
+
+    def record(
+        self,
+        attrs: Mapping[str, Any],
+        connection: connection.Connection | None,
+        microversion: str | None,
+    ) -> Any:
+        """Create a compact record of an existing remote resource."""
+        values = [_MISSING] * len(self.columns)
+        unknown = None
+        for key, value in attrs.items():
+            columns = self._columns_for(key)
+            for column in columns:
+                values[column] = value
+            if not columns and self.resource_type._allow_unknown_attrs_in_body:
+                if unknown is None:
+                    unknown = {}
+                unknown[key] = value
+        return _CompactResource(
+            self, tuple(values), unknown, connection, microversion
+        )
+
+
+class _CompactResource:
+    """Read-only stand-in for a Resource, used for bulk listings.
+
+    Values are kept in a tuple laid out by the :class:`_CompactLayout` of the
+    resource class, instead of the component managers, dirty tracking and
+    dict mirror of a full :class:`Resource`. Attributes are read straight
+    from it. Anything else, such as setting an attribute or calling
+    :meth:`Resource.commit`, turns the record into a full resource first, to
+    which it delegates from then on. Records are neither :class:`Resource`
+    nor :class:`dict` instances: the resource class is available as
+    :attr:`record_type`, and they are registered as a read-only
+    :class:`collections.abc.Mapping`, so code needing an actual dict, such as
+    :func:`json.dumps`, should use :meth:`Resource.to_dict`.
+    """
+
+    __slots__ = (
+        '_full',
+        '_layout',
+        '_record_connection',
+        '_record_microversion',
+        '_unknown',
+        '_values',
+    )
+
+    _full: Resource | None
+    _layout: _CompactLayout
+    _record_connection: connection.Connection | None
+    _record_microversion: str | None
+    _unknown: dict[str, Any] | None
+    _values: tuple[Any, ...]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        layout: _CompactLayout,
+        values: tuple[Any, ...],
+        unknown: dict[str, Any] | None,
+        connection: connection.Connection | None,
+        microversion: str | None,
+    ) -> None:
+        object.__setattr__(self, '_layout', layout)
+        object.__setattr__(self, '_values', values)
+        object.__setattr__(self, '_unknown', unknown)
+        object.__setattr__(self, '_record_connection', connection)
+        object.__setattr__(self, '_record_microversion', microversion)
+        object.__setattr__(self, '_full', None)
+
+    @property
+    def record_type(self) -> type[Resource]:
+        """The resource class this is a record of."""
+        return self._layout.resource_type
+
+    def _resource(self) -> Resource:
+        """Build a full resource with the contents of this record."""
+        res = self._layout.resource_type.existing(
+            connection=self._record_connection,
+            microversion=self._record_microversion,
+        )
+        components = {
+            fields.Body: res._body,
+            fields.Header: res._header,
+            fields.URI: res._uri,
+        }
+        for (component, name), value in zip(
+            self._layout.columns, self._values
+        ):
+            if value is not _MISSING:
+                components[component].attributes[name] = value
+        if self._unknown:
+            res._body.attributes.update(self._unknown)
+            res._unknown_attrs_in_body.update(self._unknown)
+        if res.allow_patch:
+            res._original_body = res._body.attributes.copy()
+        res._update_location()
+        res._update_dict_mirror()
+        return res
+
+    def _upgrade(self) -> Resource:
+        full = self._full
+        if full is None:
+            full = self._resource()
+            object.__setattr__(self, '_full', full)
+        return full
+
+    def _get_field(self, name: str, seen: frozenset[str]) -> Any:
+        # See fields._BaseComponent.__get__
+        field, column = self._layout.fields[name]
+        value = self._values[column]
+        if value is _MISSING:
+            value = field.default
+            if field.alias and field.alias not in seen:
+                value = self._get(field.alias, seen | {name})
+            field.warn_if_deprecated_property(value)
+            return value
+
+        if value is None:
+            return None
+        if field.name != "tenant_id":
+            field.warn_if_deprecated_property(value)
+        return fields._convert_type(value, field.data_type, field.list_type)
+
+    def _get(self, name: str, seen: frozenset[str] = frozenset()) -> Any:
+        layout = self._layout
+        if name == 'id':
+            # See Resource.__getattribute__
+            for column in (layout.id_column, layout.alternate_id_column):
+                if column is not None:
+                    value = self._values[column]
+                    if value is not _MISSING:
+                        return value
+            return None
+        if name in layout.fields:
+            return self._get_field(name, seen)
+        if name == 'microversion':
+            return self._record_microversion
+        if self._unknown and name in self._unknown:
+            return self._unknown[name]
+        if isinstance(
+            getattr(layout.resource_type, name, None), fields.Computed
+        ):
+            # Computed attributes aren't stored, so derive them without
+            # keeping the full resource around.
+            return getattr(self._resource(), name)
+        return getattr(self._upgrade(), name)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('__'):
+            # Special methods aren't part of the resource, and the slots
+            # may not be set yet while copying.
+            raise AttributeError(name)
+        full = self._full
+        if full is not None:
+            return getattr(full, name)
+        return self._get(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._upgrade(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._upgrade(), name)
+
+    def __repr__(self) -> str:
+        return repr(self._full or self._resource())
+
+    def __copy__(self) -> Any:
+        if self._full is not None:
+            return copy.copy(self._full)
+        return _CompactResource(
+            self._layout,
+            self._values,
+            self._unknown,
+            self._record_connection,
+            self._record_microversion,
+        )
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Any:
+        if self._full is not None:
+            return copy.deepcopy(self._full, memo)
+        return _CompactResource(
+            self._layout,
+            copy.deepcopy(self._values, memo),
+            copy.deepcopy(self._unknown, memo),
+            self._record_connection,
+            self._record_microversion,
+        )
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Any:
+        if self._full is not None:
+            return self._full.__reduce_ex__(protocol)
+        # The connection can't be pickled, so it's left out like for
+        # Resource.to_dict.
+        return (
+            _unpickle_compact_record,
+            (
+                self._layout.resource_type,
+                self._values,
+                self._unknown,
+                self._record_microversion,
+            ),
+        )
+
+    def __eq__(self, comparand: object) -> bool:
+        return (self._full or self._resource()).__eq__(comparand)
+
+    def __getitem__(self, name: str) -> Any:
+        full = self._full
+        if full is None:
+            if name in self._layout.fields:
+                return self._get(name)
+            if self._unknown and name in self._unknown:
+                return self._unknown[name]
+        return (full or self._resource())[name]
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._upgrade()[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        del self._upgrade()[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.keys()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def get(self, name: str, default: Any = None) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def keys(self) -> list[str]:
+        if self._full is not None:
+            return self._full.keys()
+        keys = list(
+            self._layout.schema.attributes(
+                False,
+                (fields.Body, fields.Header, fields.Computed, fields.URI),
+                True,
+            )
+        )
+        if self._unknown:
+            # These are part of to_dict(), so they'd be found in the dict
+            # mirror of a full resource.
+            keys.extend(self._unknown)
+        return keys
+
+    def items(self) -> list[tuple[str, Any]]:
+        return (self._full or self._resource()).items()
+
+    def values(self) -> list[Any]:
+        return [value for _, value in self.items()]
+
+    def to_dict(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        return (self._full or self._resource()).to_dict(*args, **kwargs)
+
+
+Mapping.register(_CompactResource)
+
+
+def _unpickle_compact_record(
+    resource_type: type[Resource],
+    values: tuple[Any, ...],
+    unknown: dict[str, Any] | None,
+    microversion: str | None,
+) -> _CompactResource:
+    layout = resource_type._get_schema().compact_layout()
+    assert layout is not None
+    return _CompactResource(layout, values, unknown, None, microversion)
+
+
+class AnyOf:
+    """Value of a client-side filter accepting any of the given values.
+
+    Filters on attributes which the server doesn't support are applied by
+    :meth:`Resource.list` itself, comparing attributes for equality with the
+    expected value. Wrapping the accepted values in :class:`AnyOf` matches
+    attributes equal to any of them instead, such as
+    ``size=AnyOf(range(2, 10))`` or ``metadata={'x': AnyOf({'a', 'b'})}``.
+    Sets and ranges are kept as is for membership tests, any other iterable
+    is consumed into a tuple.
+    """
+
+    __slots__ = ('values',)
+
+    values: Container[Any]
+
+    def __init__(self, values: Iterable[Any]) -> None:
+        if not isinstance(values, (set, frozenset, range)):
+            values = tuple(values)
+        self.values = values
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.values!r})'
+
+    def __contains__(self, value: object) -> bool:
+        try:
+            return value in self.values
+        except TypeError:
+            # Unhashable values can't be members of a set
+            return False
+
+
+def _compile_match(expected: Any) -> Callable[[Any], bool]:
+    """Compile the expected value of a client-side filter to a predicate.
+
+    Dicts match mappings containing (at least) the given keys, with their
+    values matched recursively, and :class:`AnyOf` any of its values.
+    Anything else is compared for equality.
+    """
+    if isinstance(expected, dict):
+        matches = [
+            (key, _compile_match(value)) for key, value in expected.items()
+        ]
+
+        def _match_dict(value: Any) -> bool:
+            if not value or not isinstance(value, Mapping):
+                return False
+            return all(match(value.get(key)) for key, match in matches)
+
+        return _match_dict
+
+    if isinstance(expected, AnyOf):
+        return expected.__contains__
+
+    return lambda value: bool(value == expected)
+
+
+class _ClientFilter:
+    """Client-side filters of a listing, compiled to a single predicate.
+
+    The predicate is evaluated against resources as returned by the server,
+    before they are turned into :class:`Resource` instances, so that those
+    not matching are never built. Values are converted as the corresponding
+    attributes would be, so results are the same as filtering the resources.
+
+    Resources customizing how their attributes are stored can't be filtered
+    this way, so :attr:`raw` is false and they are filtered once built using
+    :meth:`match_resource` instead.
+    """
+
+    __slots__ = ('_checks', '_schema', 'raw')
+
+    def __init__(
+        self, cls: type[Resource], filters: Mapping[str, Any]
+    ) -> None:
+        schema = self._schema = cls._get_schema()
+        self._checks = [
+            (attr, schema.filter_fields[attr], _compile_match(expected))
+            for attr, expected in filters.items()
+        ]
+        #: Whether the predicate can be evaluated against raw resources.
+        self.raw = schema.compact_layout() is not None
+
+    def _get_value(
+        self,
+        raw: Mapping[str, Any],
+        attr: str,
+        field: fields._BaseComponent,
+        seen: frozenset[str] = frozenset(),
+    ) -> Any:
+        # See fields._BaseComponent.__get__ and Resource._attr_to_dict
+        if field.name in raw:
+            value = raw[field.name]
+        elif attr in raw:
+            value = raw[attr]
+        else:
+            # Aliases name the attribute holding the value, which is found
+            # in the response under the server-side name of that attribute.
+            alias = field.alias
+            if not alias or alias in seen:
+                return field.default
+            alias_field = self._schema.filter_fields.get(alias)
+            if alias_field is None:
+                return field.default
+            return self._get_value(raw, alias, alias_field, seen | {attr})
+
+        if value is None:
+            return None
+        value = fields._convert_type(value, field.data_type, field.list_type)
+        if isinstance(value, Resource):
+            return value.to_dict()
+        if value and isinstance(value, list):
+            return [
+                item.to_dict() if isinstance(item, Resource) else item
+                for item in value
+            ]
+        return value
+
+    def __call__(self, raw: Mapping[str, Any]) -> bool:
+        return all(
+            match(self._get_value(raw, attr, field))
+            for attr, field, match in self._checks
+        )
+
+    def match_resource(self, value: Resource) -> bool:
+        """Evaluate the predicate against a built resource."""
+        return all(match(value.get(attr)) for attr, _, match in self._checks)
+
+
+# Size of the chunks read from streamed responses
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _as_list(value: Any) -> builtins.list[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+_PREFETCH_DONE = object()
+
+# Marks the threads consuming iterators for _prefetch
+_prefetch_state = threading.local()
+
+
+def _in_prefetch() -> bool:
+    """Return whether we're running within a task of :func:`_prefetch`.
+
+    Such tasks hold a worker of the executor until their items are consumed,
+    so they must not wait for other tasks of the same executor, which may
+    never get a worker.
+    """
+    return getattr(_prefetch_state, 'active', False)
+
+
+def _prefetch(
+    executor: concurrent.futures.Executor,
+    iterator: Iterator[_T],
+    depth: int,
+    closed: threading.Event | None = None,
+) -> Generator[_T, None, None]:
+    """Consume an iterator in the background, up to ``depth`` items ahead.
+
+    Items are produced by a task submitted to ``executor`` right away and
+    handed over through a bounded queue, so the task waits once ``depth``
+    items are pending. Exceptions raised by the iterator are raised to the
+    consumer. The task stops after its current item once the returned
+    generator is closed or ``closed`` is set.
+    """
+    buffer: queue.Queue[tuple[Any, BaseException | None]] = queue.Queue(
+        maxsize=depth
+    )
+    stop = threading.Event()
+
+    def _put(item: Any, exc: BaseException | None = None) -> bool:
+        while not (stop.is_set() or (closed and closed.is_set())):
+            try:
+                buffer.put((item, exc), timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce() -> None:
+        _prefetch_state.active = True
+        try:
+            for item in iterator:
+                if not _put(item):
+                    return
+        except BaseException as e:
+            _put(_PREFETCH_DONE, e)
+        else:
+            _put(_PREFETCH_DONE)
+        finally:
+            _prefetch_state.active = False
+
+    def _consume() -> Generator[_T, None, None]:
+        try:
+            while True:
+                item, exc = buffer.get()
+                if exc is not None:
+                    raise exc
+                if item is _PREFETCH_DONE:
+                    return
+                yield item
+        finally:
+            stop.set()
+
+    executor.submit(_produce)
+    return _consume()
+
+
+# Dict methods reading the underlying storage directly, which need the dict
+# mirror of a resource to be up to date. See Resource._lazy_dict_mirror.
+_DICT_MIRROR_READERS = (
+    '__contains__',
+    '__iter__',
+    '__len__',
+    '__or__',
+    '__reversed__',
+    '__ror__',
+    'get',
+    'pop',
+    'popitem',
+    'setdefault',
+    'values',
+)
+
+
+def _sync_dict_mirror_first(name: str) -> Callable[..., Any]:
+    dict_method = getattr(dict, name)
+
+    @functools.wraps(dict_method)
+    def method(self: Resource, *args: Any, **kwargs: Any) -> Any:
+        self._sync_dict_mirror()
+        return dict_method(self, *args, **kwargs)
+
+    return method
+
+
 class Resource(dict[str, Any]):
     # TODO(mordred) While this behaves mostly like a munch for the purposes
     # we need, sub-resources, such as Server.security_groups, which is a list
@@ -509,6 +1359,23 @@ class Resource(dict[str, Any]):
     #: API microversion (string or None) this Resource was loaded with
     microversion = None
 
+    #: Build the dict mirror of the resource on first access through the
+    #: dict protocol rather than every time the resource is updated, so that
+    #: resources only used through their attributes don't convert every value
+    #: twice. Must be set when defining the class. Note that ``dict(res)`` and
+    #: ``**res`` then go through :meth:`keys` as for any other mapping, while
+    #: calling methods of :class:`dict` directly, such as
+    #: ``dict.items(res)``, sees an incomplete dict. This is therefore only
+    #: safe for resources which are not used that way.
+    _lazy_dict_mirror: ClassVar[bool] = False
+    _dict_mirror_stale = False
+
+    #: Whether the resources returned by :meth:`list` are complete and can be
+    #: served by :meth:`fetch` from the resource cache. This must only be set
+    #: for resources whose listings hold the same attributes as fetching them.
+    #: Listings from a ``/detail`` URL are always considered complete.
+    _cache_listed_resources: ClassVar[bool] = False
+
     _connection = None
     _body: _ComponentManager
     _header: _ComponentManager
@@ -521,6 +1388,8 @@ class Resource(dict[str, Any]):
 
     # Placeholder for aliases as dict of {__alias__:__original}
     _attr_aliases: dict[str, str] = {}
+    # Compiled attribute layout, see _get_schema
+    _resource_schema: ClassVar[_ResourceSchema]
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -538,6 +1407,16 @@ class Resource(dict[str, Any]):
                 f"'commit_method' is {cls.commit_method!r} instead of 'PATCH'"
             )
 
+        if cls._lazy_dict_mirror:
+            # These would otherwise read the underlying storage without
+            # giving us a chance to build it.
+            for name in _DICT_MIRROR_READERS:
+                if getattr(cls, name) is getattr(dict, name):
+                    setattr(cls, name, _sync_dict_mirror_first(name))
+            if cls.__setattr__ is object.__setattr__:
+                cls.__setattr__ = Resource._setattr_dict_mirror  # type: ignore[method-assign,assignment]
+                cls.__delattr__ = Resource._delattr_dict_mirror  # type: ignore[method-assign,assignment]
+
     def __init__(
         self,
         _synchronized: bool = False,
@@ -598,17 +1477,59 @@ class Resource(dict[str, Any]):
 
         self._update_location()
 
-        for attr, component in self._attributes_iterator():
-            if component.aka:
-                # Register alias for the attribute (local name)
-                self._attr_aliases[component.aka] = attr
+        akas = self._get_schema().akas
+        if akas:
+            # Register aliases for the attributes (local names)
+            self._attr_aliases.update(akas)
 
+        self._update_dict_mirror()
+
+    def _update_dict_mirror(self) -> None:
+        """Refresh the dict mirror of this resource after an update."""
         # TODO(mordred) This is terrible, but is a hack at the moment to ensure
         # json.dumps works. The json library does basically if not obj: and
         # obj.items() ... but I think the if not obj: is short-circuiting down
         # in the C code and thus since we don't store the data in self[] it's
         # always False even if we override __len__ or __bool__.
-        dict.update(self, self.to_dict())
+        if not self._lazy_dict_mirror:
+            dict.update(self, self.to_dict())
+            return
+
+        object.__setattr__(self, '_dict_mirror_stale', True)
+        if not dict.__len__(self):
+            # Keep the storage non-empty until it is built, for the reason
+            # above: json only calls items() for non-empty dicts.
+            dict.__setitem__(self, 'id', None)
+
+    def _sync_dict_mirror(self) -> None:
+        """Build the dict mirror of this resource if it is out of date."""
+        if self._dict_mirror_stale:
+            object.__setattr__(self, '_dict_mirror_stale', False)
+            dict.clear(self)
+            dict.update(self, self.to_dict())
+
+    def _setattr_dict_mirror(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, '_dict_mirror_stale', True)
+
+    def _delattr_dict_mirror(self, name: str) -> None:
+        object.__delattr__(self, name)
+        object.__setattr__(self, '_dict_mirror_stale', True)
+
+    @classmethod
+    def _get_schema(cls) -> _ResourceSchema:
+        """Return the compiled attribute schema of this class.
+
+        The schema is built on first use and stored on the class itself, so
+        that subclasses get their own.
+        """
+        # NOTE: Look in the class namespace rather than using getattr since
+        # the latter would find the schema of a parent class through the MRO.
+        try:
+            return cast(_ResourceSchema, cls.__dict__['_resource_schema'])
+        except KeyError:
+            cls._resource_schema = _ResourceSchema(cls)
+            return cls._resource_schema
 
     @classmethod
     def _attributes_iterator(
@@ -620,12 +1541,7 @@ class Resource(dict[str, Any]):
     ) -> Generator[tuple[str, fields._BaseComponent], None, None]:
         """Iterator over all Resource attributes"""
         # isinstance stricly requires this to be a tuple
-        # Since we're looking at class definitions we need to include
-        # subclasses, so check the whole MRO.
-        for klass in cls.__mro__:
-            for attr, component in klass.__dict__.items():
-                if isinstance(component, components):
-                    yield attr, component
+        yield from cls._get_schema().iter_fields(components)
 
     def __repr__(self) -> str:
         pairs = [
@@ -645,6 +1561,8 @@ class Resource(dict[str, Any]):
 
     def __eq__(self, comparand: object) -> bool:
         """Return True if another resource has the same contents"""
+        if isinstance(comparand, _CompactResource):
+            comparand = comparand._full or comparand._resource()
         if not isinstance(comparand, Resource):
             return False
         return all(
@@ -703,14 +1621,14 @@ class Resource(dict[str, Any]):
             # returning Munch (and server side names) and Resource object with
             # normalized attributes we can offer dict access via server side
             # names.
-            for attr, component in self._attributes_iterator((fields.Body,)):
-                if component.name == name:
-                    warnings.warn(
-                        f"Access to '{self.__class__}[{name}]' is deprecated. "
-                        f"Use '{self.__class__}.{attr}' attribute instead",
-                        os_warnings.LegacyAPIWarning,
-                    )
-                    return getattr(self, attr)
+            attr = self._get_schema().body_attrs.get(name)
+            if attr is not None:
+                warnings.warn(
+                    f"Access to '{self.__class__}[{name}]' is deprecated. "
+                    f"Use '{self.__class__}.{attr}' attribute instead",
+                    os_warnings.LegacyAPIWarning,
+                )
+                return getattr(self, attr)
             if self._allow_unknown_attrs_in_body:
                 if name in self._unknown_attrs_in_body:
                     return self._unknown_attrs_in_body[name]
@@ -740,8 +1658,6 @@ class Resource(dict[str, Any]):
         include_aliases: bool = True,
     ) -> list[str]:
         """Generate list of supported attributes"""
-        attributes = []
-
         if not components:
             components = (
                 fields.Body,
@@ -750,13 +1666,11 @@ class Resource(dict[str, Any]):
                 fields.URI,
             )
 
-        for attr, component in self._attributes_iterator(components):
-            key = attr if not remote_names else component.name
-            attributes.append(key)
-            if include_aliases and component.aka:
-                attributes.append(component.aka)
-
-        return attributes
+        return list(
+            self._get_schema().attributes(
+                remote_names, tuple(components), include_aliases
+            )
+        )
 
     def keys(self) -> list[str]:  # type: ignore[override]
         # NOTE(mordred) In python2, dict.keys returns a list. In python3 it
@@ -801,12 +1715,7 @@ class Resource(dict[str, Any]):
         self._computed.update(computed)
         self._update_location()
 
-        # TODO(mordred) This is terrible, but is a hack at the moment to ensure
-        # json.dumps works. The json library does basically if not obj: and
-        # obj.items() ... but I think the if not obj: is short-circuiting down
-        # in the C code and thus since we don't store the data in self[] it's
-        # always False even if we override __len__ or __bool__.
-        dict.update(self, self.to_dict())
+        self._update_dict_mirror()
 
     def _collect_attrs(
         self, attrs: dict[str, Any]
@@ -828,14 +1737,29 @@ class Resource(dict[str, Any]):
                 # Keep also remaining (unknown) attributes
                 body = self._pack_attrs_under_properties(body, attrs)
 
+        schema = self._get_schema()
         if any([body, header, uri]):
-            attrs = self._compute_attributes(body, header, uri)
-
-            body.update(self._consume_attrs(self._body_mapping(), attrs))
+            # NOTE: Only call the deprecated hook when a subclass still
+            # overrides it, so the warning is not emitted for every resource.
+            if (
+                type(self)._compute_attributes
+                is not Resource._compute_attributes
+            ):
+                attrs = self._compute_attributes(body, header, uri)
+            else:
+                attrs = {}
 
-            header.update(self._consume_attrs(self._header_mapping(), attrs))
-            uri.update(self._consume_attrs(self._uri_mapping(), attrs))
-        computed = self._consume_attrs(self._computed_mapping(), attrs)
+            if attrs:
+                body.update(
+                    self._consume_attrs(schema.mapping(fields.Body), attrs)
+                )
+                header.update(
+                    self._consume_attrs(schema.mapping(fields.Header), attrs)
+                )
+                uri.update(
+                    self._consume_attrs(schema.mapping(fields.URI), attrs)
+                )
+        computed = self._consume_attrs(schema.mapping(fields.Computed), attrs)
         # TODO(mordred) We should make a Location Resource and add it here
         # instead of just the dict.
         if self._connection:
@@ -914,7 +1838,7 @@ class Resource(dict[str, Any]):
         mapping_cls: type[fields._BaseComponent],
         attrs: MutableMapping[str, Any],
     ) -> dict[str, Any]:
-        mapping = self._get_mapping(mapping_cls)
+        mapping = self._get_schema().mapping(mapping_cls)
         return self._consume_attrs(mapping, attrs)
 
     def _consume_attrs(
@@ -931,21 +1855,18 @@ class Resource(dict[str, Any]):
         type of Resource component one time, rather than looking at the
         same source dict several times.
         """
+        # The key lookup is case insensitive if the mapping is and client-side
+        # names are accepted as well as server-side ones. Both are folded
+        # into a lookup table once per mapping, so this is O(len(attrs)).
+        lookup = self._get_schema().lookup(mapping)
         relevant_attrs = {}
         consumed_keys = []
         for key, value in attrs.items():
-            # We want the key lookup in mapping to be case insensitive if the
-            # mapping is, thus the use of get. We want value to be exact.
-            # If we find a match, we then have to loop over the mapping for
-            # to find the key to return, as there isn't really a "get me the
-            # key that matches this other key". We lower() in the inner loop
-            # because we've already done case matching in the outer loop.
-            if key in mapping.values() or mapping.get(key):
-                for map_key, map_value in mapping.items():
-                    if key.lower() in (map_key.lower(), map_value.lower()):
-                        relevant_attrs[map_key] = value
-                        consumed_keys.append(key)
-                continue
+            matches = lookup.match(key)
+            if matches:
+                for map_key in matches:
+                    relevant_attrs[map_key] = value
+                consumed_keys.append(key)
 
         for key in consumed_keys:
             attrs.pop(key)
@@ -968,16 +1889,9 @@ class Resource(dict[str, Any]):
         cls, component: type[fields._BaseComponent]
     ) -> MutableMapping[str, Any]:
         """Return a dict of attributes of a given component on the class"""
-        mapping = component._map_cls()
+        # Hand out a copy since the compiled mapping is shared.
         ret = component._map_cls()
-        for key, value in cls._attributes_iterator(component):
-            # Make sure base classes don't end up overwriting
-            # mappings we've found previously in subclasses.
-            if key not in mapping:
-                # Make it this way first, to get MRO stuff correct.
-                mapping[key] = value.name
-        for k, v in mapping.items():
-            ret[v] = k
+        ret.update(cls._get_schema().mapping(component))
         return ret
 
     @classmethod
@@ -1010,11 +1924,7 @@ class Resource(dict[str, Any]):
         Returns an empty string if no name exists, as this method is
         consumed by _get_id and passed to getattr.
         """
-        for value in cls.__dict__.values():
-            if isinstance(value, fields.Body):
-                if value.alternate_id:
-                    return value.name
-        return ""
+        return cls._get_schema().alternate_id
 
     @staticmethod
     def _get_id(value: Resource | str) -> str:
@@ -1025,7 +1935,7 @@ class Resource(dict[str, Any]):
         If `value` is anything other than a Resource, likely to
         be a string already representing an ID, it is returned.
         """
-        if isinstance(value, Resource):
+        if isinstance(value, (Resource, _CompactResource)):
             return value.id
         else:
             return value
@@ -1172,22 +2082,20 @@ class Resource(dict[str, Any]):
         # and we're mapping names on this class to their actual stored
         # values.
         # NOTE: isinstance stricly requires components to be a tuple
-        for attr, component in self._attributes_iterator(tuple(components)):
-            if original_names:
-                key = component.name
-            else:
-                key = attr
-            for key in filter(None, (key, component.aka)):
-                # Make sure base classes don't end up overwriting
-                # mappings we've found previously in subclasses.
-                if key not in mapping:
-                    converted = self._attr_to_dict(
-                        attr,
-                        to_munch=_to_munch,
-                    )
-                    if ignore_none and converted is None:
-                        continue
-                    mapping[key] = converted
+        dict_keys = self._get_schema().dict_keys(
+            tuple(components), original_names
+        )
+        for key, attr in dict_keys:
+            # Make sure base classes don't end up overwriting
+            # mappings we've found previously in subclasses.
+            if key not in mapping:
+                converted = self._attr_to_dict(
+                    attr,
+                    to_munch=_to_munch,
+                )
+                if ignore_none and converted is None:
+                    continue
+                mapping[key] = converted
 
         return mapping
 
@@ -1361,7 +2269,9 @@ class Resource(dict[str, Any]):
 
         if has_body:
             try:
-                body = response.json()
+                body = _json.backend_for(self._connection).load_response(
+                    response
+                )
                 if resource_response_key and resource_response_key in body:
                     body = body[resource_response_key]
                 elif self.resource_key and self.resource_key in body:
@@ -1394,7 +2304,7 @@ class Resource(dict[str, Any]):
         self._header.attributes.update(headers)
         self._header.clean()
         self._update_location()
-        dict.update(self, self.to_dict())
+        self._update_dict_mirror()
 
     @classmethod
     def _get_session(cls, session: AdapterT) -> AdapterT:
@@ -1746,7 +2656,8 @@ class Resource(dict[str, Any]):
                 params=params,
             )
         exceptions.raise_from_response(response)
-        json = response.json()
+        connection = session._get_connection()  # type: ignore
+        json = _json.backend_for(connection).load_response(response)
 
         if cls.resources_key:
             json = json[cls.resources_key]
@@ -1778,6 +2689,44 @@ class Resource(dict[str, Any]):
                 for res_dict in json
             )
 
+    @classmethod
+    def _get_resource_cache(
+        cls,
+        session: adapter.Adapter,
+        base_path: str,
+        uri_attrs: Mapping[str, Any],
+    ) -> _cache.ResourceCache | None:
+        """Get the cache of resources of this type, if enabled.
+
+        :param session: The session the resources are requested with.
+        :param base_path: The base path of the resources.
+        :param uri_attrs: The URI attributes to format the base path with.
+        :returns: A :class:`~openstack._cache.ResourceCache` or ``None``.
+        """
+        if not cls.allow_fetch or cls._allow_unknown_attrs_in_body:
+            return None
+        # Only SDK proxies have a connection holding the cache
+        get_resource_cache = getattr(session, '_get_resource_cache', None)
+        if get_resource_cache is None:
+            return None
+        try:
+            base_url = base_path % uri_attrs
+        except (KeyError, TypeError, ValueError):
+            return None
+        resource_cache = get_resource_cache(cls, base_url)
+        if not isinstance(resource_cache, _cache.ResourceCache):
+            return None
+        return resource_cache
+
+    def _restore_cached_attrs(self, attrs: Mapping[str, Any]) -> None:
+        """Inflate this instance with attributes from the resource cache."""
+        self._body.attributes.update(attrs['body'])
+        self._clean_body()
+        self._header.attributes.update(attrs['header'])
+        self._header.clean()
+        self._update_location()
+        self._update_dict_mirror()
+
     def fetch(
         self,
         session: adapter.Adapter,
@@ -1824,6 +2773,26 @@ class Resource(dict[str, Any]):
             microversion = self._get_microversion(session)
         self.microversion = microversion
 
+        # Query parameters and alternate response keys may change what is
+        # returned, so only plain fetches go through the resource cache.
+        resource_cache = None
+        if (
+            requires_id
+            and resource_response_key is None
+            and self.id is not None
+            and all(name in self._uri.attributes for name in params)
+        ):
+            resource_cache = self._get_resource_cache(
+                session,
+                base_path or self.base_path,
+                {'id': self.id, **self._uri.attributes},
+            )
+        if resource_cache is not None and not skip_cache:
+            attrs = resource_cache.get(self.id, microversion)
+            if attrs is not None:
+                self._restore_cached_attrs(attrs)
+                return self
+
         response = session.get(
             request.url,
             microversion=microversion,
@@ -1837,6 +2806,16 @@ class Resource(dict[str, Any]):
             resource_response_key=resource_response_key,
         )
 
+        if resource_cache is not None:
+            resource_cache.set(
+                self.id,
+                microversion,
+                {
+                    'body': self._body.attributes,
+                    'header': self._header.attributes,
+                },
+            )
+
         return self
 
     def head(
@@ -1991,10 +2970,21 @@ class Resource(dict[str, Any]):
 
         self.microversion = microversion
 
+        self._forget_cached(session)
         self._translate_response(response, has_body=has_body)
 
         return self
 
+    def _forget_cached(self, session: adapter.Adapter) -> None:
+        """Drop this resource from the resource cache, if it is cached."""
+        if not hasattr(session, '_get_resource_cache') or self.id is None:
+            return
+        resource_cache = self._get_resource_cache(
+            session, self.base_path, {'id': self.id, **self._uri.attributes}
+        )
+        if resource_cache is not None:
+            resource_cache.delete(self.id)
+
     def _convert_patch(
         self, patch: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
@@ -2148,11 +3138,13 @@ class Resource(dict[str, Any]):
         if microversion is None:
             microversion = self._get_microversion(session)
 
-        return session.delete(
+        response = session.delete(
             request.url,
             headers=request.headers,
             microversion=microversion,
         )
+        self._forget_cached(session)
+        return response
 
     @classmethod
     def list(
@@ -2165,6 +3157,9 @@ class Resource(dict[str, Any]):
         microversion: str | None = None,
         headers: dict[str, str] | None = None,
         max_items: int | None = None,
+        compact: bool = False,
+        prefetch: int = 0,
+        stream: bool = False,
         **params: Any,
     ) -> Generator[Self, None, None]:
         """This method is a generator which yields resource objects.
@@ -2188,6 +3183,28 @@ class Resource(dict[str, Any]):
             request.
         :param max_items: The maximum number of items to return. Typically
             this must be used with ``paginated=True``.
+        :param compact: ``True`` to yield compact read-only records instead
+            of full resources, which take a fraction of the memory when
+            holding on to large listings. They behave like the resource until
+            they are modified or one of their methods is called, at which
+            point they are converted to a full resource. Records are
+            read-only mappings, not :class:`Resource` or ``dict`` instances:
+            their ``record_type`` attribute is the resource class, and
+            ``to_dict()`` is needed for serialization, such as with
+            ``json.dumps``. Ignored for resources customizing how their
+            attributes are stored.
+        :param prefetch: Number of pages to request ahead of the one being
+            consumed, using the thread pool of the connection, so that
+            requests overlap with the processing of results. Only used with
+            ``paginated=True``, and not within the partitions of
+            :meth:`parallel_list`, which already run on the thread pool.
+            Defaults to ``0``, fetching each page once the previous one has
+            been consumed.
+        :param stream: ``True`` to decode resources as each response is
+            received, rather than decoding whole pages at once, so that
+            memory usage doesn't grow with the size of pages. Not used with
+            ``prefetch``, when caching is enabled or for resources without a
+            :data:`~openstack.resource.Resource.resources_key`.
         :param params: These keyword arguments are passed through the
             :meth:`~openstack.resource.QueryParamter._transpose` method
             to find if any of them match expected query parameters to be sent
@@ -2198,7 +3215,8 @@ class Resource(dict[str, Any]):
             the contents of this argument.
             Parameters supported as filters by the server side are passed in
             the API call, remaining parameters are applied as filters to the
-            retrieved results.
+            retrieved results, matching attributes equal to them, or to any
+            of the values of an :class:`AnyOf`.
 
         :returns: A generator of :class:`Resource` objects.
         :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
@@ -2222,18 +3240,16 @@ class Resource(dict[str, Any]):
             base_path=base_path,
             allow_unknown_params=True,
         )
-        client_filters = {}
         # Gather query parameters which are not supported by the server
-        for k, v in params.items():
-            if (
-                # Known attr
-                hasattr(cls, k)
-                # Is real attr property
-                and isinstance(getattr(cls, k), fields.Body)
-                # not included in the query_params
-                and k not in cls._query_mapping._mapping.keys()
-            ):
-                client_filters[k] = v
+        filter_fields = cls._get_schema().filter_fields
+        client_filters = {
+            k: v
+            for k, v in params.items()
+            if k in filter_fields and k not in cls._query_mapping._mapping
+        }
+        client_filter = (
+            _ClientFilter(cls, client_filters) if client_filters else None
+        )
         query_params = cls._query_mapping._transpose(api_filters, cls)
         uri = base_path % params
         uri_params = {}
@@ -2256,49 +3272,167 @@ class Resource(dict[str, Any]):
             if hasattr(cls, k) and isinstance(getattr(cls, k), fields.URI):
                 uri_params[k] = v
 
-        def _dict_filter(f: dict[str, Any], d: dict[str, Any] | None) -> bool:
-            """Dict param based filtering"""
-            if not d:
-                return False
-            for key in f.keys():
-                if isinstance(f[key], dict):
-                    if not _dict_filter(f[key], d.get(key, None)):
-                        return False
-                elif d.get(key, None) != f[key]:
-                    return False
-            return True
-
         headers_final = {"Accept": "application/json"}
         if headers:
             headers_final = {**headers_final, **headers}
 
-        # Track the total number of resources yielded so we can paginate
-        # swift objects
-        total_yielded = 0
-        while uri:
-            # Copy query_params due to weird mock unittest interactions
-            response = session.get(
-                uri,
-                headers=headers_final,
-                params=query_params.copy(),
-                microversion=microversion,
+        compact_layout = (
+            cls._get_schema().compact_layout() if compact else None
+        )
+
+        # TODO(stephenfin): Our types say we accept a ksa Adapter, but
+        # this requires an SDK Proxy. Do we update the types or rework
+        # this to support use of an adapter. Plain adapters only work as long
+        # as nothing needs the connection.
+        get_connection = getattr(session, '_get_connection', None)
+        connection = get_connection() if get_connection else None
+        json_backend = _json.backend_for(connection)
+
+        # Listings done by a prefetching task, such as those of parallel_list
+        # partitions, fetch their pages themselves rather than waiting for
+        # another task.
+        prefetching = bool(
+            prefetch
+            and paginated
+            and connection is not None
+            and not _in_prefetch()
+        )
+
+        # Resources listed in full can be served by later fetches.
+        resource_cache = None
+        if (
+            not compact_layout
+            and 'fields' not in query_params
+            and (
+                cls._cache_listed_resources
+                or uri.rstrip('/').endswith('/detail')
+            )
+        ):
+            resource_cache = cls._get_resource_cache(
+                session, cls.base_path, uri_params
             )
-            exceptions.raise_from_response(response)
-            data = response.json()
 
-            # Discard any existing pagination keys
-            last_marker = query_params.pop('marker', None)
-            query_params.pop('limit', None)
+        # The marker of the next page is the ID of the last resource of the
+        # current one, which is known once we've built it. If it was filtered
+        # out, or if we're fetching pages ahead, we build it for this.
+        marker: str | None = None
+        marker_known = False
+
+        def _get_marker(last_resource: dict[str, Any]) -> str | None:
+            if marker_known and not prefetching:
+                return marker
+            raw_resource = dict(last_resource)
+            raw_resource.pop("self", None)
+            raw_resource.update(uri_params)
+            return cls.existing(microversion=microversion, **raw_resource).id
+
+        # Responses can't be decoded as they are received if they are to be
+        # cached, or handed over to another thread as a whole.
+        streaming = bool(
+            stream
+            and cls.resources_key
+            and not prefetching
+            and not (connection is not None and connection.cache_enabled)
+        )
 
-            if cls.resources_key:
-                resources = data[cls.resources_key]
-            else:
-                resources = data
+        def _stream_resources(
+            response: requests.Response,
+            data: dict[str, Any],
+            page: dict[str, Any],
+        ) -> Generator[Any, None, None]:
+            """Yield the resources of a page as they are decoded."""
+            assert cls.resources_key is not None  # narrow type
+            try:
+                resources: Iterable[Any] = utils.iter_json_list(
+                    response.iter_content(chunk_size=_STREAM_CHUNK_SIZE),
+                    cls.resources_key,
+                    data,
+                )
+                for raw_resource in itertools.chain(
+                    resources, _as_list(data.pop(cls.resources_key, []))
+                ):
+                    page['count'] += 1
+                    page['last'] = raw_resource
+                    yield raw_resource
+            finally:
+                response.close()
+
+        def _get_pages() -> Generator[Iterable[Any], None, None]:
+            # Track the total number of resources fetched so we can
+            # paginate swift objects
+            total_fetched = 0
+            page_uri = uri
+            while page_uri:
+                # Copy query_params due to weird mock unittest interactions
+                response = session.get(
+                    page_uri,
+                    headers=headers_final,
+                    params=query_params.copy(),
+                    microversion=microversion,
+                    **({'stream': True} if streaming else {}),
+                )
+                exceptions.raise_from_response(response)
+
+                # Discard any existing pagination keys
+                last_marker = query_params.pop('marker', None)
+                query_params.pop('limit', None)
+
+                if streaming:
+                    # The rest of the body is only known once the consumer is
+                    # done with the resources.
+                    data: Any = {}
+                    page: dict[str, Any] = {'count': 0, 'last': None}
+                    yield _stream_resources(response, data, page)
+                    count, last_resource = page['count'], page['last']
+                else:
+                    data = json_backend.load_response(response)
+                    if cls.resources_key:
+                        resources = _as_list(data[cls.resources_key])
+                    else:
+                        resources = _as_list(data)
+                    yield resources
+                    count = len(resources)
+                    last_resource = resources[-1] if resources else None
+
+                total_fetched += count
+
+                if not (count and paginated):
+                    return
+
+                # FIXME(stephenfin): Should we fail in _get_next_link if we
+                # can't build a new uri?
+                page_uri, next_params = cls._get_next_link(  # type: ignore[assignment]
+                    page_uri,
+                    response,
+                    data,
+                    _get_marker(last_resource),
+                    limit,
+                    total_fetched,
+                )
+                try:
+                    if next_params['marker'] == last_marker:
+                        # If next page marker is same as what we were just
+                        # asked something went terribly wrong. Some ancient
+                        # services had bugs.
+                        raise exceptions.SDKException(
+                            'Endless pagination loop detected, aborting'
+                        )
+                except KeyError:
+                    # do nothing, exception handling is cheaper then "if"
+                    pass
+                query_params.update(next_params)
 
-            if not isinstance(resources, list):
-                resources = [resources]
+                if max_items and total_fetched >= max_items and prefetch:
+                    # Don't fetch pages we know will be discarded
+                    return
+
+        pages: Iterator[Iterable[Any]] = _get_pages()
+        if prefetching:
+            assert connection is not None  # type narrow
+            pages = _prefetch(connection._pool_executor, pages, prefetch)
 
-            marker: str | None = None
+        total_yielded = 0
+        for resources in pages:
             for raw_resource in resources:
                 # We return as soon as we hit our limit, even if we have items
                 # remaining
@@ -2314,52 +3448,116 @@ class Resource(dict[str, Any]):
                 # We want that URI props are available on the resource
                 raw_resource.update(uri_params)
 
-                # TODO(stephenfin): Our types say we accept a ksa Adapter, but
-                # this requires an SDK Proxy. Do we update the types or rework
-                # this to support use of an adapter.
-                value = cls.existing(
-                    microversion=microversion,
-                    connection=session._get_connection(),  # type: ignore
-                    **raw_resource,
-                )
+                total_yielded += 1
+                # Apply client filters before building resources, so that we
+                # don't build those we'd discard
+                if (
+                    client_filter
+                    and client_filter.raw
+                    and not client_filter(raw_resource)
+                ):
+                    marker_known = False
+                    continue
+
+                if compact_layout:
+                    value = compact_layout.record(
+                        raw_resource, connection, microversion
+                    )
+                else:
+                    value = cls.existing(
+                        microversion=microversion,
+                        connection=connection,
+                        **raw_resource,
+                    )
                 marker = value.id
-                filters_matched = True
-                # Iterate over client filters and return only if matching
-                for key in client_filters.keys():
-                    if isinstance(client_filters[key], dict):
-                        if not _dict_filter(
-                            client_filters[key], value.get(key, None)
-                        ):
-                            filters_matched = False
-                            break
-                    elif value.get(key, None) != client_filters[key]:
-                        filters_matched = False
-                        break
+                marker_known = True
+                if (
+                    client_filter
+                    and not client_filter.raw
+                    and not client_filter.match_resource(value)
+                ):
+                    continue
+                if resource_cache is not None and value.id is not None:
+                    resource_cache.set(
+                        value.id,
+                        microversion,
+                        {'body': value._body.attributes, 'header': {}},
+                    )
+                yield value
 
-                if filters_matched:
-                    yield value
-                total_yielded += 1
+    @classmethod
+    def parallel_list(
+        cls,
+        session: adapter.Adapter,
+        partitions: Iterable[dict[str, Any]],
+        *,
+        max_items: int | None = None,
+        buffer_size: int = 1000,
+        **params: Any,
+    ) -> Generator[Self, None, None]:
+        """This method is a generator which yields resource objects.
 
-            if resources and paginated:
-                # FIXME(stephenfin): Should we fail in _get_next_link if we
-                # can't build a new uri?
-                uri, next_params = cls._get_next_link(  # type: ignore[assignment]
-                    uri, response, data, marker, limit, total_yielded
+        The listing is split into partitions, given as additional query
+        parameters, which are listed concurrently using the thread pool of
+        the connection. Resources are yielded partition by partition, in the
+        order in which partitions are given, so that results are ordered if
+        partitions cover consecutive ranges of a sorted listing. For example,
+        objects of a container named after hashes can be split using
+        ``[{'prefix': c} for c in '0123456789abcdef']``. Partitions must
+        neither overlap nor leave gaps, bearing in mind that bounds such as
+        ``marker`` are usually exclusive.
+
+        :param session: The session to use for making this request.
+        :param partitions: Query parameters for each partition. These are
+            combined with, and take precedence over, ``params``.
+        :param max_items: The maximum number of items to return.
+        :param buffer_size: The maximum number of resources listed ahead for
+            each partition while waiting for previous partitions to be
+            consumed.
+        :param params: Additional arguments passed to :meth:`list` for every
+            partition.
+
+        :returns: A generator of :class:`Resource` objects.
+        :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
+            :data:`Resource.allow_list` is not set to ``True``.
+        :raises: :exc:`~openstack.exceptions.InvalidResourceQuery` if query
+            contains invalid params.
+        """
+        if not cls.allow_list:
+            raise exceptions.MethodNotSupported(cls, 'list')
+
+        listings = [
+            cls.list(session, max_items=max_items, **{**params, **partition})
+            for partition in partitions
+        ]
+
+        # TODO(stephenfin): Our types say we accept a ksa Adapter, but
+        # this requires an SDK Proxy. Do we update the types or rework
+        # this to support use of an adapter. Plain adapters only work as long
+        # as nothing needs the connection.
+        get_connection = getattr(session, '_get_connection', None)
+        connection = get_connection() if get_connection else None
+        closed = threading.Event()
+        if connection is not None and not _in_prefetch():
+            # Partitions beyond the size of the pool are started as earlier
+            # ones complete, which they do since we consume them in order.
+            listings = [
+                _prefetch(
+                    connection._pool_executor, listing, buffer_size, closed
                 )
-                try:
-                    if next_params['marker'] == last_marker:
-                        # If next page marker is same as what we were just
-                        # asked something went terribly wrong. Some ancient
-                        # services had bugs.
-                        raise exceptions.SDKException(
-                            'Endless pagination loop detected, aborting'
-                        )
-                except KeyError:
-                    # do nothing, exception handling is cheaper then "if"
-                    pass
-                query_params.update(next_params)
-            else:
-                return
+                for listing in listings
+            ]
+
+        total_yielded = 0
+        try:
+            for listing in listings:
+                for value in listing:
+                    if max_items and total_yielded >= max_items:
+                        return
+                    yield value
+                    total_yielded += 1
+        finally:
+            closed.set()
 
     @classmethod
     def _get_next_link(
@@ -2571,9 +3769,20 @@ class Resource(dict[str, Any]):
         ):
             params['name'] = name_or_id
 
+        # Only one of the listed resources is kept, so when we know how they
+        # are matched don't build the others in full.
+        if all(
+            getattr(getattr(cls, name), '__func__', None)
+            is getattr(Resource, name).__func__
+            for name in ('list', '_get_one_match')
+        ):
+            params['compact'] = True
+
         data = cls.list(session, **params)
 
         result = cls._get_one_match(name_or_id, data)
+        if isinstance(result, _CompactResource):
+            result = result._upgrade()
         if result is not None:
             return result
 
@@ -2585,6 +3794,225 @@ class Resource(dict[str, Any]):
         )
 
 
+#: How long, in seconds, waiters wait for an event before polling by default.
+DEFAULT_EVENT_DEADLINE = 30.0
+
+
+class WaiterRegistry:
+    """Resource state updates fed to waiters from an event stream.
+
+    Waiters such as :func:`wait_for_status` and :func:`wait_for_delete`
+    register the resource they wait on and, rather than polling it every
+    interval, wait for an :class:`EventSource` to :meth:`publish` a change of
+    its state. They only poll the resource when they start, in case it
+    changed before they registered, and when no event arrived for
+    ``deadline`` seconds, in case an event was lost.
+
+    Set it as the ``waiter_registry`` of a
+    :class:`~openstack.connection.Connection` for all its waiters to use it.
+
+    :param deadline: How long, in seconds, waiters wait for an event before
+        polling the resource.
+    """
+
+    def __init__(self, deadline: float = DEFAULT_EVENT_DEADLINE) -> None:
+        self.deadline = float(deadline)
+        self._lock = threading.Lock()
+        self._watches: dict[
+            tuple[str, str], builtins.list[queue.Queue[dict[str, Any] | None]]
+        ] = {}
+
+    def publish(
+        self,
+        resource_type: str,
+        resource_id: str,
+        attrs: dict[str, Any] | None,
+    ) -> bool:
+        """Publish a change of the state of a resource.
+
+        :param resource_type: The name of the class of the resource, such as
+            ``Server``.
+        :param resource_id: The ID of the resource.
+        :param attrs: The attributes of the resource that changed, such as
+            ``{'status': 'ACTIVE'}``, or ``None`` if it was deleted.
+        :returns: Whether any waiter was waiting on the resource.
+        """
+        with self._lock:
+            watches = builtins.list(
+                self._watches.get((resource_type, resource_id), ())
+            )
+        for watch in watches:
+            watch.put(attrs)
+        return bool(watches)
+
+    @contextlib.contextmanager
+    def watch(
+        self, resource_type: str, resource_id: str
+    ) -> Iterator[queue.Queue[dict[str, Any] | None]]:
+        """Receive the changes of a resource published while in the context.
+
+        :param resource_type: The name of the class of the resource.
+        :param resource_id: The ID of the resource.
+        :returns: A queue receiving the ``attrs`` of each change.
+        """
+        key = (resource_type, resource_id)
+        watch: queue.Queue[dict[str, Any] | None] = queue.Queue()
+        with self._lock:
+            self._watches.setdefault(key, []).append(watch)
+        try:
+            yield watch
+        finally:
+            with self._lock:
+                self._watches[key].remove(watch)
+                if not self._watches[key]:
+                    del self._watches[key]
+
+
+class EventSource(abc.ABC):
+    """Publish the changes of resources from an event stream to waiters.
+
+    Subclasses implement :meth:`poll`, which a background thread calls
+    repeatedly between :meth:`start` and :meth:`stop`.
+
+    :param registry: The registry to publish changes to.
+    """
+
+    def __init__(self, registry: WaiterRegistry) -> None:
+        self.registry = registry
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start publishing changes in a background thread."""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name='openstack-events', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop publishing changes."""
+        thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._stopped.set()
+        thread.join()
+
+    @abc.abstractmethod
+    def poll(self) -> None:
+        """Publish the changes received since the last call.
+
+        This should wait, up to about a second, for changes when there are
+        none yet rather than return immediately.
+        """
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.poll()
+            except Exception:
+                # Waiters fall back to polling, do not stop the source
+                LOG.exception('Exception receiving resource events')
+                self._stopped.wait(1)
+
+
+class LocalEventSource(EventSource):
+    """Publish changes put on a local queue.
+
+    :param registry: The registry to publish changes to.
+    :param events: A queue of ``(resource_type, resource_id, attrs)`` tuples,
+        as taken by :meth:`WaiterRegistry.publish`.
+    """
+
+    def __init__(
+        self,
+        registry: WaiterRegistry,
+        events: queue.Queue[tuple[str, str, dict[str, Any] | None]],
+    ) -> None:
+        super().__init__(registry)
+        self.events = events
+
+    def poll(self) -> None:
+        try:
+            event = self.events.get(timeout=0.1)
+        except queue.Empty:
+            return
+        self.registry.publish(*event)
+
+
+def _get_waiter_registry(
+    session: Any, registry: WaiterRegistry | None
+) -> WaiterRegistry | None:
+    if registry is None:
+        conn = session
+        get_connection = getattr(session, '_get_connection', None)
+        if callable(get_connection):
+            conn = get_connection()
+        registry = getattr(conn, 'waiter_registry', None)
+    return registry if isinstance(registry, WaiterRegistry) else None
+
+
+def _iterate_refreshed(
+    session: adapter.Adapter,
+    resource: ResourceT,
+    timeout: int | None,
+    message: str,
+    interval: int | float | None,
+    strategy: utils.PollingStrategy | None,
+    registry: WaiterRegistry | None,
+) -> Generator[ResourceT, None, None]:
+    """Yield a resource every time it may have changed, until timeout."""
+    resource_type = resource.__class__.__name__
+    options = utils.get_polling_options(session, resource_type, strategy)
+    registry = _get_waiter_registry(session, registry)
+
+    if registry is None:
+        for count in utils.iterate_timeout(
+            timeout=timeout, message=message, wait=interval, **options
+        ):
+            resource = resource.fetch(session, skip_cache=True)
+            yield resource
+        return
+
+    polls = 0
+    try:
+        with registry.watch(resource_type, resource.id) as watch:
+            start = time.time()
+            polls += 1
+            resource = resource.fetch(session, skip_cache=True)
+            yield resource
+            while timeout is None or time.time() < start + timeout:
+                deadline = registry.deadline
+                if timeout is not None:
+                    deadline = min(deadline, start + timeout - time.time())
+                try:
+                    attrs = watch.get(timeout=max(deadline, 0))
+                except queue.Empty:
+                    if timeout is not None and time.time() >= start + timeout:
+                        break
+                    LOG.debug(
+                        'No event for %s:%s in %s seconds, polling it',
+                        resource_type,
+                        resource.id,
+                        registry.deadline,
+                    )
+                    polls += 1
+                    resource = resource.fetch(session, skip_cache=True)
+                else:
+                    if attrs is None:
+                        raise exceptions.NotFoundException(
+                            f"{resource_type}:{resource.id} was deleted"
+                        )
+                    resource._update(**attrs)
+                yield resource
+    finally:
+        if options['stats'] is not None:
+            options['stats'].record(resource_type, polls)
+    raise exceptions.ResourceTimeout(message)
+
+
 def _normalize_status(status: str | None) -> str | None:
     if status is not None:
         status = status.lower()
@@ -2600,6 +4028,8 @@ def wait_for_status(
     wait: int | None = None,
     attribute: str = 'status',
     callback: Callable[[int], None] | None = None,
+    strategy: utils.PollingStrategy | None = None,
+    registry: WaiterRegistry | None = None,
 ) -> ResourceT:
     """Wait for the resource to be in a particular status.
 
@@ -2617,6 +4047,12 @@ def wait_for_status(
     :param callback: A callback function. This will be called with a single
         value, progress. This is API specific but is generally a percentage
         value from 0-100.
+    :param strategy: The :class:`~openstack.utils.PollingStrategy` deciding
+        how long to wait between checks. Defaults to the ``polling_strategy``
+        of the cloud.
+    :param registry: The :class:`WaiterRegistry` to receive changes of the
+        resource from instead of polling it. Defaults to the
+        ``waiter_registry`` of the connection, if any.
 
     :returns: The updated resource.
     :raises: :class:`~openstack.exceptions.ResourceTimeout` if the transition
@@ -2637,10 +4073,9 @@ def wait_for_status(
     name = f"{resource.__class__.__name__}:{resource.id}"
     msg = f"Timeout waiting for {name} to transition to {status}"
 
-    for count in utils.iterate_timeout(
-        timeout=wait, message=msg, wait=interval
+    for resource in _iterate_refreshed(
+        session, resource, wait, msg, interval, strategy, registry
     ):
-        resource = resource.fetch(session, skip_cache=True)
         if not resource:
             raise exceptions.ResourceFailure(
                 f"{name} went away while waiting for {status}"
@@ -2670,12 +4105,158 @@ def wait_for_status(
     raise RuntimeError('cannot reach this')
 
 
+def wait_for_many(
+    session: adapter.Adapter,
+    resources: Iterable[ResourceT],
+    status: str | None,
+    failures: list[str] | None = None,
+    interval: int | float | None = 2,
+    wait: int | None = None,
+    attribute: str = 'status',
+    base_path: str | None = None,
+    strategy: utils.PollingStrategy | None = None,
+    **query: Any,
+) -> dict[str, ResourceT | exceptions.SDKException]:
+    """Wait for many resources to be in a particular status or deleted.
+
+    Rather than fetching each resource in turn, this lists the resources once
+    per interval and looks the waited resources up in the result, so that
+    waiting on any number of resources costs one request per interval. Each
+    resource is resolved as soon as it reaches the desired status, one of the
+    ``failures`` statuses, or goes away, and the wait ends when all of them
+    are resolved.
+
+    :param session: The session to use for making this request.
+    :param resources: The resources to wait on. They must all be of the same
+        type.
+    :param status: Desired status of the resources, or ``None`` to wait for
+        them to be deleted.
+    :param failures: Statuses that would indicate the transition
+        failed such as 'ERROR'. Defaults to ['ERROR'].
+    :param interval: Number of seconds to wait between checks. Set to ``None``
+        to use the default interval.
+    :param wait: Maximum number of seconds to wait for transition.
+        Set to ``None`` to wait forever.
+    :param attribute: Name of the resource attribute that contains the status.
+    :param base_path: Base part of the URI for listing resources, if
+        different from the ``base_path`` of the resources. This must list
+        resources with their ``attribute``.
+    :param strategy: The :class:`~openstack.utils.PollingStrategy` deciding
+        how long to wait between checks. Defaults to the ``polling_strategy``
+        of the cloud.
+    :param query: Query parameters of the list request. They must not filter
+        out the waited resources, as resources missing from the list are
+        considered gone.
+
+    :returns: A dict of the ID of each resource to the updated resource if
+        it reached the desired status or was deleted, or else to the
+        :class:`~openstack.exceptions.ResourceFailure` or
+        :class:`~openstack.exceptions.ResourceTimeout` exception describing
+        why it did not.
+    :raises: :class:`~ValueError` if the resources are not all of the same
+        type.
+    """
+    resources = builtins.list(resources)
+    if not resources:
+        return {}
+    resource_type = type(resources[0])
+    if any(type(res) is not resource_type for res in resources):
+        raise ValueError('All resources must be of the same type')
+
+    if failures is None:
+        failures = ['ERROR']
+
+    failures = [f.lower() for f in failures]
+    expected = _normalize_status(status)
+    pending = {res.id: res for res in resources}
+    results: dict[str, ResourceT | exceptions.SDKException] = {}
+
+    def _name(res_id: str) -> str:
+        return f"{resource_type.__name__}:{res_id}"
+
+    if status is not None:
+        for res_id, res in builtins.list(pending.items()):
+            if _normalize_status(getattr(res, attribute)) == expected:
+                results[res_id] = pending.pop(res_id)
+
+    target = status if status is not None else 'deleted'
+    try:
+        for count in utils.iterate_timeout(
+            timeout=wait,
+            message=(
+                f"Timeout waiting for {resource_type.__name__} resources to "
+                f"transition to {target}"
+            ),
+            wait=interval,
+            **utils.get_polling_options(
+                session, resource_type.__name__, strategy
+            ),
+        ):
+            if not pending:
+                break
+
+            listed = {
+                res.id: res
+                for res in resource_type.list(
+                    session, base_path=base_path, **query
+                )
+                if res.id in pending
+            }
+            for res_id, orig_resource in builtins.list(pending.items()):
+                current = listed.get(res_id)
+                if status is None:
+                    if current is None:
+                        results[res_id] = orig_resource
+                    elif (
+                        _normalize_status(getattr(current, 'status', None))
+                        == 'deleted'
+                    ):
+                        results[res_id] = current
+                    else:
+                        continue
+                elif current is None:
+                    results[res_id] = exceptions.ResourceFailure(
+                        f"{_name(res_id)} went away while waiting for {status}"
+                    )
+                else:
+                    new_status = getattr(current, attribute)
+                    normalized_status = _normalize_status(new_status)
+                    if normalized_status == expected:
+                        results[res_id] = current
+                    elif normalized_status in failures:
+                        results[res_id] = exceptions.ResourceFailure(
+                            f"{_name(res_id)} transitioned to failure state "
+                            f"{new_status}"
+                        )
+                    else:
+                        continue
+                del pending[res_id]
+
+            if pending:
+                LOG.debug(
+                    'Still waiting for %d %s resources to reach state %s',
+                    len(pending),
+                    resource_type.__name__,
+                    target,
+                )
+    except exceptions.ResourceTimeout:
+        for res_id in pending:
+            results[res_id] = exceptions.ResourceTimeout(
+                f"Timeout waiting for {_name(res_id)} to transition to "
+                f"{target}"
+            )
+
+    return {res.id: results[res.id] for res in resources}
+
+
 def wait_for_delete(
     session: adapter.Adapter,
     resource: ResourceT,
     interval: int | float | None = 2,
     wait: int | None = None,
     callback: Callable[[int], None] | None = None,
+    strategy: utils.PollingStrategy | None = None,
+    registry: WaiterRegistry | None = None,
 ) -> ResourceT:
     """Wait for a resource to be deleted.
 
@@ -2686,33 +4267,42 @@ def wait_for_delete(
     :param callback: A callback function. This will be called with a single
         value, progress. This is API specific but is generally a percentage
         value from 0-100.
+    :param strategy: The :class:`~openstack.utils.PollingStrategy` deciding
+        how long to wait between checks. Defaults to the ``polling_strategy``
+        of the cloud.
+    :param registry: The :class:`WaiterRegistry` to receive changes of the
+        resource from instead of polling it. Defaults to the
+        ``waiter_registry`` of the connection, if any.
 
     :returns: The original resource.
     :raises: :class:`~openstack.exceptions.ResourceTimeout` transition
         to status failed to occur in wait seconds.
     """
     orig_resource = resource
-    for count in utils.iterate_timeout(
-        timeout=wait,
-        message=(
-            f"Timeout waiting for {resource.__class__.__name__}:{resource.id} "
-            f"to delete"
-        ),
-        wait=interval,
-    ):
-        try:
-            resource = resource.fetch(session, skip_cache=True)
+    try:
+        for resource in _iterate_refreshed(
+            session,
+            resource,
+            wait,
+            (
+                f"Timeout waiting for "
+                f"{resource.__class__.__name__}:{resource.id} to delete"
+            ),
+            interval,
+            strategy,
+            registry,
+        ):
             if not resource:
                 return orig_resource
             # Some resources like VolumeAttachment don't have status field.
             if hasattr(resource, 'status'):
                 if resource.status.lower() == 'deleted':
                     return resource
-        except exceptions.NotFoundException:
-            return orig_resource
 
-        if callback:
-            progress = getattr(resource, 'progress', None) or 0
-            callback(progress)
+            if callback:
+                progress = getattr(resource, 'progress', None) or 0
+                callback(progress)
+    except exceptions.NotFoundException:
+        return orig_resource
 
     raise RuntimeError('cannot reach this')
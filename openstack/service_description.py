@@ -11,6 +11,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from collections.abc import Iterator, Mapping
+import importlib
 from typing import Any, Generic, Self, TYPE_CHECKING, cast, overload
 import warnings
 
@@ -23,6 +25,7 @@ from openstack import proxy as proxy_mod
 from openstack import warnings as os_warnings
 
 __all__ = [
+    'ProxyVersions',
     'ServiceDescription',
 ]
 
@@ -48,9 +51,52 @@ class _ServiceDisabledProxyShim:
         )
 
 
+class ProxyVersions(Mapping[str, type[proxy_mod.Proxy]]):
+    """Supported versions of a service and the proxy class for each version.
+
+    Proxy classes can be given as import paths, such as
+    ``'openstack.compute.v2._proxy.Proxy'``, in which case their module is
+    only imported the first time the version is looked up. This keeps the
+    proxies, and the resources they use, out of the import of
+    :mod:`openstack` until a service is actually used.
+
+    :param versions: A mapping of major versions to proxy classes or import
+        paths of proxy classes.
+    """
+
+    def __init__(
+        self, versions: Mapping[str, 'type[proxy_mod.Proxy] | str']
+    ) -> None:
+        self._versions = dict(versions)
+
+    def __getitem__(self, version: str) -> type[proxy_mod.Proxy]:
+        proxy_class = self._versions[version]
+        if isinstance(proxy_class, str):
+            module_name, _, class_name = proxy_class.rpartition('.')
+            module = importlib.import_module(module_name)
+            proxy_class = cast(
+                type[proxy_mod.Proxy], getattr(module, class_name)
+            )
+            self._versions[version] = proxy_class
+        return proxy_class
+
+    def __contains__(self, version: object) -> bool:
+        # Checking for a version should not import its proxy
+        return version in self._versions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._versions)
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._versions!r})'
+
+
 class ServiceDescription(Generic[proxy_mod.ProxyT]):
-    #: Dictionary of supported versions and proxy classes for that version
-    supported_versions: dict[str, type[proxy_mod.Proxy]] = {}
+    #: Mapping of supported versions and proxy classes for that version
+    supported_versions: Mapping[str, type[proxy_mod.Proxy]] = {}
     #: main service_type to use to find this service in the catalog
     service_type: str
     #: list of aliases this service might be registered as
@@ -59,7 +105,7 @@ class ServiceDescription(Generic[proxy_mod.ProxyT]):
     def __init__(
         self,
         service_type: str,
-        supported_versions: dict[str, type[proxy_mod.Proxy]] | None = None,
+        supported_versions: Mapping[str, type[proxy_mod.Proxy]] | None = None,
         aliases: list[str] | None = None,
     ):
         """Class describing how to interact with a REST service.
@@ -79,6 +125,9 @@ class ServiceDescription(Generic[proxy_mod.ProxyT]):
         directly.
 
         :param service_type: service_type to look for in the keystone catalog
+        :param supported_versions: Optional mapping of supported versions to
+            proxy classes. Use :class:`ProxyVersions` to import the proxy
+            classes only when they are needed.
         :param aliases: Optional list of aliases, if there is more than one
             name that might be used to register the service in the catalog.
         """
@@ -169,8 +218,12 @@ class ServiceDescription(Generic[proxy_mod.ProxyT]):
                 ),
             )
 
-        instance._proxies[self.service_type] = proxy
-        return cast(proxy_mod.ProxyT, instance._proxies[self.service_type])
+        # Proxies can be created concurrently, for example by
+        # Connection.warmup, so keep whichever was installed first.
+        return cast(
+            proxy_mod.ProxyT,
+            instance._proxies.setdefault(self.service_type, proxy),
+        )
 
     def _set_override_from_catalog(
         self, config: 'cloud_region.CloudRegion'
@@ -10,15 +10,21 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from typing import TYPE_CHECKING
+
 from openstack import service_description
-from openstack.shared_file_system.v2 import _proxy
+
+if TYPE_CHECKING:
+    from openstack.shared_file_system.v2 import _proxy  # noqa: F401
 
 
 class SharedFilesystemService(
-    service_description.ServiceDescription[_proxy.Proxy]
+    service_description.ServiceDescription['_proxy.Proxy']
 ):
     """The shared file systems service."""
 
-    supported_versions = {
-        '2': _proxy.Proxy,
-    }
+    supported_versions = service_description.ProxyVersions(
+        {
+            '2': 'openstack.shared_file_system.v2._proxy.Proxy',
+        }
+    )
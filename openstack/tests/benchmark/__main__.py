@@ -0,0 +1,125 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Run the offline Resource/Proxy and import benchmarks.
+
+Results can be saved with ``--output`` and later passed as ``--baseline`` to
+fail when a benchmark gets slower, or uses more memory, than the tolerance
+allows::
+
+    python -m openstack.tests.benchmark --output baseline.json
+    python -m openstack.tests.benchmark --baseline baseline.json
+"""
+
+import argparse
+import json
+import re
+import sys
+
+from openstack.tests.benchmark import base
+
+
+def _compare(
+    results: list[base.Result],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if not previous:
+            continue
+        if result.ops_per_sec < previous['ops_per_sec'] * (1 - tolerance):
+            regressions.append(
+                f'{result.name}: {result.ops_per_sec:.1f} ops/sec, was '
+                f'{previous["ops_per_sec"]:.1f}'
+            )
+        if result.peak_memory > previous['peak_memory'] * (1 + tolerance):
+            regressions.append(
+                f'{result.name}: {result.peak_memory} bytes peak, was '
+                f'{previous["peak_memory"]}'
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m openstack.tests.benchmark',
+        description=__doc__.splitlines()[0],
+    )
+    parser.add_argument(
+        '--filter',
+        default='',
+        help='Only run benchmarks whose name matches this regex.',
+    )
+    parser.add_argument(
+        '--json-backend',
+        help='The json_backend cloud option to benchmark with.',
+    )
+    parser.add_argument('--output', help='Write results to this JSON file.')
+    parser.add_argument(
+        '--baseline', help='Compare results to this JSON file.'
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.2,
+        help='Allowed relative regression against the baseline.',
+    )
+    args = parser.parse_args(argv)
+
+    pattern = re.compile(args.filter)
+    results = []
+    print(f'{"benchmark":<32}{"ops/sec":>14}{"peak memory (KiB)":>20}')
+    for benchmark in base.get_benchmarks():
+        if not pattern.search(benchmark.name):
+            continue
+        context = base.Context(json_backend=args.json_backend)
+        try:
+            result = base.run(benchmark, context)
+        finally:
+            context.close()
+        results.append(result)
+        print(
+            f'{result.name:<32}{result.ops_per_sec:>14.1f}'
+            f'{result.peak_memory / 1024:>20.1f}'
+        )
+
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(
+                {
+                    result.name: {
+                        'ops_per_sec': result.ops_per_sec,
+                        'peak_memory': result.peak_memory,
+                    }
+                    for result in results
+                },
+                fh,
+                indent=2,
+            )
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+        regressions = _compare(results, baseline, args.tolerance)
+        if regressions:
+            print('\nRegressions:', file=sys.stderr)
+            for regression in regressions:
+                print(f'  {regression}', file=sys.stderr)
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
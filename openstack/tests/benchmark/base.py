@@ -0,0 +1,223 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Offline micro-benchmarks of the Resource/Proxy hot path and of imports.
+
+Benchmarks are registered with :func:`benchmark` and receive a
+:class:`Context`, which serves canned network API responses through
+requests_mock so that no cloud is needed. They return the callable to
+measure.
+"""
+
+from collections.abc import Callable
+import dataclasses
+import gc
+import json
+import os
+import time
+import tracemalloc
+from typing import Any
+import urllib.parse
+import uuid
+
+import requests_mock
+
+from openstack import config
+from openstack import connection
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+CLOUD_NAME = '_benchmark_cloud_'
+ENDPOINT = 'https://network.example.com'
+PAGE_SIZE = 1000
+
+VERSIONS = {
+    'versions': [
+        {
+            'id': 'v2.0',
+            'status': 'CURRENT',
+            'links': [{'href': f'{ENDPOINT}/v2.0', 'rel': 'self'}],
+        }
+    ]
+}
+
+_BENCHMARKS: dict[str, 'Benchmark'] = {}
+
+
+@dataclasses.dataclass(frozen=True)
+class Benchmark:
+    name: str
+    setup: Callable[['Context'], Callable[[], Any]]
+    #: Minimum number of calls to time.
+    number: int
+    #: Keep calling until this many seconds have passed.
+    min_time: float
+
+
+@dataclasses.dataclass(frozen=True)
+class Result:
+    name: str
+    calls: int
+    seconds: float
+    #: Peak memory allocated during a single call, in bytes.
+    peak_memory: int
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.calls / self.seconds if self.seconds else 0.0
+
+
+def benchmark(
+    name: str, *, number: int = 1, min_time: float = 1.0
+) -> Callable[
+    [Callable[['Context'], Callable[[], Any]]],
+    Callable[['Context'], Callable[[], Any]],
+]:
+    """Register a benchmark.
+
+    :param name: Unique name of the benchmark, used to filter and compare.
+    :param number: Minimum number of calls to time.
+    :param min_time: Keep calling for at least this many seconds.
+    """
+
+    def decorator(
+        setup: Callable[['Context'], Callable[[], Any]],
+    ) -> Callable[['Context'], Callable[[], Any]]:
+        if name in _BENCHMARKS:
+            raise ValueError(f'Duplicate benchmark {name}')
+        _BENCHMARKS[name] = Benchmark(name, setup, number, min_time)
+        return setup
+
+    return decorator
+
+
+def get_benchmarks() -> list[Benchmark]:
+    # Import for the registration side effect.
+    from openstack.tests.benchmark import bench_import  # noqa: F401
+    from openstack.tests.benchmark import bench_proxy  # noqa: F401
+    from openstack.tests.benchmark import bench_resource  # noqa: F401
+
+    return list(_BENCHMARKS.values())
+
+
+def make_port(index: int) -> dict[str, Any]:
+    return {
+        'id': str(uuid.UUID(int=index)),
+        'name': f'port-{index}',
+        'network_id': str(uuid.UUID(int=index // 100)),
+        'mac_address': 'fa:16:3e:00:00:00',
+        'admin_state_up': True,
+        'status': 'ACTIVE',
+        'device_owner': 'compute:nova',
+        'fixed_ips': [
+            {
+                'subnet_id': str(uuid.UUID(int=index // 100)),
+                'ip_address': '10.0.0.1',
+            }
+        ],
+        'security_groups': [str(uuid.UUID(int=1))],
+        'tags': ['benchmark'],
+        'binding:vnic_type': 'normal',
+        'created_at': '2024-01-01T00:00:00Z',
+    }
+
+
+class Context:
+    """Canned responses and connections for benchmarks."""
+
+    def __init__(self, json_backend: str | None = None) -> None:
+        self.json_backend = json_backend
+        self.mock = requests_mock.Mocker()
+        self.mock.start()
+        self.mock.get(f'{ENDPOINT}/', json=VERSIONS)
+        self.mock.get(f'{ENDPOINT}/v2.0', json=VERSIONS)
+        self._connections: list[connection.Connection] = []
+
+    def close(self) -> None:
+        for conn in self._connections:
+            conn.close()
+        self.mock.stop()
+
+    def connect(self, cache: bool = False) -> connection.Connection:
+        """Connect to the fake cloud, optionally with caching enabled."""
+        filename = 'clouds_cache.yaml' if cache else 'clouds.yaml'
+        loader = config.OpenStackConfig(
+            config_files=[os.path.join(FIXTURES_DIR, filename)],
+            vendor_files=[],
+            secure_files=[],
+            load_envvars=False,
+        )
+        region = loader.get_one(
+            cloud=CLOUD_NAME, json_backend=self.json_backend
+        )
+        conn = connection.Connection(config=region)
+        self._connections.append(conn)
+        return conn
+
+    def add_port(self, port: dict[str, Any]) -> None:
+        self.mock.get(
+            f'{ENDPOINT}/v2.0/ports/{port["id"]}',
+            content=json.dumps({'port': port}).encode(),
+            headers={'Content-Type': 'application/json'},
+        )
+
+    def add_ports(self, count: int, page_size: int = PAGE_SIZE) -> None:
+        """Serve ``count`` ports from ``GET /ports``, paginated by marker."""
+        pages: dict[str | None, bytes] = {}
+        marker = None
+        for start in range(0, count, page_size):
+            ports = [
+                make_port(index)
+                for index in range(start, min(start + page_size, count))
+            ]
+            body: dict[str, Any] = {'ports': ports}
+            if start + page_size < count:
+                query = urllib.parse.urlencode(
+                    {'limit': page_size, 'marker': ports[-1]['id']}
+                )
+                body['ports_links'] = [
+                    {'href': f'{ENDPOINT}/v2.0/ports?{query}', 'rel': 'next'}
+                ]
+            pages[marker] = json.dumps(body).encode()
+            marker = ports[-1]['id']
+
+        def get_page(request: Any, context: Any) -> bytes:
+            context.headers['Content-Type'] = 'application/json'
+            markers = request.qs.get('marker')
+            return pages[markers[0] if markers else None]
+
+        self.mock.get(f'{ENDPOINT}/v2.0/ports', content=get_page)
+
+
+def run(benchmark: Benchmark, context: Context) -> Result:
+    """Time a benchmark and measure its peak memory."""
+    func = benchmark.setup(context)
+
+    # Warm up, which also primes version discovery and the like.
+    func()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while calls < benchmark.number or elapsed < benchmark.min_time:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - start
+
+    return Result(benchmark.name, calls, elapsed, peak_memory)
@@ -0,0 +1,32 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from collections.abc import Callable
+import subprocess
+import sys
+from typing import Any
+
+from openstack.tests.benchmark import base
+
+
+def _import(statement: str) -> Callable[[base.Context], Callable[[], Any]]:
+    def setup(context: base.Context) -> Callable[[], Any]:
+        # Each call starts a new interpreter, so that nothing is imported yet
+        command = [sys.executable, '-c', statement]
+        return lambda: subprocess.run(command, check=True)
+
+    return setup
+
+
+base.benchmark('import.openstack', number=10, min_time=0)(
+    _import('import openstack')
+)
@@ -0,0 +1,30 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from collections.abc import Callable
+from typing import Any
+
+from openstack.tests.benchmark import base
+
+
+def _request(cache: bool) -> Callable[[base.Context], Callable[[], Any]]:
+    def setup(context: base.Context) -> Callable[[], Any]:
+        attrs = base.make_port(1)
+        context.add_port(attrs)
+        conn = context.connect(cache=cache)
+        return lambda: conn.network.get_port(attrs['id'])
+
+    return setup
+
+
+base.benchmark('proxy.request.cache_off', number=1000)(_request(False))
+base.benchmark('proxy.request.cache_on', number=1000)(_request(True))
@@ -0,0 +1,78 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from collections.abc import Callable
+import json
+from typing import Any
+
+import requests
+from requests import structures
+
+from openstack.network.v2 import port
+from openstack.tests.benchmark import base
+
+
+@base.benchmark('resource.existing', number=10000)
+def existing(context: base.Context) -> Callable[[], Any]:
+    attrs = base.make_port(1)
+    return lambda: port.Port.existing(**attrs)
+
+
+@base.benchmark('resource.to_dict', number=10000)
+def to_dict(context: base.Context) -> Callable[[], Any]:
+    sot = port.Port.existing(**base.make_port(1))
+    return sot.to_dict
+
+
+@base.benchmark('resource.prepare_request', number=10000)
+def prepare_request(context: base.Context) -> Callable[[], Any]:
+    attrs = base.make_port(1)
+    del attrs['id']
+    sot = port.Port.new(**attrs)
+    return lambda: sot._prepare_request(requires_id=False)
+
+
+@base.benchmark('resource.translate_response', number=10000)
+def translate_response(context: base.Context) -> Callable[[], Any]:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers = structures.CaseInsensitiveDict(
+        {'Content-Type': 'application/json'}
+    )
+    response._content = json.dumps({'port': base.make_port(1)}).encode()
+    sot = port.Port.new(id=base.make_port(1)['id'])
+    return lambda: sot._translate_response(response)
+
+
+def _list(count: int) -> Callable[[base.Context], Callable[[], Any]]:
+    def setup(context: base.Context) -> Callable[[], Any]:
+        context.add_ports(count)
+        conn = context.connect()
+
+        def func() -> None:
+            for _ in conn.network.ports():
+                pass
+
+        return func
+
+    return setup
+
+
+base.benchmark('resource.list.10000', min_time=0)(_list(10000))
+
+
+@base.benchmark('resource.find', number=1000)
+def find(context: base.Context) -> Callable[[], Any]:
+    attrs = base.make_port(1)
+    context.add_port(attrs)
+    conn = context.connect()
+    return lambda: port.Port.find(conn.network, attrs['id'])
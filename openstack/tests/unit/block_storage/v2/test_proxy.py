@@ -149,6 +149,16 @@ class TestVolume(TestVolumeProxy):
             ],
         )
 
+    def test_volumes_wait_for(self):
+        value = [volume.Volume(id='1234')]
+        self._verify(
+            'openstack.resource.wait_for_many',
+            self.proxy.wait_for_volumes,
+            method_args=[value],
+            expected_args=[self.proxy, value, 'available', ['error'], 2, None],
+            expected_kwargs={'base_path': '/volumes/detail'},
+        )
+
 
 class TestVolumeActions(TestVolumeProxy):
     def test_volume_extend(self):
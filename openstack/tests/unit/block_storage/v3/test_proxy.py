@@ -13,6 +13,7 @@
 from unittest import mock
 import warnings
 
+from openstack import _cleanup
 from openstack.block_storage.v3 import _proxy
 from openstack.block_storage.v3 import backup
 from openstack.block_storage.v3 import capabilities
@@ -36,6 +37,8 @@ from openstack.block_storage.v3 import stats
 from openstack.block_storage.v3 import transfer
 from openstack.block_storage.v3 import type
 from openstack.block_storage.v3 import volume
+from openstack.compute.v2 import _proxy as compute_proxy
+from openstack.compute.v2 import server
 from openstack.identity.v3 import project
 from openstack import proxy as proxy_base
 from openstack.tests.unit import test_proxy_base
@@ -177,6 +180,16 @@ class TestVolume(TestVolumeProxy):
             ],
         )
 
+    def test_volumes_wait_for(self):
+        value = [volume.Volume(id='1234')]
+        self._verify(
+            'openstack.resource.wait_for_many',
+            self.proxy.wait_for_volumes,
+            method_args=[value],
+            expected_args=[self.proxy, value, 'available', ['error'], 2, None],
+            expected_kwargs={'base_path': '/volumes/detail'},
+        )
+
 
 class TestPools(TestVolumeProxy):
     def test_backend_pools(self):
@@ -1627,3 +1640,115 @@ class TestConsistencyGroupSnapshot(TestVolumeProxy):
             consistency_group_snapshot.ConsistencyGroupSnapshot,
             True,
         )
+
+
+class TestVolumeCleanup(TestVolumeProxy):
+    def setUp(self):
+        super().setUp()
+        self.session._sdk_connection = self.cloud
+        self.proxy.service_type = 'block-storage'
+        self.plan = _cleanup.CleanupPlan()
+        self.volumes = [
+            volume.Volume(
+                id='vol',
+                attachments=[{'server_id': 'srv'}],
+                created_at='2019-01-01T00:00:00Z',
+            ),
+        ]
+        self.snapshots = [
+            snapshot.Snapshot(
+                id='snap', volume_id='vol', created_at='2019-01-01T00:00:00Z'
+            ),
+        ]
+        # Younger backups are listed first
+        self.backups = [
+            backup.Backup(
+                id='inc-2',
+                volume_id='vol',
+                is_incremental=True,
+                has_dependent_backups=False,
+                created_at='2019-01-03T00:00:00Z',
+            ),
+            backup.Backup(
+                id='inc-1',
+                volume_id='vol',
+                is_incremental=True,
+                has_dependent_backups=True,
+                created_at='2019-01-02T00:00:00Z',
+            ),
+            backup.Backup(
+                id='full',
+                volume_id='vol',
+                is_incremental=False,
+                has_dependent_backups=True,
+                created_at='2019-01-01T00:00:00Z',
+            ),
+            backup.Backup(
+                id='other',
+                volume_id='other-vol',
+                is_incremental=False,
+                has_dependent_backups=False,
+                created_at='2019-01-01T00:00:00Z',
+            ),
+        ]
+        for name in ('volumes', 'snapshots', 'backups'):
+            patcher = mock.patch.object(
+                self.proxy, name, return_value=iter(getattr(self, name))
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _add_server(self):
+        compute = compute_proxy.Proxy(self.session)
+        compute.service_type = 'compute'
+        self.plan.add_resource(
+            compute,
+            'server',
+            server.Server(id='srv', created_at='2019-01-01T00:00:00Z'),
+            compute.delete_server,
+        )
+
+    def test_plan_cleanup(self):
+        self._add_server()
+        self.proxy._plan_cleanup(self.plan)
+        self.plan.resolve()
+
+        steps = dict(self.plan.get_steps())
+        self.assertEqual(
+            ['block_storage.snapshot:snap', 'compute.server:srv'],
+            steps['block_storage.volume:vol'],
+        )
+        self.assertEqual([], steps['block_storage.snapshot:snap'])
+        # Backups are deleted after their younger incremental backups
+        self.assertEqual([], steps['block_storage.backup:inc-2'])
+        self.assertEqual(
+            ['block_storage.backup:inc-2'], steps['block_storage.backup:inc-1']
+        )
+        self.assertEqual(
+            ['block_storage.backup:inc-1', 'block_storage.backup:inc-2'],
+            steps['block_storage.backup:full'],
+        )
+        self.assertEqual([], steps['block_storage.backup:other'])
+
+    def test_plan_cleanup_server_kept(self):
+        # Volumes attached to servers which are not cleaned up are kept
+        self.proxy._plan_cleanup(self.plan)
+
+        steps = self.plan.resolve()
+
+        self.assertNotIn('block_storage.volume:vol', steps)
+        self.assertIn('block_storage.snapshot:snap', steps)
+        self.assertIn('block_storage.backup:full', steps)
+
+    def test_plan_cleanup_incremental_backup_kept(self):
+        self.proxy._plan_cleanup(self.plan)
+
+        steps = self.plan.resolve(
+            filters={'created_at': '2019-01-02T12:00:00Z'}
+        )
+
+        # The full backup is kept with its younger incremental backup
+        self.assertNotIn('block_storage.backup:inc-2', steps)
+        self.assertNotIn('block_storage.backup:inc-1', steps)
+        self.assertNotIn('block_storage.backup:full', steps)
+        self.assertIn('block_storage.backup:other', steps)
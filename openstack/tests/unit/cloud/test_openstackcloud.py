@@ -10,9 +10,21 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import threading
 from unittest import mock
 
+from openstack.block_storage.v3 import _proxy as block_storage_proxy
+from openstack.block_storage.v3 import backup
+from openstack.block_storage.v3 import snapshot
+from openstack.block_storage.v3 import volume
+from openstack.compute.v2 import _proxy as compute_proxy
+from openstack.compute.v2 import server
 from openstack import exceptions
+from openstack.network.v2 import _proxy as network_proxy
+from openstack.network.v2 import network
+from openstack.network.v2 import port
+from openstack.network.v2 import router
+from openstack.network.v2 import subnet
 from openstack import proxy
 from openstack import resource
 from openstack.tests.unit import base
@@ -113,3 +125,204 @@ class TestSearch(base.TestCase):
         self.assertEqual(
             self.FakeResource(foo="bar").to_dict(), ret[0].to_dict()
         )
+
+
+class TestProjectCleanupPipeline(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.session = mock.Mock()
+        self.session._sdk_connection = self.cloud
+        self.deleted = []
+        self.lock = threading.Lock()
+        self.resources = {
+            'compute': {
+                'servers': [server.Server(id='srv')],
+                'server_groups': [],
+            },
+            'network': {
+                'networks': [network.Network(id='net')],
+                'subnets': [subnet.Subnet(id='sub', network_id='net')],
+                'routers': [router.Router(id='rtr')],
+                'ports': [
+                    port.Port(
+                        id='rtr-if',
+                        network_id='net',
+                        device_owner='network:router_interface',
+                        device_id='rtr',
+                        fixed_ips=[{'subnet_id': 'sub'}],
+                    ),
+                    port.Port(
+                        id='port',
+                        network_id='net',
+                        device_owner='compute:nova',
+                        device_id='srv',
+                        fixed_ips=[{'subnet_id': 'sub'}],
+                    ),
+                ],
+                'ips': [],
+                'security_groups': [],
+                'service_providers': [],
+            },
+            'block_storage': {
+                'volumes': [
+                    volume.Volume(id='vol', attachments=[{'server_id': 'srv'}])
+                ],
+                'snapshots': [snapshot.Snapshot(id='snap', volume_id='vol')],
+                # Younger backups are listed first
+                'backups': [
+                    backup.Backup(
+                        id='inc', volume_id='vol', is_incremental=True
+                    ),
+                    backup.Backup(
+                        id='full',
+                        volume_id='vol',
+                        is_incremental=False,
+                        has_dependent_backups=True,
+                    ),
+                ],
+            },
+        }
+        self.proxies = {}
+        for service_type, proxy_class, deletes in (
+            ('compute', compute_proxy.Proxy, ('delete_server',)),
+            (
+                'network',
+                network_proxy.Proxy,
+                (
+                    'delete_network',
+                    'delete_subnet',
+                    'delete_router',
+                    '_remove_router_interface',
+                    'delete_port',
+                ),
+            ),
+            (
+                'block-storage',
+                block_storage_proxy.Proxy,
+                ('delete_volume', 'delete_snapshot', 'delete_backup'),
+            ),
+        ):
+            sot = proxy_class(self.session)
+            sot.service_type = service_type
+            service = service_type.replace('-', '_')
+            self.proxies[service] = sot
+            for name in self.resources[service]:
+                self._patch(
+                    sot,
+                    name,
+                    side_effect=lambda *args, _s=service, _n=name, **kw: iter(
+                        self.resources[_s][_n]
+                    ),
+                )
+            for name in deletes:
+                self._patch(sot, name, side_effect=self._delete)
+            self._patch(sot, 'get_project_id', return_value='project')
+        self._patch(
+            self.cloud,
+            '_proxies',
+            {sot.service_type: sot for sot in self.proxies.values()},
+        )
+        self._patch(
+            self.cloud.config,
+            'get_enabled_services',
+            return_value=['compute', 'network', 'block_storage'],
+        )
+        self._patch(resource, 'wait_for_delete')
+
+    def _patch(self, target, name, *args, **kwargs):
+        patcher = mock.patch.object(target, name, *args, **kwargs)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _delete(self, res, *args, **kwargs):
+        with self.lock:
+            self.deleted.append(res.id)
+
+    def assertDeletedBefore(self, before, after):
+        self.assertLess(self.deleted.index(before), self.deleted.index(after))
+
+    def test_project_cleanup(self):
+        steps = dict(self.cloud.project_cleanup(dry_run=False, pipeline=True))
+
+        self.assertEqual(
+            {
+                'compute.server:srv',
+                'network.network:net',
+                'network.subnet:sub',
+                'network.router:rtr',
+                'network.router_interface:rtr-if',
+                'network.port:port',
+                'block_storage.volume:vol',
+                'block_storage.snapshot:snap',
+                'block_storage.backup:inc',
+                'block_storage.backup:full',
+            },
+            set(steps),
+        )
+        self.assertEqual(
+            ['block_storage.snapshot:snap', 'compute.server:srv'],
+            steps['block_storage.volume:vol'],
+        )
+        self.assertEqual(
+            ['block_storage.backup:inc'], steps['block_storage.backup:full']
+        )
+        self.assertEqual(len(steps), len(self.deleted))
+        for before, after in (
+            ('srv', 'port'),
+            ('srv', 'vol'),
+            ('snap', 'vol'),
+            ('inc', 'full'),
+            ('rtr-if', 'rtr'),
+            ('rtr-if', 'sub'),
+            ('port', 'sub'),
+            ('sub', 'net'),
+        ):
+            self.assertDeletedBefore(before, after)
+
+    def test_project_cleanup_dry_run(self):
+        steps = self.cloud.project_cleanup(dry_run=True, pipeline=True)
+
+        self.assertEqual(10, len(steps))
+        self.assertEqual([], self.deleted)
+
+    def test_project_cleanup_listing_failure(self):
+        # Services whose resources cannot be listed are cleaned up as a
+        # whole
+        block_storage = self.proxies['block_storage']
+        block_storage.backups.side_effect = exceptions.HttpException('boom')
+        self._patch(block_storage, '_service_cleanup')
+
+        steps = dict(self.cloud.project_cleanup(dry_run=False, pipeline=True))
+
+        self.assertIn('block_storage', steps)
+        self.assertNotIn('block_storage.volume:vol', steps)
+        self.assertIn('compute.server:srv', steps['block_storage'])
+        block_storage._service_cleanup.assert_called_once_with(
+            dry_run=False,
+            client_status_queue=None,
+            identified_resources=mock.ANY,
+            filters=None,
+            resource_evaluation_fn=None,
+            skip_resources=None,
+        )
+        self.assertNotIn('vol', self.deleted)
+        self.assertIn('srv', self.deleted)
+
+    def test_project_cleanup_listing_timeout(self):
+        listed = threading.Event()
+        self.addCleanup(listed.set)
+
+        def volumes(*args, **kwargs):
+            listed.wait(2)
+            return iter([])
+
+        self.proxies['block_storage'].volumes.side_effect = volumes
+
+        self.assertRaises(
+            exceptions.ResourceTimeout,
+            self.cloud.project_cleanup,
+            dry_run=False,
+            wait_timeout=0.1,
+            pipeline=True,
+        )
+        self.assertEqual([], self.deleted)
@@ -17,6 +17,7 @@ from unittest import mock
 import uuid
 import warnings
 
+from openstack import _cleanup
 from openstack.block_storage.v3 import volume
 from openstack.compute.v2 import _proxy
 from openstack.compute.v2 import aggregate
@@ -1106,6 +1107,20 @@ class TestCompute(TestComputeProxy):
             expected_kwargs={'callback': None},
         )
 
+    def test_servers_wait_for(self):
+        value = [server.Server(id='1234')]
+        self._verify(
+            'openstack.resource.wait_for_many',
+            self.proxy.wait_for_servers,
+            method_args=[value],
+            method_kwargs={'all_projects': True},
+            expected_args=[self.proxy, value, 'ACTIVE', None, 2, 120],
+            expected_kwargs={
+                'base_path': '/servers/detail',
+                'all_projects': True,
+            },
+        )
+
     def test_server_resize(self):
         self._verify(
             "openstack.compute.v2.server.Server.resize",
@@ -2004,3 +2019,46 @@ class TestServerShare(TestComputeProxy):
             method_kwargs={'server': 'server_id'},
             expected_kwargs={'server_id': 'server_id'},
         )
+
+
+class TestComputeCleanup(TestComputeProxy):
+    def setUp(self):
+        super().setUp()
+        self.session._sdk_connection = self.cloud
+        self.proxy.service_type = 'compute'
+        self.plan = _cleanup.CleanupPlan()
+        self.servers = [
+            server.Server(id='old'),
+            server.Server(id='new'),
+        ]
+        self.server_groups = [
+            server_group.ServerGroup(id='old-group', member_ids=['old']),
+            server_group.ServerGroup(id='new-group', member_ids=['new']),
+        ]
+        for name in ('servers', 'server_groups'):
+            patcher = mock.patch.object(
+                self.proxy, name, return_value=iter(getattr(self, name))
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_plan_cleanup(self):
+        self.proxy._plan_cleanup(self.plan)
+        self.plan.resolve(
+            resource_evaluation_fn=lambda obj, filters, ids: obj.id != 'new'
+        )
+
+        # Server groups are kept with their members
+        self.assertEqual(
+            [
+                ('compute.server:old', []),
+                ('compute.server_group:old-group', ['compute.server:old']),
+            ],
+            self.plan.get_steps(),
+        )
+        self.assertTrue(self.plan._nodes['compute.server:old'].wait)
+
+    def test_plan_cleanup_skip_resources(self):
+        self.proxy._plan_cleanup(self.plan, skip_resources=['compute.server'])
+
+        self.assertEqual([], self.plan.resolve())
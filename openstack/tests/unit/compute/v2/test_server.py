@@ -1598,3 +1598,15 @@ class TestServer(base.TestCase):
         self.sess.get.assert_called_with(url)
 
         self.assertEqual(sot.security_groups, sgs)
+
+    def test_dict_protocol(self):
+        sot = server.Server.existing(**EXAMPLE)
+
+        self.assertEqual(EXAMPLE['name'], sot.pop('name', 'MISSING'))
+        sot = server.Server.existing(**EXAMPLE)
+        self.assertEqual(EXAMPLE['name'], sot.setdefault('name', 'D'))
+        self.assertIn(('name', EXAMPLE['name']), list(dict.items(sot)))
+        self.assertEqual(sot.to_dict(), dict(dict.items(sot)))
+        self.assertEqual(EXAMPLE['name'], sot.copy()['name'])
+        self.assertEqual(sot, server.Server.existing(**EXAMPLE))
+        self.assertEqual(EXAMPLE['name'], dict.__getitem__(sot, 'name'))
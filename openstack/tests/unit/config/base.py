@@ -197,6 +197,8 @@ USER_CONF = {
                 'password': 'testpass',
             },
             'metrics': {
+                'async': True,
+                'batch_size': 10,
                 'statsd': {
                     'host': '127.0.0.1',
                     'port': 4321,
@@ -0,0 +1,168 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import datetime
+import json
+import os
+import stat
+
+import fixtures
+from keystoneauth1 import fixture as ks_fixture
+from requests_mock.contrib import fixture as rm_fixture
+
+from openstack.config import _auth_cache
+from openstack.config import loader
+from openstack import exceptions
+from openstack.tests.unit import base
+
+AUTH_URL = 'https://identity.example.com/v3'
+
+
+def _token(lifetime):
+    expires = datetime.datetime.now(datetime.UTC) + (
+        datetime.timedelta(seconds=lifetime)
+    )
+    return ks_fixture.V3Token(expires=expires)
+
+
+def _state(token, auth_token='token'):
+    return json.dumps({'auth_token': auth_token, 'body': token})
+
+
+class TestFileAuthCache(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = self.useFixture(fixtures.TempDir()).path
+        self.path = os.path.join(self.tmpdir, 'auth')
+
+    def test_get_set(self):
+        sot = _auth_cache.FileAuthCache(self.path)
+        self.assertIsNone(sot.get('cloud'))
+
+        sot.set('cloud', 'state')
+
+        other = _auth_cache.FileAuthCache(self.path)
+        self.assertEqual('state', other.get('cloud'))
+        self.assertIsNone(other.get('other'))
+
+    def test_permissions(self):
+        sot = _auth_cache.FileAuthCache(self.path)
+        with sot.lock('cloud'):
+            sot.set('cloud', 'state')
+
+        self.assertEqual(0o700, stat.S_IMODE(os.stat(self.path).st_mode))
+        for name in os.listdir(self.path):
+            mode = os.stat(os.path.join(self.path, name)).st_mode
+            self.assertEqual(0o600, stat.S_IMODE(mode))
+
+
+class TestDogpileAuthCache(base.TestCase):
+    def test_get_set(self):
+        sot = _auth_cache.DogpileAuthCache('dogpile.cache.memory', None)
+        self.assertIsNone(sot.get('cloud'))
+
+        with sot.lock('cloud'):
+            sot.set('cloud', 'state')
+
+        self.assertEqual('state', sot.get('cloud'))
+
+
+class TestIsFresh(base.TestCase):
+    def test_is_fresh(self):
+        self.assertTrue(_auth_cache.is_fresh(_state(_token(3600)), 300))
+        self.assertFalse(_auth_cache.is_fresh(_state(_token(200)), 300))
+        self.assertFalse(_auth_cache.is_fresh(None, 300))
+        self.assertFalse(_auth_cache.is_fresh('{', 300))
+
+
+class TestSharedAuth(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = self.useFixture(fixtures.TempDir()).path
+        self.requests_mock = self.useFixture(rm_fixture.Fixture())
+        self.auth_requests = 0
+        self.lifetime = 3600
+        self.requests_mock.post(
+            f'{AUTH_URL}/auth/tokens', json=self._authenticate
+        )
+
+    def _authenticate(self, request, context):
+        self.auth_requests += 1
+        context.headers['X-Subject-Token'] = f'token-{self.auth_requests}'
+        context.status_code = 201
+        return _token(self.lifetime)
+
+    def _get_region(self, backend='file'):
+        config_file = os.path.join(self.tmpdir, 'clouds.yaml')
+        with open(config_file, 'w') as fh:
+            json.dump(
+                {
+                    'cache': {
+                        'path': self.tmpdir,
+                        'auth': True,
+                        'auth_backend': backend,
+                        'class': 'dogpile.cache.memory',
+                    },
+                    'clouds': {
+                        'example': {
+                            'auth_type': 'v3password',
+                            'auth': {
+                                'auth_url': AUTH_URL,
+                                'username': 'user',
+                                'password': 'password',
+                                'user_domain_id': 'default',
+                            },
+                        },
+                    },
+                },
+                fh,
+            )
+        config = loader.OpenStackConfig(
+            config_files=[config_file],
+            vendor_files=[],
+            secure_files=[],
+            load_envvars=False,
+        )
+        return config.get_one(cloud='example')
+
+    def _token(self, region):
+        return region.get_session().get_token()
+
+    def test_shared(self):
+        self.assertEqual('token-1', self._token(self._get_region()))
+        self.assertEqual('token-1', self._token(self._get_region()))
+        self.assertEqual(1, self.auth_requests)
+
+    def test_refresh(self):
+        # Tokens valid for less than the refresh time are replaced, once
+        self.lifetime = 200
+        self.assertEqual('token-1', self._token(self._get_region()))
+        self.lifetime = 3600
+        self.assertEqual('token-2', self._token(self._get_region()))
+        self.assertEqual('token-2', self._token(self._get_region()))
+        self.assertEqual(2, self.auth_requests)
+
+    def test_reauthenticate(self):
+        # Running processes pick up tokens refreshed by others
+        region = self._get_region()
+        other = self._get_region()
+        self.lifetime = 200
+        self.assertEqual('token-1', self._token(region))
+        self.lifetime = 3600
+        self.assertEqual('token-2', self._token(other))
+        self.assertEqual('token-2', self._token(region))
+        self.assertEqual(2, self.auth_requests)
+
+    def test_invalid_backend(self):
+        self.assertRaises(
+            exceptions.ConfigException, self._get_region, 'invalid'
+        )
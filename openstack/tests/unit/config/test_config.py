@@ -674,6 +674,7 @@ class TestConfig(base.TestCase):
             'timeout': 10,
         }
         self.assertEqual(influxdb, cc._influxdb_config)
+        self.assertIsNone(cc.get_metrics_pipeline())
 
     def test_metrics_override(self):
         c = config.OpenStackConfig(
@@ -702,6 +703,9 @@ class TestConfig(base.TestCase):
             'timeout': 10,
         }
         self.assertEqual(influxdb, cc._influxdb_config)
+        pipeline = cc.get_metrics_pipeline()
+        self.assertIsNotNone(pipeline)
+        self.assertEqual(10, pipeline.batch_size)
 
 
 class TestExcludedFormattedConfigValue(base.TestCase):
@@ -0,0 +1,190 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+import os
+import time
+from unittest import mock
+
+import fixtures
+from requests_mock.contrib import fixture as rm_fixture
+
+from openstack.config import _discovery_cache
+from openstack.config import loader
+from openstack import connection
+from openstack.tests.unit import base
+
+ENDPOINT = 'https://network.example.com'
+VERSIONS = {
+    'versions': [
+        {
+            'id': 'v2.0',
+            'status': 'CURRENT',
+            'links': [{'href': f'{ENDPOINT}/v2.0', 'rel': 'self'}],
+        }
+    ]
+}
+
+
+class TestDiscoveryCache(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = self.useFixture(fixtures.TempDir()).path
+        self.path = _discovery_cache.get_path(
+            self.tmpdir, 'https://identity.example.com'
+        )
+
+    def _disc(self, url):
+        return _discovery_cache._CachedDiscover(url, VERSIONS['versions'])
+
+    def test_get_path(self):
+        self.assertEqual(
+            os.path.join(self.tmpdir, 'discovery'), os.path.dirname(self.path)
+        )
+        self.assertNotEqual(
+            self.path,
+            _discovery_cache.get_path(
+                self.tmpdir, 'https://other.example.com'
+            ),
+        )
+
+    def test_store_and_load(self):
+        sot = _discovery_cache.DiscoveryCache(self.path, 60)
+        self.assertEqual({}, sot)
+
+        sot[ENDPOINT] = self._disc(ENDPOINT)
+
+        other = _discovery_cache.DiscoveryCache(self.path, 60)
+        self.assertEqual([ENDPOINT], list(other))
+        self.assertEqual(
+            VERSIONS['versions'], other[ENDPOINT].raw_version_data()
+        )
+
+    def test_store_merges(self):
+        sot = _discovery_cache.DiscoveryCache(self.path, 60)
+        other = _discovery_cache.DiscoveryCache(self.path, 60)
+
+        sot[ENDPOINT] = self._disc(ENDPOINT)
+        other['https://compute.example.com'] = self._disc(
+            'https://compute.example.com'
+        )
+
+        self.assertEqual(
+            {ENDPOINT, 'https://compute.example.com'},
+            set(_discovery_cache.DiscoveryCache(self.path, 60)),
+        )
+
+    def test_store_only_new(self):
+        sot = _discovery_cache.DiscoveryCache(self.path, 60)
+        disc = self._disc(ENDPOINT)
+
+        with mock.patch.object(sot, '_store') as store:
+            sot[ENDPOINT] = disc
+            sot[ENDPOINT] = disc
+
+        store.assert_called_once_with(ENDPOINT, disc)
+
+    def test_expired(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as fh:
+            json.dump(
+                {
+                    ENDPOINT: {
+                        'time': time.time() - 120,
+                        'data': VERSIONS['versions'],
+                    }
+                },
+                fh,
+            )
+
+        self.assertEqual({}, _discovery_cache.DiscoveryCache(self.path, 60))
+        self.assertEqual(
+            [ENDPOINT], list(_discovery_cache.DiscoveryCache(self.path, -1))
+        )
+
+    def test_invalid_file(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as fh:
+            fh.write('{')
+
+        sot = _discovery_cache.DiscoveryCache(self.path, 60)
+        self.assertEqual({}, sot)
+
+        sot[ENDPOINT] = self._disc(ENDPOINT)
+        self.assertEqual(
+            [ENDPOINT], list(_discovery_cache.DiscoveryCache(self.path, 60))
+        )
+
+
+class TestConnectionDiscoveryCache(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = self.useFixture(fixtures.TempDir()).path
+        self.requests_mock = self.useFixture(rm_fixture.Fixture())
+        self.requests_mock.get(f'{ENDPOINT}/', json=VERSIONS)
+        self.requests_mock.get(f'{ENDPOINT}/v2.0', json=VERSIONS)
+        self.requests_mock.get(
+            f'{ENDPOINT}/v2.0/networks', json={'networks': []}
+        )
+
+    def _connect(self, discovery_expiration_time):
+        config_file = os.path.join(self.tmpdir, 'clouds.yaml')
+        with open(config_file, 'w') as fh:
+            json.dump(
+                {
+                    'cache': {
+                        'path': self.tmpdir,
+                        'discovery_expiration_time': (
+                            discovery_expiration_time
+                        ),
+                    },
+                    'clouds': {
+                        'example': {
+                            'auth_type': 'none',
+                            'network_endpoint_override': ENDPOINT,
+                        },
+                    },
+                },
+                fh,
+            )
+        config = loader.OpenStackConfig(
+            config_files=[config_file],
+            vendor_files=[],
+            secure_files=[],
+            load_envvars=False,
+        )
+        return connection.Connection(config=config.get_one(cloud='example'))
+
+    def _discoveries(self):
+        return [
+            request
+            for request in self.requests_mock.request_history
+            if not request.path.endswith('/networks')
+        ]
+
+    def test_shared(self):
+        list(self._connect(60).network.networks())
+        discoveries = len(self._discoveries())
+        self.assertNotEqual(0, discoveries)
+
+        list(self._connect(60).network.networks())
+        self.assertEqual(discoveries, len(self._discoveries()))
+
+    def test_disabled(self):
+        list(self._connect(0).network.networks())
+        discoveries = len(self._discoveries())
+
+        list(self._connect(0).network.networks())
+        self.assertEqual(2 * discoveries, len(self._discoveries()))
+        self.assertFalse(
+            os.path.exists(os.path.join(self.tmpdir, 'discovery'))
+        )
@@ -15,7 +15,11 @@
 import os
 import tempfile
 import textwrap
+from unittest import mock
 
+import fixtures
+
+from openstack.config import _compiled
 from openstack.config import loader
 from openstack import exceptions
 from openstack.tests.unit.config import base
@@ -126,6 +130,75 @@ class TestLoader(base.TestCase):
         self.assertEqual(None, path)
 
 
+class TestCompiledConfig(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = self.useFixture(fixtures.TempDir()).path
+        self.cache_path = os.path.join(self.tmpdir, 'compiled')
+        self.path = os.path.join(self.tmpdir, 'clouds.yaml')
+        self._write(FILES['yaml'])
+
+    def _write(self, content):
+        with open(self.path, 'w') as fh:
+            fh.write(content)
+
+    def _load(self):
+        with open(self.path) as fh:
+            return _compiled.load(fh, self.cache_path)
+
+    def test_load(self):
+        with mock.patch.object(
+            _compiled, 'load_yaml', wraps=_compiled.load_yaml
+        ) as load_yaml:
+            self.assertEqual({'foo': 'bar', 'baz': [1, 2, 3]}, self._load())
+            self.assertEqual({'foo': 'bar', 'baz': [1, 2, 3]}, self._load())
+
+        load_yaml.assert_called_once()
+        self.assertEqual(1, len(os.listdir(self.cache_path)))
+
+    def test_load_changed(self):
+        self._load()
+        self._write('foo: baz\n')
+
+        self.assertEqual({'foo': 'baz'}, self._load())
+
+    def test_load_not_json(self):
+        self._write('foo: 2024-01-01\n1: bar\n')
+
+        self.assertEqual(2, len(self._load()))
+        self.assertFalse(os.path.exists(self.cache_path))
+
+        self._write('1: bar\n')
+
+        self.assertEqual({1: 'bar'}, self._load())
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_load_invalid_compiled(self):
+        self._load()
+        (compiled,) = os.listdir(self.cache_path)
+        with open(os.path.join(self.cache_path, compiled), 'w') as fh:
+            fh.write('{')
+
+        self.assertEqual({'foo': 'bar', 'baz': [1, 2, 3]}, self._load())
+
+    def test_config(self):
+        self._write(
+            'clouds:\n  _test_cloud_:\n    auth:\n      auth_url: http://x\n'
+        )
+        self.useFixture(
+            fixtures.EnvironmentVariable(
+                'OS_CLIENT_CONFIG_CACHE', self.cache_path
+            )
+        )
+
+        for _ in range(2):
+            config = loader.OpenStackConfig(
+                config_files=[self.path], secure_files=[], vendor_files=[]
+            )
+            self.assertEqual(['_test_cloud_'], config.get_cloud_names())
+        self.assertEqual(1, len(os.listdir(self.cache_path)))
+
+
 class TestFixArgv(base.TestCase):
     def test_no_changes(self):
         argv = [
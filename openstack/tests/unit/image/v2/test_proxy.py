@@ -719,6 +719,17 @@ class TestImage(TestImageProxy):
     def test_images(self):
         self.verify_list(self.proxy.images, _image.Image)
 
+    def test_images_partitions(self):
+        partitions = [{'visibility': 'public'}, {'visibility': 'private'}]
+        self.verify_list(
+            self.proxy.images,
+            _image.Image,
+            method_kwargs={'partitions': partitions},
+            expected_args=[partitions],
+            expected_kwargs={},
+            mock_method='openstack.proxy.Proxy._parallel_list',
+        )
+
     def test_add_tag(self):
         self._verify(
             "openstack.image.v2.image.Image.add_tag",
@@ -0,0 +1,185 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from unittest import mock
+
+from openstack.message.v2 import claim
+from openstack.message.v2 import event_source
+from openstack import resource
+from openstack.tests.unit import base
+
+CLAIM_ID = '576b54963990b48c644bb7e7'
+
+
+class TestParseEvent(base.TestCase):
+    def test_attributes(self):
+        self.assertEqual(
+            ('Server', 'a', {'status': 'ACTIVE'}),
+            event_source.parse_event(
+                {
+                    'resource_type': 'Server',
+                    'id': 'a',
+                    'attributes': {'status': 'ACTIVE'},
+                }
+            ),
+        )
+
+    def test_deleted(self):
+        self.assertEqual(
+            ('Server', 'a', None),
+            event_source.parse_event(
+                {'resource_type': 'Server', 'id': 'a', 'deleted': True}
+            ),
+        )
+
+    def test_invalid(self):
+        self.assertIsNone(event_source.parse_event('event'))
+        self.assertIsNone(event_source.parse_event({'id': 'a'}))
+        self.assertIsNone(
+            event_source.parse_event({'resource_type': 'Server', 'id': 'a'})
+        )
+
+
+class TestMessageEventSource(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.registry = mock.Mock(spec=resource.WaiterRegistry)
+        self.proxy = mock.Mock()
+        self.sot = event_source.MessageEventSource(
+            self.registry, self.proxy, 'events', interval=0
+        )
+
+    def test_poll(self):
+        self.proxy.create_claim.return_value = claim.Claim(
+            id=CLAIM_ID,
+            messages=[
+                {
+                    'id': '1',
+                    'body': {
+                        'resource_type': 'Server',
+                        'id': 'a',
+                        'attributes': {'status': 'ACTIVE'},
+                    },
+                },
+                {
+                    'href': (
+                        f'/v2/queues/events/messages/2?claim_id={CLAIM_ID}'
+                    ),
+                    'body': {
+                        'resource_type': 'Volume',
+                        'id': 'b',
+                        'deleted': True,
+                    },
+                },
+                {'id': '3', 'body': 'not an event'},
+            ],
+        )
+
+        self.sot.poll()
+
+        self.proxy.create_claim.assert_called_once_with(
+            'events', limit=20, ttl=60, grace=60
+        )
+        self.registry.publish.assert_has_calls(
+            [
+                mock.call('Server', 'a', {'status': 'ACTIVE'}),
+                mock.call('Volume', 'b', None),
+            ]
+        )
+        self.assertEqual(2, self.registry.publish.call_count)
+        self.proxy.delete_message.assert_has_calls(
+            [
+                mock.call('events', message_id, claim=CLAIM_ID)
+                for message_id in ('1', '2')
+            ]
+        )
+        self.assertEqual(2, self.proxy.delete_message.call_count)
+
+    def test_poll_not_waited_on(self):
+        # Changes no waiter of this process waits on are left in the queue
+        self.registry.publish.return_value = False
+        self.proxy.create_claim.return_value = claim.Claim(
+            id=CLAIM_ID,
+            messages=[
+                {
+                    'id': '1',
+                    'body': {
+                        'resource_type': 'Server',
+                        'id': 'a',
+                        'attributes': {'status': 'ACTIVE'},
+                    },
+                },
+            ],
+        )
+
+        self.sot.poll()
+
+        self.registry.publish.assert_called_once_with(
+            'Server', 'a', {'status': 'ACTIVE'}
+        )
+        self.proxy.delete_message.assert_not_called()
+
+    def test_poll_empty(self):
+        self.proxy.create_claim.return_value = claim.Claim()
+
+        self.sot.poll()
+
+        self.registry.publish.assert_not_called()
+        self.proxy.delete_message.assert_not_called()
+
+
+class FakeQueue:
+    """A queue whose claims expire as soon as they are made."""
+
+    def __init__(self, messages):
+        self.messages = messages
+
+    def create_claim(self, queue_name, **kwargs):
+        return claim.Claim(id=CLAIM_ID, messages=list(self.messages))
+
+    def delete_message(self, queue_name, message_id, claim=None):
+        self.messages = [
+            message for message in self.messages if message['id'] != message_id
+        ]
+
+
+class TestMessageEventSourceShared(base.TestCase):
+    def test_poll(self):
+        # Sources of several processes read the same queue
+        queue = FakeQueue(
+            [
+                {
+                    'id': '1',
+                    'body': {
+                        'resource_type': 'Server',
+                        'id': 'a',
+                        'attributes': {'status': 'ACTIVE'},
+                    },
+                },
+            ]
+        )
+        idle = resource.WaiterRegistry()
+        waiting = resource.WaiterRegistry()
+        idle_source = event_source.MessageEventSource(
+            idle, queue, 'events', interval=0
+        )
+        waiting_source = event_source.MessageEventSource(
+            waiting, queue, 'events', interval=0
+        )
+
+        with waiting.watch('Server', 'a') as watch:
+            idle_source.poll()
+            self.assertEqual(1, len(queue.messages))
+
+            waiting_source.poll()
+            self.assertEqual({'status': 'ACTIVE'}, watch.get_nowait())
+            self.assertEqual([], queue.messages)
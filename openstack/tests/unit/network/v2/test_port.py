@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import json
+
 from openstack.network.v2 import port
 from openstack.tests.unit import base
 
@@ -173,3 +175,16 @@ class TestPort(base.TestCase):
         self.assertEqual(EXAMPLE['trunk_details'], sot.trunk_details)
         self.assertEqual(EXAMPLE['trusted'], sot.trusted)
         self.assertEqual(EXAMPLE['updated_at'], sot.updated_at)
+
+    def test_dict_protocol(self):
+        sot = port.Port.existing(**EXAMPLE)
+
+        self.assertEqual(EXAMPLE['name'], sot.pop('name', 'MISSING'))
+        sot = port.Port.existing(**EXAMPLE)
+        self.assertEqual(EXAMPLE['name'], sot.setdefault('name', 'D'))
+        self.assertIn(('name', EXAMPLE['name']), list(dict.items(sot)))
+        self.assertEqual(sot.to_dict(), dict(dict.items(sot)))
+        self.assertEqual(EXAMPLE['name'], sot.copy()['name'])
+        self.assertEqual(sot, port.Port.existing(**EXAMPLE))
+        self.assertEqual(EXAMPLE['name'], dict.__getitem__(sot, 'name'))
+        self.assertEqual(EXAMPLE['name'], json.loads(json.dumps(sot))['name'])
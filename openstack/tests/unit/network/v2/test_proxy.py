@@ -13,6 +13,9 @@
 from unittest import mock
 import uuid
 
+from openstack import _cleanup
+from openstack.compute.v2 import _proxy as compute_proxy
+from openstack.compute.v2 import server
 from openstack import exceptions
 from openstack.network.v2 import _proxy
 from openstack.network.v2 import address_group
@@ -2993,3 +2996,170 @@ class TestNetworkPortBinding(TestNetworkProxy):
         delete_port_binding.assert_called_once_with(
             port_binding.PortBinding, data
         )
+
+
+class TestNetworkCleanup(TestNetworkProxy):
+    def setUp(self):
+        super().setUp()
+        self.session._sdk_connection = self.cloud
+        self.proxy.service_type = 'network'
+        self.plan = _cleanup.CleanupPlan()
+        self.resources = {
+            'networks': [
+                network.Network(id='net', created_at='2019-01-01T00:00:00Z')
+            ],
+            'subnets': [subnet.Subnet(id='sub', network_id='net')],
+            'routers': [
+                router.Router(id='rtr', created_at='2019-01-01T00:00:00Z')
+            ],
+            'ports': [
+                port.Port(
+                    id='rtr-if',
+                    network_id='net',
+                    device_owner='network:router_interface',
+                    device_id='rtr',
+                    fixed_ips=[{'subnet_id': 'sub'}],
+                ),
+                port.Port(
+                    id='dhcp',
+                    network_id='net',
+                    device_owner='network:dhcp',
+                ),
+            ],
+            'ips': [],
+            'security_groups': [
+                security_group.SecurityGroup(id='default', name='default'),
+                security_group.SecurityGroup(
+                    id='sg', name='sg', created_at='2019-01-01T00:00:00Z'
+                ),
+            ],
+            'service_providers': [],
+        }
+        for name in self.resources:
+            patcher = mock.patch.object(
+                self.proxy,
+                name,
+                side_effect=lambda *args, _name=name, **kwargs: iter(
+                    self.resources[_name]
+                ),
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(
+            self.proxy, 'get_project_id', return_value='project'
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _resolve(self, **kwargs):
+        self.proxy._plan_cleanup(self.plan)
+        self.plan.resolve(
+            filters={'created_at': '2020-01-01T00:00:00Z'}, **kwargs
+        )
+        return dict(self.plan.get_steps())
+
+    def test_plan_cleanup(self):
+        steps = self._resolve()
+
+        self.assertEqual(
+            {
+                'network.network:net': [
+                    'network.router_interface:rtr-if',
+                    'network.subnet:sub',
+                ],
+                'network.subnet:sub': ['network.router_interface:rtr-if'],
+                'network.router_interface:rtr-if': [],
+                'network.router:rtr': ['network.router_interface:rtr-if'],
+                'network.security_group:sg': [],
+            },
+            steps,
+        )
+
+    def test_plan_cleanup_filtered(self):
+        # Networks, and routers deleted with them, are selected by the
+        # filters
+        self.resources['networks'][0].created_at = '2030-01-01T00:00:00Z'
+        self.resources['routers'][0].created_at = '2030-01-01T00:00:00Z'
+
+        steps = self._resolve()
+
+        self.assertEqual(['network.security_group:sg'], list(steps))
+
+    def test_plan_cleanup_router_without_interfaces(self):
+        self.resources['routers'] = [
+            router.Router(id='old', created_at='2019-01-01T00:00:00Z'),
+            router.Router(id='new', created_at='2030-01-01T00:00:00Z'),
+        ]
+
+        steps = self._resolve()
+
+        self.assertIn('network.router:old', steps)
+        self.assertNotIn('network.router:new', steps)
+
+    def test_plan_cleanup_router_interface_kept(self):
+        # Routers are kept while any of their interfaces is
+        self.resources['networks'].append(
+            network.Network(id='other', created_at='2030-01-01T00:00:00Z')
+        )
+        self.resources['ports'].append(
+            port.Port(
+                id='other-if',
+                network_id='other',
+                device_owner='network:router_interface',
+                device_id='rtr',
+            )
+        )
+
+        steps = self._resolve()
+
+        self.assertIn('network.router_interface:rtr-if', steps)
+        self.assertNotIn('network.router_interface:other-if', steps)
+        self.assertNotIn('network.router:rtr', steps)
+
+    def test_plan_cleanup_floating_ip(self):
+        self.resources['ports'].append(
+            port.Port(id='port', network_id='net', device_owner='')
+        )
+        self.resources['ips'] = [
+            floating_ip.FloatingIP(id='fip', port_id='port', router_id='rtr')
+        ]
+
+        steps = self._resolve()
+
+        self.assertEqual(
+            ['network.port:port'], steps['network.floating_ip:fip']
+        )
+        self.assertIn(
+            'network.floating_ip:fip', steps['network.router_interface:rtr-if']
+        )
+
+    def test_plan_cleanup_compute_port(self):
+        self.resources['ports'].append(
+            port.Port(
+                id='port',
+                network_id='net',
+                device_owner='compute:nova',
+                device_id='srv',
+            )
+        )
+
+        # The port of a server which is not cleaned up keeps the network
+        steps = self._resolve()
+
+        self.assertEqual(['network.security_group:sg'], list(steps))
+
+        # The port is deleted once the server is gone
+        self.plan = _cleanup.CleanupPlan()
+        compute = compute_proxy.Proxy(self.session)
+        compute.service_type = 'compute'
+        self.plan.add_resource(
+            compute,
+            'server',
+            server.Server(id='srv', created_at='2019-01-01T00:00:00Z'),
+            compute.delete_server,
+        )
+
+        steps = self._resolve()
+
+        self.assertEqual(['compute.server:srv'], steps['network.port:port'])
+        self.assertIn('network.network:net', steps)
@@ -69,6 +69,7 @@ class TestObject(base_test_object.BaseTestObject):
 
         self.assertDictEqual(
             {
+                'end_marker': 'end_marker',
                 'filename': 'filename',
                 'format': 'format',
                 'limit': 'limit',
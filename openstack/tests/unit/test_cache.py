@@ -0,0 +1,175 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from unittest import mock
+
+from openstack import _cache
+from openstack.tests.unit import base
+
+
+class TestCacheKeyIndex(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.on_evict = mock.Mock()
+        self.sot = _cache.CacheKeyIndex(max_size=3, on_evict=self.on_evict)
+
+    def test_add(self):
+        self.sot.add('compute.server.servers/1', 'compute.server')
+        self.sot.add('compute.server.servers/1', 'compute.server')
+
+        self.assertIn('compute.server.servers/1', self.sot)
+        self.assertNotIn('compute.server.servers/2', self.sot)
+        self.assertEqual(['compute.server.servers/1'], list(self.sot))
+
+    def test_pop_prefix(self):
+        self.sot.max_size = None
+        self.sot.add('server-1', 'compute.server')
+        self.sot.add('server-1-interfaces', 'compute.server.os-interface')
+        self.sot.add('servers', 'compute.servers')
+        self.sot.add('flavors', 'compute.flavors')
+        self.sot.add('ports', 'network.ports')
+
+        self.assertEqual(
+            {'server-1', 'server-1-interfaces', 'servers'},
+            set(self.sot.pop_prefix('compute.server')),
+        )
+        self.assertEqual({'flavors', 'ports'}, set(self.sot))
+        self.assertEqual([], self.sot.pop_prefix('compute.server'))
+        self.assertEqual([], self.sot.pop_prefix('image.images'))
+        self.assertEqual(['ports'], self.sot.pop_prefix('network.ports'))
+
+    def test_discard(self):
+        self.sot.add('server-1', 'compute.server')
+        self.sot.add('server-2', 'compute.server')
+
+        self.sot.discard('server-1')
+        self.sot.discard('server-1')
+
+        self.assertEqual(['server-2'], list(self.sot))
+        self.sot.discard('server-2')
+        self.assertEqual({}, self.sot._root.children)
+
+    def test_evict(self):
+        for index in range(3):
+            self.sot.add(f'server-{index}', 'compute.server')
+        # Storing a key again makes it the most recently used one
+        self.sot.add('server-0', 'compute.server')
+
+        self.sot.add('server-3', 'compute.server')
+
+        self.on_evict.assert_called_once_with('server-1')
+        self.assertEqual(3, len(self.sot))
+        self.assertEqual(
+            {'server-0', 'server-2', 'server-3'},
+            set(self.sot.pop_prefix('compute.server')),
+        )
+
+
+class TestMakeCacheKey(base.TestCase):
+    def test_canonical(self):
+        key = _cache.make_cache_key(
+            'compute.servers',
+            'servers?limit=10&all_tenants=1',
+            {
+                'params': {'name': 'foo', 'status': 'ACTIVE'},
+                'headers': {
+                    'Accept': 'application/json',
+                    'User-Agent': 'foo',
+                },
+                'microversion': '2.1',
+            },
+        )
+
+        self.assertTrue(key.startswith('compute.servers.'))
+        self.assertEqual(len('compute.servers.') + 64, len(key))
+        self.assertEqual(
+            key,
+            _cache.make_cache_key(
+                'compute.servers',
+                'servers?all_tenants=1&limit=10',
+                {
+                    'microversion': '2.1',
+                    'headers': {
+                        'X-Openstack-Request-Id': 'req-1',
+                        'accept': 'application/json',
+                    },
+                    'params': {'status': 'ACTIVE', 'name': 'foo'},
+                    'global_request_id': 'req-2',
+                },
+            ),
+        )
+
+    def test_relevant_differences(self):
+        base_kwargs = {'params': {'name': 'foo'}, 'microversion': '2.1'}
+        key = _cache.make_cache_key('compute.servers', 'servers', base_kwargs)
+
+        for url, kwargs in [
+            ('servers/detail', base_kwargs),
+            ('servers', {'params': {'name': 'bar'}, 'microversion': '2.1'}),
+            ('servers', {'params': {'name': 'foo'}, 'microversion': '2.2'}),
+            (
+                'servers',
+                dict(
+                    base_kwargs,
+                    headers={'OpenStack-API-Version': 'compute 2.5'},
+                ),
+            ),
+            ('servers', dict(base_kwargs, headers={'Range': 'bytes=0-9'})),
+            ('servers', dict(base_kwargs, headers={'If-Match': '"v1"'})),
+        ]:
+            self.assertNotEqual(
+                key, _cache.make_cache_key('compute.servers', url, kwargs)
+            )
+
+    def test_list_params(self):
+        key = _cache.make_cache_key(
+            'network.ports', 'ports?sort_key=name&sort_key=id', {}
+        )
+
+        self.assertEqual(
+            key,
+            _cache.make_cache_key(
+                'network.ports',
+                'ports',
+                {'params': {'sort_key': ['name', 'id'], 'name': None}},
+            ),
+        )
+        self.assertNotEqual(
+            key,
+            _cache.make_cache_key(
+                'network.ports',
+                'ports',
+                {'params': {'sort_key': ['id', 'name']}},
+            ),
+        )
+
+
+class TestCacheStats(base.TestCase):
+    def test_stats(self):
+        sot = _cache.CacheStats()
+
+        sot.record('hits')
+        sot.record('hits')
+        sot.record('invalidations', 3)
+
+        self.assertEqual(
+            {
+                'hits': 2,
+                'misses': 0,
+                'evictions': 0,
+                'invalidations': 3,
+                'revalidations': 0,
+            },
+            sot.get(),
+        )
+        sot.reset()
+        self.assertEqual(0, sum(sot.get().values()))
@@ -0,0 +1,300 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import queue
+import threading
+from unittest import mock
+
+from openstack import _cleanup
+from openstack import proxy
+from openstack import resource
+from openstack.tests.unit import base
+
+
+class TestCleanupPlan(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.session = mock.Mock()
+        self.session._sdk_connection = self.cloud
+        self.compute = proxy.Proxy(self.session)
+        self.compute.service_type = 'compute'
+        self.network = proxy.Proxy(self.session)
+        self.network.service_type = 'network'
+
+        self.deleted = []
+        self.lock = threading.Lock()
+        self.sot = _cleanup.CleanupPlan()
+
+    def _delete(self, res):
+        with self.lock:
+            self.deleted.append(res.id)
+
+    def _resource(self, res_id):
+        res = mock.Mock(spec=resource.Resource)
+        res.id = res_id
+        return res
+
+    def _add_network(self, server_required=True):
+        # A server with a port on the subnet of a network
+        self.sot.add_resource(
+            self.compute, 'server', self._resource('s'), self._delete
+        )
+        for name in ('port', 'subnet'):
+            self.sot.add_resource(
+                self.network,
+                name,
+                self._resource(name),
+                self._delete,
+                evaluate=False,
+                owner='network.network:net',
+            )
+        self.sot.add_resource(
+            self.network, 'network', self._resource('net'), self._delete
+        )
+        self.sot.add_dependency(
+            'compute.server:s', 'network.port:port', required=server_required
+        )
+        self.sot.add_dependency('network.port:port', 'network.subnet:subnet')
+        self.sot.add_dependency('network.port:port', 'network.network:net')
+        self.sot.add_dependency('network.subnet:subnet', 'network.network:net')
+
+    def test_key(self):
+        self.assertEqual(
+            'compute.server:id',
+            _cleanup.CleanupPlan.key('compute', 'server', 'id'),
+        )
+
+    def test_resolve(self):
+        self._add_network()
+        identified = {}
+
+        steps = self.sot.resolve(identified_resources=identified)
+
+        self.assertEqual(
+            [
+                'compute.server:s',
+                'network.port:port',
+                'network.subnet:subnet',
+                'network.network:net',
+            ],
+            steps,
+        )
+        self.assertEqual({'s', 'port', 'subnet', 'net'}, set(identified))
+        self.assertEqual(
+            [
+                ('compute.server:s', []),
+                ('network.port:port', ['compute.server:s']),
+                ('network.subnet:subnet', ['network.port:port']),
+                (
+                    'network.network:net',
+                    ['network.port:port', 'network.subnet:subnet'],
+                ),
+            ],
+            self.sot.get_steps(),
+        )
+
+    def test_resolve_kept(self):
+        # Resources used by kept resources are kept, and so are resources
+        # deleted with them
+        self._add_network()
+        self.sot.add_resource(
+            self.compute, 'server', self._resource('other'), self._delete
+        )
+        identified = {}
+
+        steps = self.sot.resolve(
+            resource_evaluation_fn=lambda obj, filters, ids: obj.id != 's',
+            identified_resources=identified,
+        )
+
+        self.assertEqual(['compute.server:other'], steps)
+        self.assertEqual({'other'}, set(identified))
+
+    def test_resolve_owner_kept(self):
+        self._add_network()
+
+        steps = self.sot.resolve(
+            resource_evaluation_fn=lambda obj, filters, ids: obj.id != 'net'
+        )
+
+        self.assertEqual(['compute.server:s'], steps)
+
+    def test_resolve_required_missing(self):
+        self._add_network()
+        self.sot.add_resource(
+            self.network,
+            'port',
+            self._resource('lb-port'),
+            self._delete,
+            evaluate=False,
+            owner='network.network:net',
+        )
+        self.sot.add_dependency(
+            'load_balancer.load_balancer:lb',
+            'network.port:lb-port',
+            required=True,
+        )
+        self.sot.add_dependency('network.port:lb-port', 'network.network:net')
+
+        # The port of the unknown load balancer keeps the network, and so
+        # the port and subnet deleted with it
+        steps = self.sot.resolve()
+
+        self.assertEqual(['compute.server:s'], steps)
+
+    def test_resolve_keep(self):
+        self._add_network()
+        self.sot.add_resource(
+            self.network,
+            'subnet',
+            self._resource('subnet'),
+            self._delete,
+            evaluate=False,
+            owner='network.network:net',
+            keep=True,
+        )
+
+        steps = self.sot.resolve()
+
+        self.assertEqual(['compute.server:s'], steps)
+
+    def test_service_dependencies(self):
+        self._add_network()
+        self.sot.add_resource(
+            self.compute, 'server', self._resource('other'), self._delete
+        )
+        cleanup = mock.Mock()
+        self.sot.add_service('dns', cleanup)
+        self.sot.add_service_dependency('dns', 'network')
+        # Planned services are ordered by their resources only
+        self.sot.add_service_dependency('compute', 'network')
+
+        self.sot.resolve()
+
+        steps = dict(self.sot.get_steps())
+        self.assertEqual([], steps['dns'])
+        self.assertEqual(
+            ['compute.server:s', 'dns'], steps['network.port:port']
+        )
+        self.assertEqual(
+            ['dns', 'network.port:port'], steps['network.subnet:subnet']
+        )
+        self.assertEqual(
+            ['dns', 'network.port:port', 'network.subnet:subnet'],
+            steps['network.network:net'],
+        )
+
+    def test_execute(self):
+        self._add_network()
+        self.sot.add_resource(
+            self.compute, 'server', self._resource('other'), self._delete
+        )
+        cleanup = mock.Mock()
+        self.sot.add_service('dns', cleanup)
+        self.sot.add_service_dependency('dns', 'network')
+        self.sot.resolve()
+
+        self.sot.execute(dry_run=False)
+
+        cleanup.assert_called_once_with()
+        self.assertEqual(
+            {'s', 'other', 'port', 'subnet', 'net'}, set(self.deleted)
+        )
+        for before, after in (('s', 'port'), ('port', 'subnet')):
+            self.assertLess(
+                self.deleted.index(before), self.deleted.index(after)
+            )
+        self.assertEqual('net', self.deleted[-1])
+
+    def test_execute_dry_run(self):
+        self._add_network()
+        cleanup = mock.Mock()
+        self.sot.add_service('dns', cleanup)
+        self.sot.resolve()
+        status_queue = queue.Queue()
+
+        self.sot.report(status_queue)
+        self.sot.execute(dry_run=True)
+
+        cleanup.assert_called_once_with()
+        self.assertEqual([], self.deleted)
+        self.assertEqual(4, status_queue.qsize())
+
+    @mock.patch.object(_cleanup, 'LOG', autospec=True)
+    def test_execute_failure(self, mock_log):
+        # Resources depending on resources which could not be deleted are
+        # kept
+        self._add_network()
+        self.sot.add_resource(
+            self.compute, 'server', self._resource('other'), self._delete
+        )
+
+        def delete(res):
+            raise Exception('boom')
+
+        self.sot._nodes['compute.server:s'].delete = delete
+        self.sot.resolve()
+
+        self.sot.execute(dry_run=False)
+
+        self.assertEqual(['other'], self.deleted)
+        mock_log.exception.assert_called_once_with(
+            'Cannot clean up %s', 'compute.server:s'
+        )
+        self.assertEqual(3, mock_log.warning.call_count)
+
+    @mock.patch.object(resource, 'wait_for_delete', autospec=True)
+    def test_execute_wait(self, mock_wait):
+        server = self._resource('s')
+        self.sot.add_resource(
+            self.compute, 'server', server, self._delete, wait=True
+        )
+        self.sot.resolve()
+
+        self.sot.execute(dry_run=False, timeout=60)
+
+        mock_wait.assert_called_once_with(self.compute, server, 2, 60)
+
+    def test_add_service_drops_resources(self):
+        self._add_network()
+        cleanup = mock.Mock()
+        self.sot.add_service('network', cleanup)
+
+        steps = self.sot.resolve()
+
+        # The port of the server is kept with the resources of the network
+        self.assertEqual(['compute.server:s', 'network'], steps)
+
+    def test_execute_per_service(self):
+        # Resources of a service waiting for their turn do not hold up
+        # those of other services
+        network_deleted = threading.Event()
+        waited = []
+
+        def delete_server(res):
+            waited.append(network_deleted.wait(2))
+
+        for res_id in ('a', 'b'):
+            self.sot.add_resource(
+                self.compute, 'server', self._resource(res_id), delete_server
+            )
+        self.sot.add_resource(
+            self.network,
+            'network',
+            self._resource('net'),
+            lambda res: network_deleted.set(),
+        )
+        self.sot.resolve()
+
+        self.sot.execute(dry_run=False)
+
+        self.assertEqual([True, True], waited)
@@ -11,6 +11,8 @@
 # under the License.
 
 import os
+import subprocess
+import sys
 from unittest import mock
 
 import fixtures
@@ -21,10 +23,12 @@ import os_service_types
 
 import openstack.config
 from openstack import connection
+from openstack import exceptions
 from openstack import proxy
 from openstack import service_description
 from openstack.tests.unit import base
 from openstack.tests.unit.fake import fake_service
+from openstack.tests.unit.fake.v1 import _proxy as _fake_proxy_1
 
 
 CONFIG_AUTH_URL = "https://identity.example.com/"
@@ -562,6 +566,103 @@ class TestNewService(base.TestCase):
         self.assertFalse(conn.dns.dummy())
 
 
+class TestWarmup(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.use_keystone_v3()
+        self.register_uris(
+            [
+                self.get_nova_discovery_mock_dict(),
+                self.get_glance_discovery_mock_dict(),
+            ]
+        )
+
+    def test_warmup(self):
+        latencies = self.cloud.warmup(['compute', 'image'])
+
+        self.assertEqual({'compute', 'image'}, set(latencies))
+        self.assertEqual({'compute', 'image'}, set(self.cloud._proxies))
+        self.assertIs(self.cloud._proxies['compute'], self.cloud.compute)
+        self.assertEqual(
+            'openstack.image.v2._proxy', self.cloud.image.__class__.__module__
+        )
+
+    def test_warmup_alias(self):
+        latencies = self.cloud.warmup(['compute', 'compute'])
+
+        self.assertEqual(['compute'], list(latencies))
+
+    def test_warmup_catalog(self):
+        catalog = mock.Mock()
+        catalog.get_endpoints.return_value = {'compute': [], 'ec2': []}
+        with mock.patch.object(
+            self.cloud.config, 'get_service_catalog', return_value=catalog
+        ):
+            latencies = self.cloud.warmup()
+
+        self.assertEqual(['compute'], list(latencies))
+
+    def test_warmup_unknown(self):
+        self.assertRaises(ValueError, self.cloud.warmup, ['ec2'])
+
+    def test_warmup_failure(self):
+        with mock.patch.object(
+            service_description.ServiceDescription,
+            '_make_proxy',
+            side_effect=exceptions.SDKException('boom'),
+        ):
+            latencies = self.cloud.warmup(['compute'])
+
+        self.assertEqual({}, latencies)
+        self.assertNotIn('compute', self.cloud._proxies)
+
+
+class TestProxyVersions(base.TestCase):
+    def test_lazy(self):
+        versions = service_description.ProxyVersions(
+            {
+                '1': 'openstack.tests.unit.fake.v1._proxy.Proxy',
+                '2': 'openstack.tests.unit.fake.v9._proxy.Proxy',
+            }
+        )
+
+        # Looking versions up without their proxy does not import them
+        self.assertIn('2', versions)
+        self.assertNotIn('3', versions)
+        self.assertEqual(['1', '2'], list(versions))
+        self.assertEqual(2, len(versions))
+
+        self.assertIs(_fake_proxy_1.Proxy, versions['1'])
+        self.assertIs(_fake_proxy_1.Proxy, versions.get('1'))
+        self.assertIsNone(versions.get('3'))
+        self.assertRaises(ImportError, versions.__getitem__, '2')
+
+    def test_import_skips_proxies(self):
+        # Use a new interpreter, as this one has imported everything already
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                '-c',
+                'import sys, openstack; '
+                'print([m for m in sys.modules if m.endswith("._proxy")])',
+            ],
+            text=True,
+        )
+        self.assertEqual('[]', output.strip())
+
+    def test_import_submodule_attributes(self):
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                '-c',
+                'import openstack; '
+                'print(openstack.dns.v2._base.Resource.__name__)',
+            ],
+            text=True,
+        )
+        self.assertEqual('Resource', output.strip())
+
+
 def vendor_hook(conn):
     setattr(conn, 'test', 'test_val')
 
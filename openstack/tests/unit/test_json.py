@@ -0,0 +1,108 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import datetime
+import json
+from unittest import mock
+import uuid
+
+from openstack import _json
+from openstack import exceptions
+from openstack.tests.unit import base
+
+
+class TestGetBackend(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        _json.get_backend.cache_clear()
+        self.addCleanup(_json.get_backend.cache_clear)
+
+    def test_default(self):
+        self.assertIs(_json.DEFAULT_BACKEND, _json.get_backend())
+        self.assertIs(_json.DEFAULT_BACKEND, _json.get_backend('json'))
+        self.assertTrue(_json.get_backend().is_default)
+
+    def test_unknown(self):
+        self.assertRaises(
+            exceptions.ConfigException, _json.get_backend, 'pickle'
+        )
+
+    @mock.patch('importlib.import_module', side_effect=ImportError)
+    def test_not_installed(self, mock_import):
+        self.assertRaises(
+            exceptions.ConfigException, _json.get_backend, 'orjson'
+        )
+        mock_import.assert_called_once_with('orjson')
+
+    @mock.patch('importlib.import_module', side_effect=ImportError)
+    def test_auto_fallback(self, mock_import):
+        self.assertIs(_json.DEFAULT_BACKEND, _json.get_backend('auto'))
+        self.assertEqual(
+            [mock.call(name) for name in _json.AUTO_BACKENDS],
+            mock_import.call_args_list,
+        )
+
+    def test_auto(self):
+        fake = mock.Mock()
+        fake.dumps.return_value = b'{}'
+
+        def import_module(name):
+            if name == 'ujson':
+                return fake
+            raise ImportError(name)
+
+        with mock.patch('importlib.import_module', side_effect=import_module):
+            backend = _json.get_backend('auto')
+
+        self.assertEqual('ujson', backend.name)
+        self.assertFalse(backend.is_default)
+        self.assertEqual(b'{}', backend.dumps({}))
+        self.assertIs(fake.loads, backend.loads)
+
+
+class TestJSONBackend(base.TestCase):
+    def test_load_response_default(self):
+        response = mock.Mock()
+        response.json.return_value = {'a': 1}
+
+        result = _json.DEFAULT_BACKEND.load_response(response)
+
+        self.assertEqual({'a': 1}, result)
+        response.json.assert_called_once_with()
+
+    def test_load_response(self):
+        backend = _json.JSONBackend('fake', json.loads, json.dumps)
+        response = mock.Mock()
+        response.content = b'{"a": 1}'
+
+        self.assertEqual({'a': 1}, backend.load_response(response))
+        response.json.assert_not_called()
+
+    def test_dumps_extra_types(self):
+        value = uuid.uuid4()
+        when = datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+        result = _json.DEFAULT_BACKEND.dumps({'id': value, 'at': when})
+
+        self.assertEqual(
+            {'id': str(value), 'at': '2024-01-02T03:04:05'},
+            json.loads(result),
+        )
+
+    def test_backend_for(self):
+        backend = _json.JSONBackend('fake', json.loads, json.dumps)
+
+        self.assertIs(
+            backend, _json.backend_for(mock.Mock(json_backend=backend))
+        )
+        self.assertIs(_json.DEFAULT_BACKEND, _json.backend_for(None))
+        self.assertIs(_json.DEFAULT_BACKEND, _json.backend_for(mock.Mock()))
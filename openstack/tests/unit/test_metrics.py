@@ -0,0 +1,126 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+from unittest import mock
+
+from openstack import _metrics
+from openstack.tests.unit import base
+
+
+class TestMetricsPipeline(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.sot = _metrics.MetricsPipeline(batch_size=3, flush_interval=10)
+        self.addCleanup(self.sot.close)
+        self.batches = []
+
+    def _writer(self, records):
+        self.batches.append(records)
+
+    def test_batch_size(self):
+        for index in range(7):
+            self.assertTrue(self.sot.submit(self._writer, index))
+
+        self.sot.close()
+
+        self.assertEqual([[0, 1, 2], [3, 4, 5], [6]], self.batches)
+
+    def test_flush_interval(self):
+        self.sot.flush_interval = 0.01
+
+        self.sot.submit(self._writer, 0)
+        self.sot.flush()
+
+        self.assertEqual([[0]], self.batches)
+
+    def test_writers(self):
+        other = []
+
+        self.sot.submit(self._writer, 0)
+        self.sot.submit(other.append, 1)
+        self.sot.close()
+
+        self.assertEqual([[0]], self.batches)
+        self.assertEqual([[1]], other)
+
+    def test_drop_on_overflow(self):
+        sot = _metrics.MetricsPipeline(queue_size=1, flush_interval=0)
+        blocked = threading.Event()
+        release = threading.Event()
+
+        def writer(records):
+            blocked.set()
+            release.wait()
+
+        sot.submit(writer, 0)
+        blocked.wait()
+        with mock.patch.object(_metrics.LOG, 'warning') as log_warning:
+            self.assertTrue(sot.submit(writer, 1))
+            self.assertFalse(sot.submit(writer, 2))
+            self.assertFalse(sot.submit(writer, 3))
+        release.set()
+        sot.close()
+
+        self.assertEqual(2, sot.dropped)
+        log_warning.assert_called_once()
+
+    def test_writer_error(self):
+        self.sot.flush_interval = 0
+
+        with mock.patch.object(_metrics.LOG, 'exception') as log_exception:
+            self.sot.submit(mock.Mock(side_effect=Exception('boom')), 0)
+            self.sot.submit(self._writer, 1)
+            self.sot.close()
+
+        self.assertEqual([[1]], self.batches)
+        log_exception.assert_called_once()
+
+
+class TestClients(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.pipeline = _metrics.MetricsPipeline()
+
+    def test_statsd(self):
+        client = mock.MagicMock()
+        sot = _metrics.StatsClient(client, self.pipeline)
+
+        with sot.pipeline() as pipe:
+            pipe.timing('foo', 10)
+            pipe.incr('foo')
+        with sot.pipeline() as pipe:
+            pipe.incr('bar')
+        self.pipeline.close()
+
+        pipe = client.pipeline.return_value.__enter__.return_value
+        client.pipeline.assert_called_once_with()
+        self.assertEqual(
+            [
+                mock.call.timing('foo', 10),
+                mock.call.incr('foo'),
+                mock.call.incr('bar'),
+            ],
+            pipe.mock_calls,
+        )
+
+    def test_influxdb(self):
+        client = mock.Mock()
+        sot = _metrics.InfluxDBClient(client, self.pipeline)
+
+        sot.write_points([{'measurement': 'foo'}])
+        sot.write_points([{'measurement': 'bar'}])
+        self.pipeline.close()
+
+        client.write_points.assert_called_once_with(
+            [{'measurement': 'foo'}, {'measurement': 'bar'}]
+        )
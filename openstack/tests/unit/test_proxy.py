@@ -11,13 +11,17 @@
 # under the License.
 
 import copy
+import json
 import queue
 from requests import Response
+import threading
 from unittest import mock
 
 from keystoneauth1 import session
 from testscenarios import load_tests_apply_scenarios as load_tests  # noqa
 
+from openstack import _cache
+from openstack import _json
 from openstack import exceptions
 from openstack import proxy
 from openstack import resource
@@ -152,6 +156,20 @@ class TestProxyPrivate(base.TestCase):
         res._update.assert_called_once_with(**attrs)
         self.assertEqual(result, res)
 
+    def test__get_resource_from_compact_record(self):
+        class Fake(resource.Resource):
+            name = resource.Body('name')
+
+        layout = Fake._get_schema().compact_layout()
+        record = layout.record({'id': '1', 'name': 'foo'}, self.cloud, None)
+
+        result = self.fake_proxy._get_resource(Fake, record, name='bar')
+
+        self.assertIs(Fake, type(result))
+        self.assertIs(record._full, result)
+        self.assertEqual('1', result.id)
+        self.assertEqual('bar', result.name)
+
     def test__get_resource_from_munch(self):
         cls = mock.Mock()
         res = mock.Mock(spec=resource.Resource)
@@ -579,6 +597,48 @@ class TestExtractName(base.TestCase):
         self.assertEqual(self.parts, results)
 
 
+class TestProxyJSONBackend(base.TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.session = mock.Mock(spec=session.Session)
+        self.session._sdk_connection = self.cloud
+        self.session.get_project_id = mock.Mock(return_value='fake_prj')
+        self.response = mock.Mock()
+        self.response.status_code = 200
+        self.response.history = []
+        self.response.headers = {}
+        self.session.request = mock.Mock(return_value=self.response)
+
+        self.sot = proxy.Proxy(self.session)
+        self.sot._connection = self.cloud
+        self.sot.service_type = 'srv'
+
+    def test_request_default_backend(self):
+        self.sot.request('fake', 'POST', json={'foo': 'bar'})
+
+        kwargs = self.session.request.call_args[1]
+        self.assertEqual({'foo': 'bar'}, kwargs['json'])
+        self.assertNotIn('data', kwargs)
+
+    def test_request_custom_backend(self):
+        self.cloud.json_backend = _json.JSONBackend(
+            'fake', json.loads, lambda obj: json.dumps(obj).encode()
+        )
+
+        self.sot.request(
+            'fake', 'POST', json={'foo': 'bar'}, headers={'X-Foo': 'bar'}
+        )
+
+        kwargs = self.session.request.call_args[1]
+        self.assertNotIn('json', kwargs)
+        self.assertEqual(b'{"foo": "bar"}', kwargs['data'])
+        self.assertEqual(
+            {'X-Foo': 'bar', 'Content-Type': 'application/json'},
+            kwargs['headers'],
+        )
+
+
 class TestProxyCache(base.TestCase):
     CLOUD_CONFIG_FIXTURE = 'clouds_cache.yaml'
 
@@ -610,7 +670,13 @@ class TestProxyCache(base.TestCase):
         self.sot.service_type = 'srv'
 
     def _get_key(self, id):
-        return f"srv.fake.fake/{id}.{{'microversion': None, 'params': {{}}}}"
+        return _cache.make_cache_key(
+            'srv.fake', f'fake/{id}', {'microversion': None, 'params': {}}
+        )
+
+    def _get_raw(self, id):
+        # Bypass the resource cache in front of the response cache
+        return self.sot.get(f'fake/{id}', microversion=None, params={})
 
     def test_get_not_in_cache(self):
         self.cloud._cache_expirations['srv.fake'] = 5
@@ -644,7 +710,7 @@ class TestProxyCache(base.TestCase):
         key = self._get_key(3)
 
         self.cloud._cache.set(key, self.response)
-        self.cloud._api_cache_keys.add(key)
+        self.cloud._api_cache_keys.add(key, 'srv.fake')
         self.cloud._cache_expirations['srv.fake'] = 5
 
         # Ensure first call gets value from cache
@@ -664,12 +730,106 @@ class TestProxyCache(base.TestCase):
         self.sot._get(self.Res, '3')
         self.session.request.assert_called()
 
+    def test_modify_not_tracked(self):
+        self.cloud._cache_expirations['srv.fake'] = 5
+        rs = self.Res.existing(id='3')
+
+        self.sot._update(self.Res, rs, foo='bar')
+
+        self.assertEqual(0, len(self.cloud._api_cache_keys))
+
+    def test_get_evicts(self):
+        self.cloud._api_cache_keys.max_size = 1
+        self.cloud._cache_expirations['srv.fake'] = 5
+
+        self._get_raw(1)
+        self._get_raw(2)
+
+        self.assertNotIn(self._get_key(1), self.cloud._api_cache_keys)
+        self.assertIn(self._get_key(2), self.cloud._api_cache_keys)
+        self.assertEqual(
+            'NoValue', type(self.cloud._cache.get(self._get_key(1))).__name__
+        )
+        self.assertIsNotNone(self.cloud._cache.get(self._get_key(2)))
+
+    def test_cache_stats(self):
+        self.cloud._cache_expirations['srv.fake'] = 5
+
+        self._get_raw(1)
+        self._get_raw(1)
+        self._get_raw(2)
+        self.sot._update(self.Res, self.Res.existing(id='1'), foo='bar')
+
+        self.assertEqual(
+            {
+                'hits': 1,
+                'misses': 2,
+                'evictions': 0,
+                'invalidations': 2,
+                'revalidations': 0,
+                'keys': 0,
+            },
+            self.cloud.get_cache_stats(),
+        )
+
+    def _set_expired(self, key, response):
+        value = self.cloud._cache._value(response)
+        value.metadata['ct'] -= 10
+        self.cloud._cache.backend.set(key, value)
+
+    def test_get_revalidate(self):
+        self.cloud._cache_revalidate = True
+        self.cloud._cache_expirations['srv.fake'] = 5
+        stale = copy.deepcopy(self.response)
+        stale.ok = True
+        stale.headers = {'ETag': '"v1"', 'Last-Modified': 'yesterday'}
+        self._set_expired(self._get_key(1), stale)
+        self.response.status_code = 304
+        self.response.headers = {'ETag': '"v2"'}
+
+        response = self._get_raw(1)
+
+        self.assertIs(stale, response)
+        self.assertEqual('"v2"', response.headers['ETag'])
+        headers = self.session.request.call_args.kwargs['headers']
+        self.assertEqual('"v1"', headers['If-None-Match'])
+        self.assertEqual('yesterday', headers['If-Modified-Since'])
+        self.assertEqual(1, self.cloud.get_cache_stats()['revalidations'])
+        # The response is fresh again
+        self.session.request.reset_mock()
+        self.assertIs(stale, self._get_raw(1))
+        self.session.request.assert_not_called()
+
+    def test_get_revalidate_modified(self):
+        self.cloud._cache_revalidate = True
+        self.cloud._cache_expirations['srv.fake'] = 5
+        stale = copy.deepcopy(self.response)
+        stale.ok = True
+        stale.headers = {'ETag': '"v1"'}
+        self._set_expired(self._get_key(1), stale)
+
+        response = self._get_raw(1)
+
+        self.assertIs(self.response, response)
+        self.assertEqual(0, self.cloud.get_cache_stats()['revalidations'])
+
+    def test_get_revalidate_disabled(self):
+        self.cloud._cache_expirations['srv.fake'] = 5
+        stale = copy.deepcopy(self.response)
+        stale.ok = True
+        stale.headers = {'ETag': '"v1"'}
+        self._set_expired(self._get_key(1), stale)
+
+        self.assertIs(self.response, self._get_raw(1))
+        headers = self.session.request.call_args.kwargs['headers']
+        self.assertNotIn('If-None-Match', headers)
+
     def test_get_bypass_cache(self):
         key = self._get_key(4)
 
         resp = copy.deepcopy(self.response)
         resp.body = {'foo': 'bar'}
-        self.cloud._api_cache_keys.add(key)
+        self.cloud._api_cache_keys.add(key, 'srv.fake')
         self.cloud._cache.set(key, resp)
         # set expiration for the resource to respect cache
         self.cloud._cache_expirations['srv.fake'] = 5
@@ -682,6 +842,155 @@ class TestProxyCache(base.TestCase):
         self.assertEqual('NoValue', type(self.cloud._cache.get(key)).__name__)
 
 
+class TestProxyResourceCache(base.TestCase):
+    CLOUD_CONFIG_FIXTURE = 'clouds_cache.yaml'
+
+    class SummaryRes(resource.Resource):
+        base_path = 'fake'
+
+        allow_commit = True
+        allow_delete = True
+        allow_fetch = True
+        allow_list = True
+
+        _query_mapping = resource.QueryParameters('fields')
+
+        foo = resource.Body('foo')
+
+    class Res(SummaryRes):
+        _cache_listed_resources = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.session = mock.Mock(spec=session.Session)
+        self.session._sdk_connection = self.cloud
+        self.session.get_project_id = mock.Mock(return_value='fake_prj')
+        self.session.request = mock.Mock(side_effect=self._request)
+        self.listing = False
+
+        self.sot = proxy.Proxy(self.session)
+        self.sot._connection = self.cloud
+        self.sot.service_type = 'srv'
+        self.cloud._cache_expirations['srv.fake'] = 5
+
+    def _response(self, body):
+        response = mock.Mock()
+        response.status_code = 200
+        response.history = []
+        response.headers = {}
+        response.json = mock.Mock(return_value=body)
+        return response
+
+    def _request(self, url, method, **kwargs):
+        if self.listing:
+            return self._response(
+                [{'id': '1', 'foo': 'bar'}, {'id': '2', 'foo': 'baz'}]
+            )
+        return self._response({'id': url.split('/')[-1], 'foo': 'bar'})
+
+    def _list(self, resource_type, **kwargs):
+        self.listing = True
+        result = list(resource_type.list(self.sot, paginated=False, **kwargs))
+        self.listing = False
+        self.session.request.reset_mock()
+        return result
+
+    def test_fetch(self):
+        res = self.sot._get(self.Res, '1')
+        self.session.request.reset_mock()
+
+        cached = self.sot._get(self.Res, '1')
+
+        self.session.request.assert_not_called()
+        self.assertEqual(res, cached)
+        self.assertEqual('bar', cached.foo)
+        self.assertEqual(1, self.cloud.get_cache_stats()['hits'])
+
+    def test_fetch_disabled(self):
+        del self.cloud._cache_expirations['srv.fake']
+        self.sot._get(self.Res, '1')
+        self.session.request.reset_mock()
+
+        self.sot._get(self.Res, '1')
+
+        self.session.request.assert_called_once()
+
+    def test_fetch_other_microversion(self):
+        self.sot._get(self.Res, '1')
+        self.session.request.reset_mock()
+
+        res = self.Res.existing(id='1')
+        res.fetch(self.sot, microversion='2.1')
+
+        self.session.request.assert_called_once()
+
+    def test_fetch_skip_cache(self):
+        self.sot._get(self.Res, '1')
+        self.session.request.reset_mock()
+
+        self.sot._get(self.Res, '1', skip_cache=True)
+
+        self.session.request.assert_called_once()
+
+    def test_fetch_listed(self):
+        self._list(self.Res)
+
+        res = self.sot._get(self.Res, '2')
+
+        self.session.request.assert_not_called()
+        self.assertEqual('baz', res.foo)
+
+    def test_find_listed(self):
+        self._list(self.Res)
+
+        res = self.Res.find(self.sot, '2', ignore_missing=False)
+
+        self.session.request.assert_not_called()
+        self.assertEqual('baz', res.foo)
+
+    def test_fetch_listed_summary(self):
+        self._list(self.SummaryRes)
+
+        self.sot._get(self.SummaryRes, '2')
+
+        self.session.request.assert_called_once()
+
+    def test_fetch_listed_detail(self):
+        self._list(self.SummaryRes, base_path='fake/detail')
+
+        self.sot._get(self.SummaryRes, '2')
+
+        self.session.request.assert_not_called()
+
+    def test_fetch_listed_fields(self):
+        self._list(self.Res, fields='id')
+
+        self.sot._get(self.Res, '2')
+
+        self.session.request.assert_called_once()
+
+    def test_commit_invalidates(self):
+        res = self.sot._get(self.Res, '1')
+        self.session.request.reset_mock()
+
+        res.foo = 'qux'
+        res.commit(self.sot)
+        self.session.request.reset_mock()
+        self.sot._get(self.Res, '1')
+
+        self.session.request.assert_called_once()
+
+    def test_delete_invalidates(self):
+        self._list(self.Res)
+
+        self.sot._delete(self.Res, '1')
+        self.session.request.reset_mock()
+        self.sot._get(self.Res, '1')
+
+        self.session.request.assert_called_once()
+
+
 class TestProxyCleanup(base.TestCase):
     def setUp(self):
         super().setUp()
@@ -841,6 +1150,94 @@ class TestProxyCleanup(base.TestCase):
         )
         self.assertEqual(self.res, q.get_nowait())
 
+    def _resources(self, count):
+        resources = []
+        for res_id in range(count):
+            res = mock.Mock(spec=resource.Resource)
+            res.id = res_id
+            resources.append(res)
+        return resources
+
+    def test_service_cleanup_del_many(self):
+        resources = self._resources(3)
+        rd = dict()
+
+        result = self.sot._service_cleanup_del_many(
+            self.delete_mock,
+            iter(resources),
+            dry_run=False,
+            identified_resources=rd,
+            resource_evaluation_fn=lambda x, y, z: x.id != 1,
+        )
+
+        self.assertEqual([resources[0], resources[2]], result)
+        self.assertEqual({0: resources[0], 2: resources[2]}, rd)
+        self.delete_mock.assert_has_calls(
+            [mock.call(resources[0]), mock.call(resources[2])]
+        )
+        self.assertEqual(2, self.delete_mock.call_count)
+
+    def test_service_cleanup_del_many_concurrent(self):
+        self.cloud.config.config['block_storage_cleanup_concurrency'] = 2
+        resources = self._resources(4)
+        q = queue.Queue()
+        # Deletions only return once two of them run at the same time
+        barrier = threading.Barrier(2, timeout=10)
+        self.delete_mock.side_effect = lambda res: barrier.wait()
+
+        result = self.sot._service_cleanup_del_many(
+            self.delete_mock,
+            resources,
+            dry_run=False,
+            client_status_queue=q,
+        )
+
+        self.assertEqual(resources, result)
+        self.assertEqual(4, self.delete_mock.call_count)
+        self.assertEqual(4, q.qsize())
+
+    def test_service_cleanup_del_many_concurrent_evaluation(self):
+        self.cloud.config.config['cleanup_concurrency'] = 2
+        resources = self._resources(2)
+        rd = dict()
+        # Evaluations only return once both of them run at the same time
+        barrier = threading.Barrier(2, timeout=10)
+
+        def evaluate(res, filters, identified_resources):
+            barrier.wait()
+            return True
+
+        result = self.sot._service_cleanup_del_many(
+            self.delete_mock,
+            resources,
+            identified_resources=rd,
+            resource_evaluation_fn=evaluate,
+        )
+
+        self.assertEqual(resources, result)
+        self.assertEqual({0: resources[0], 1: resources[1]}, rd)
+
+    def test_service_cleanup_del_many_dry_run(self):
+        self.cloud.config.config['cleanup_concurrency'] = 2
+        resources = self._resources(2)
+
+        result = self.sot._service_cleanup_del_many(
+            self.delete_mock, resources
+        )
+
+        self.assertEqual(resources, result)
+        self.delete_mock.assert_not_called()
+
+    @mock.patch.object(resource, 'wait_for_many', autospec=True)
+    def test_service_cleanup_wait_for_many(self, mock_wait):
+        resources = self._resources(3)
+
+        self.sot._service_cleanup_wait_for_many(resources, base_path='/fake')
+
+        mock_wait.assert_called_once_with(
+            self.sot, resources, None, wait=360, base_path='/fake'
+        )
+
     def test_should_skip_resource_cleanup(self):
         excluded = ["block_storage.backup"]
         self.assertTrue(
@@ -10,15 +10,21 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections.abc
+import concurrent.futures
+import copy
 import itertools
 import json
 import logging
+import pickle
+import queue
 from unittest import mock
 
 from keystoneauth1 import adapter
 import requests
 
-from openstack import dns
+from openstack import _json
+from openstack.dns.v2 import _base as dns_base
 from openstack import exceptions
 from openstack import fields
 from openstack import resource
@@ -223,6 +229,44 @@ class TestQueryParameters(base.TestCase):
         self.assertEqual({"location": "Brooklyn"}, result)
 
 
+class TestPrefetch(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_prefetch(self):
+        items = resource._prefetch(self.executor, iter(range(5)), 2)
+
+        self.assertEqual([0, 1, 2, 3, 4], list(items))
+
+    def test_prefetch_close(self):
+        produced = []
+
+        def _produce():
+            for i in itertools.count():
+                produced.append(i)
+                yield i
+
+        items = resource._prefetch(self.executor, _produce(), 2)
+        self.assertEqual([0, 1], [next(items), next(items)])
+        items.close()
+
+        # The producer stops, so the executor can be shut down
+        self.executor.shutdown(wait=True)
+        self.assertLessEqual(len(produced), 5)
+
+    def test_prefetch_error(self):
+        def _produce():
+            yield 1
+            raise exceptions.SDKException('boom')
+
+        items = resource._prefetch(self.executor, _produce(), 1)
+
+        self.assertEqual(1, next(items))
+        self.assertRaises(exceptions.SDKException, next, items)
+
+
 class TestResource(base.TestCase):
     def test_initialize_basic(self):
         body = {"body": 1}
@@ -425,6 +469,47 @@ class TestResource(base.TestCase):
         self.assertIn("y", Test._uri_mapping())
         self.assertIn("z", Test._uri_mapping())
 
+    def test__get_schema(self):
+        class Parent(resource.Resource):
+            x = resource.Body("x")
+
+        class Child(Parent):
+            y = resource.Body("y")
+
+        # The schema is compiled once per class and not shared with
+        # subclasses
+        self.assertIs(Parent._get_schema(), Parent._get_schema())
+        self.assertIsNot(Parent._get_schema(), Child._get_schema())
+        self.assertNotIn("y", Parent._body_mapping())
+        self.assertIn("y", Child._body_mapping())
+
+    def test__get_mapping_copy(self):
+        class Test(resource.Resource):
+            x = resource.Body("x")
+
+        mapping = Test._body_mapping()
+        mapping["y"] = "y"
+
+        self.assertNotIn("y", Test._body_mapping())
+
+    def test__consume_attrs_case_insensitive(self):
+        class Test(resource.Resource):
+            foo = resource.Header("X-Foo")
+            bar = resource.Body("Bar")
+
+        headers = requests.structures.CaseInsensitiveDict(
+            {"x-foo": "foo", "other": "other"}
+        )
+        body = {"BAR": "BAR", "Bar": "Bar"}
+
+        sot = Test()
+
+        self.assertEqual({"X-Foo": "foo"}, sot._consume_header_attrs(headers))
+        self.assertEqual({"other": "other"}, dict(headers))
+        # Only exact names are accepted for the body
+        self.assertEqual({"Bar": "Bar"}, sot._consume_body_attrs(body))
+        self.assertEqual({"BAR": "BAR"}, body)
+
     def test__getattribute__id_in_body(self):
         id = "lol"
         sot = resource.Resource(id=id)
@@ -730,6 +815,71 @@ class TestResource(base.TestCase):
         actual = json.dumps(res, sort_keys=True)
         self.assertEqual(expected, actual)
 
+    def test_lazy_dict_mirror(self):
+        class Test(resource.Resource):
+            _lazy_dict_mirror = True
+            foo = resource.Body('foo_remote')
+
+        with mock.patch.object(
+            Test, 'to_dict', autospec=True, side_effect=Test.to_dict
+        ) as mock_to_dict:
+            res = Test(foo='bar')
+            mock_to_dict.assert_not_called()
+
+            expected = (
+                '{"foo": "bar", "id": null, "location": null, "name": null}'
+            )
+            self.assertEqual(expected, json.dumps(res, sort_keys=True))
+            # json goes through items(), which does not need the mirror
+            mock_to_dict.assert_not_called()
+
+            self.assertEqual('bar', res.get('foo'))
+            self.assertEqual(1, mock_to_dict.call_count)
+
+            # Already up to date
+            self.assertEqual('bar', res.get('foo'))
+            self.assertEqual(1, mock_to_dict.call_count)
+
+    def test_lazy_dict_mirror_after_update(self):
+        class Test(resource.Resource):
+            _lazy_dict_mirror = True
+            foo = resource.Body('foo_remote')
+
+        res = Test(foo='bar')
+        self.assertEqual('bar', res.get('foo'))
+
+        res._translate_response(FakeResponse({'foo_remote': 'new_bar'}))
+        self.assertEqual('new_bar', res.get('foo'))
+
+        res.foo = 'other_bar'
+        self.assertIn('foo', res)
+        self.assertEqual(4, len(res))
+        self.assertIn('other_bar', res.values())
+        self.assertEqual(
+            '{"foo": "other_bar", "id": null, "location": null, "name": null}',
+            json.dumps(res, sort_keys=True),
+        )
+
+    def test_lazy_dict_mirror_pop(self):
+        class Test(resource.Resource):
+            _lazy_dict_mirror = True
+            foo = resource.Body('foo_remote')
+
+        res = Test(foo='bar')
+        self.assertEqual('bar', res.pop('foo', 'missing'))
+        res = Test(foo='bar')
+        self.assertEqual('bar', res.setdefault('foo', 'default'))
+        res = Test(foo='bar')
+        self.assertIn(res.popitem()[0], ('foo', 'id', 'location', 'name'))
+        self.assertEqual(3, dict.__len__(res))
+
+    def test_lazy_dict_mirror_not_inherited_hooks(self):
+        class Test(resource.Resource):
+            foo = resource.Body('foo_remote')
+
+        self.assertIs(dict.get, Test.get)
+        self.assertIs(object.__setattr__, Test.__setattr__)
+
     def test_items(self):
         class Test(resource.Resource):
             foo = resource.Body('foo')
@@ -2137,6 +2287,197 @@ class TestResourceActions(base.TestCase):
         self.assertEqual(id_value, results[0].id)
         self.assertIsInstance(results[0], self.test_class)
 
+    def test_list_compact(self):
+        class Test(self.test_class):
+            name = resource.Body('name')
+            size = resource.Body('size', type=int)
+            alias = resource.Body('alias', aka='nickname')
+
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {
+            "resources": [
+                {"id": "1", "name": "foo", "size": "5", "alias": "bar"},
+                {"id": "2", "name": "baz"},
+            ]
+        }
+        self.session.get.return_value = mock_response
+
+        results = list(Test.list(self.session, compact=True))
+
+        self.assertEqual(2, len(results))
+        self.assertIsInstance(results[0], resource._CompactResource)
+        self.assertIs(Test, results[0].record_type)
+        self.assertEqual(
+            ('1', 'foo', 5, 'bar', 'bar'),
+            (
+                results[0].id,
+                results[0].name,
+                results[0].size,
+                results[0].alias,
+                results[0].nickname,
+            ),
+        )
+        self.assertEqual('foo', results[0]['name'])
+        self.assertIsNone(results[1].size)
+        self.assertIsNone(results[1].get('size'))
+        expected = Test.existing(
+            connection=self.cloud, id="1", name="foo", size="5", alias="bar"
+        )
+        self.assertEqual(expected.to_dict(), results[0].to_dict())
+        self.assertEqual(expected, results[0])
+        self.assertEqual(dict(expected), dict(results[0]))
+        # The key table is shared
+        self.assertIs(results[0]._layout, results[1]._layout)
+
+    def test_list_compact_mapping(self):
+        class Test(self.test_class):
+            name = resource.Body('name')
+            size = resource.Body('size', type=int)
+
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {
+            "resources": [{"id": "1", "name": "foo", "size": "5"}]
+        }
+        self.session.get.return_value = mock_response
+
+        result = next(Test.list(self.session, compact=True))
+        expected = Test.existing(
+            connection=self.cloud, id="1", name="foo", size="5"
+        )
+
+        # Records don't pretend to be resources or dicts
+        self.assertNotIsInstance(result, resource.Resource)
+        self.assertNotIsInstance(result, dict)
+        self.assertIsInstance(result, collections.abc.Mapping)
+        self.assertEqual(dict(expected), dict(result))
+        self.assertEqual(dict(expected.items()), dict(result.items()))
+        self.assertEqual([result[key] for key in result], result.values())
+        self.assertRaises(TypeError, json.dumps, result)
+        self.assertEqual(
+            json.dumps(expected.to_dict()), json.dumps(result.to_dict())
+        )
+        self.assertEqual('1', Test._get_id(result))
+        self.assertIsNone(result._full)
+
+        self.assertTrue(expected == result)
+        self.assertTrue(result == expected)
+        for copied in (copy.copy(result), copy.deepcopy(result)):
+            self.assertIsInstance(copied, resource._CompactResource)
+            self.assertEqual(result, copied)
+        self.assertIsNone(result._full)
+
+    def test_compact_record_pickle(self):
+        layout = dns_base.Resource._get_schema().compact_layout()
+        record = layout.record({'id': '1', 'name': 'foo'}, None, '2.1')
+
+        unpickled = pickle.loads(pickle.dumps(record))
+
+        self.assertIsInstance(unpickled, resource._CompactResource)
+        self.assertIs(dns_base.Resource, unpickled.record_type)
+        self.assertEqual(record, unpickled)
+        self.assertEqual(
+            ('1', 'foo', '2.1'),
+            (unpickled.id, unpickled.name, unpickled.microversion),
+        )
+
+    def test_list_compact_alternate_id(self):
+        class Test(self.test_class):
+            name = resource.Body('name', alternate_id=True)
+
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.side_effect = [
+            {
+                "resources": [{"name": "foo"}, {"name": "bar"}],
+                "resources_links": [
+                    {
+                        "href": "https://example.com/next-url?marker=bar",
+                        "rel": "next",
+                    }
+                ],
+            },
+            {"resources": []},
+        ]
+        self.session.get.return_value = mock_response
+
+        results = list(Test.list(self.session, paginated=True, compact=True))
+
+        self.assertIsInstance(results[0], resource._CompactResource)
+        self.assertEqual(['foo', 'bar'], [result.id for result in results])
+        self.assertEqual('foo', results[0]['id'])
+        self.assertEqual('bar', Test._get_id(results[1]))
+        self.assertEqual(2, len(self.session.get.call_args_list))
+
+    def test_find_compact_alternate_id(self):
+        class Test(self.test_class):
+            other_id = resource.Body('other_id', alternate_id=True)
+
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {
+            "resources": [{"other_id": "1"}, {"other_id": "2"}]
+        }
+        self.session.get.return_value = mock_response
+
+        with mock.patch.object(
+            Test, 'fetch', side_effect=exceptions.NotFoundException()
+        ):
+            result = Test.find(self.session, '2')
+
+        self.assertIs(Test, type(result))
+        self.assertEqual('2', result.id)
+
+    def test_list_compact_upgrade(self):
+        class Test(self.test_class):
+            allow_patch = True
+            commit_method = 'PATCH'
+            name = resource.Body('name')
+
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {
+            "resources": [{"id": "1", "name": "foo"}]
+        }
+        self.session.get.return_value = mock_response
+
+        result = next(Test.list(self.session, compact=True))
+        self.assertIsNone(result._full)
+
+        result.name = 'bar'
+
+        self.assertIsInstance(result._full, Test)
+        self.assertEqual('bar', result.name)
+        self.assertEqual({'name': 'bar'}, result._body.dirty)
+        self.assertEqual(
+            [{'op': 'replace', 'path': '/name', 'value': 'bar'}],
+            result._prepare_request(patch=True).body,
+        )
+
+    def test_list_compact_unsupported(self):
+        class Test(self.test_class):
+            _store_unknown_attrs_as_properties = True
+            properties = resource.Body('properties')
+
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {
+            "resources": [{"id": "1", "foo": "bar"}]
+        }
+        self.session.get.return_value = mock_response
+
+        result = next(Test.list(self.session, compact=True))
+
+        self.assertIs(Test, type(result))
+        self.assertEqual({'foo': 'bar'}, result.properties)
+
     def test_list_response_paginated_without_links(self):
         ids = [1, 2]
         mock_response = mock.Mock()
@@ -2234,6 +2575,276 @@ class TestResourceActions(base.TestCase):
         self.assertEqual(2, len(self.session.get.call_args_list))
         self.assertIsInstance(results[0], self.test_class)
 
+    def test_list_response_paginated_prefetch(self):
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.side_effect = [
+            {"resources": [{"id": 1}]},
+            {"resources": [{"id": 2}]},
+            {"resources": []},
+        ]
+
+        self.session.get.return_value = mock_response
+
+        results = list(
+            self.sot.list(self.session, paginated=True, limit=1, prefetch=2)
+        )
+
+        self.assertEqual([1, 2], [result.id for result in results])
+        self.assertEqual(3, len(self.session.get.call_args_list))
+        self.assertEqual(
+            [
+                mock.call(
+                    'base_path',
+                    headers={'Accept': 'application/json'},
+                    params={'limit': 1},
+                    microversion=None,
+                ),
+                mock.call(
+                    'base_path',
+                    headers={'Accept': 'application/json'},
+                    params={'limit': 1, 'marker': 1},
+                    microversion=None,
+                ),
+                mock.call(
+                    'base_path',
+                    headers={'Accept': 'application/json'},
+                    params={'limit': 1, 'marker': 2},
+                    microversion=None,
+                ),
+            ],
+            self.session.get.call_args_list,
+        )
+
+    def test_list_response_paginated_prefetch_max_items(self):
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.side_effect = [
+            {"resources": [{"id": 1}, {"id": 2}]},
+            {"resources": [{"id": 3}, {"id": 4}]},
+        ]
+
+        self.session.get.return_value = mock_response
+
+        results = list(
+            self.sot.list(
+                self.session, paginated=True, limit=2, max_items=2, prefetch=1
+            )
+        )
+
+        self.assertEqual([1, 2], [result.id for result in results])
+        # We know the next page isn't needed
+        self.assertEqual(1, len(self.session.get.call_args_list))
+
+    def test_list_response_paginated_prefetch_error(self):
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.side_effect = [
+            {"resources": [{"id": 1}]},
+            exceptions.SDKException('boom'),
+        ]
+
+        self.session.get.return_value = mock_response
+
+        results = self.sot.list(
+            self.session, paginated=True, limit=1, prefetch=1
+        )
+
+        self.assertEqual(1, next(results).id)
+        self.assertRaises(exceptions.SDKException, next, results)
+
+    def test_parallel_list(self):
+        class Test(self.test_class):
+            _query_mapping = resource.QueryParameters('prefix')
+
+        def _get(uri, headers, params, microversion):
+            response = mock.Mock()
+            response.status_code = 200
+            response.links = {}
+            response.json.return_value = {
+                "resources": [
+                    {"id": f"{params['prefix']}{i}"} for i in range(3)
+                ]
+            }
+            return response
+
+        self.session.get.side_effect = _get
+
+        results = list(
+            Test.parallel_list(
+                self.session,
+                [{'prefix': 'a'}, {'prefix': 'b'}, {'prefix': 'c'}],
+                paginated=False,
+            )
+        )
+
+        self.assertEqual(
+            ['a0', 'a1', 'a2', 'b0', 'b1', 'b2', 'c0', 'c1', 'c2'],
+            [result.id for result in results],
+        )
+        self.assertEqual(3, len(self.session.get.call_args_list))
+
+    def test_parallel_list_prefetch(self):
+        class Test(self.test_class):
+            _query_mapping = resource.QueryParameters('prefix')
+
+        def _get(uri, headers, params, microversion):
+            prefix = params['prefix']
+            pages = {
+                None: [{"id": f"{prefix}0"}],
+                f"{prefix}0": [{"id": f"{prefix}1"}],
+                f"{prefix}1": [],
+            }
+            response = mock.Mock()
+            response.status_code = 200
+            response.links = {}
+            response.json.return_value = {
+                "resources": pages[params.get('marker')]
+            }
+            return response
+
+        self.session.get.side_effect = _get
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        self.addCleanup(executor.shutdown)
+
+        with (
+            mock.patch.object(
+                type(self.cloud),
+                '_pool_executor',
+                new_callable=mock.PropertyMock,
+                return_value=executor,
+            ),
+            mock.patch.object(
+                executor, 'submit', wraps=executor.submit
+            ) as mock_submit,
+        ):
+            results = list(
+                Test.parallel_list(
+                    self.session,
+                    [{'prefix': 'a'}, {'prefix': 'b'}],
+                    limit=1,
+                    prefetch=1,
+                )
+            )
+
+        self.assertEqual(
+            ['a0', 'a1', 'b0', 'b1'], [result.id for result in results]
+        )
+        # Listings of partitions fetch their pages themselves, rather than
+        # waiting for workers which partitions may all be holding
+        self.assertEqual(2, mock_submit.call_count)
+
+    def test_parallel_list_adapter(self):
+        # Plain adapters have no connection, and thus no thread pool
+        del self.session._get_connection
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {"resources": [{"id": 1}]}
+        self.session.get.return_value = mock_response
+
+        results = list(
+            self.test_class.parallel_list(
+                self.session,
+                [{'marker': 'a'}, {'marker': 'b'}],
+                paginated=False,
+            )
+        )
+
+        self.assertEqual([1, 1], [result.id for result in results])
+
+    def test_parallel_list_max_items(self):
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {"resources": [{"id": 1}, {"id": 2}]}
+        self.session.get.return_value = mock_response
+
+        results = list(
+            self.test_class.parallel_list(
+                self.session,
+                [{'marker': 'a'}, {'marker': 'b'}],
+                paginated=False,
+                max_items=3,
+            )
+        )
+
+        self.assertEqual([1, 2, 1], [result.id for result in results])
+
+    def test_parallel_list_error(self):
+        self.session.get.side_effect = exceptions.SDKException('boom')
+
+        results = self.test_class.parallel_list(
+            self.session, [{'marker': 'a'}, {'marker': 'b'}]
+        )
+
+        self.assertRaises(exceptions.SDKException, list, results)
+
+    def test_list_response_paginated_stream(self):
+        pages = [
+            {
+                "resources": [{"id": 1}, {"id": 2}],
+                "resources_links": [
+                    {"href": "https://example.com/next-url", "rel": "next"}
+                ],
+            },
+            {"resources": [{"id": 3}]},
+        ]
+
+        def _get(*args, **kwargs):
+            body = json.dumps(pages.pop(0)).encode('utf-8')
+            response = mock.Mock()
+            response.status_code = 200
+            response.links = {}
+            response.iter_content.return_value = iter(
+                [body[i : i + 5] for i in range(0, len(body), 5)]
+            )
+            return response
+
+        self.session.get.side_effect = _get
+
+        results = list(
+            self.sot.list(self.session, paginated=True, stream=True)
+        )
+
+        self.assertEqual([1, 2, 3], [result.id for result in results])
+        self.assertEqual(
+            [
+                mock.call(
+                    'base_path',
+                    headers={'Accept': 'application/json'},
+                    params={},
+                    microversion=None,
+                    stream=True,
+                ),
+                mock.call(
+                    'https://example.com/next-url',
+                    headers={'Accept': 'application/json'},
+                    params={},
+                    microversion=None,
+                    stream=True,
+                ),
+            ],
+            self.session.get.call_args_list,
+        )
+
+    def test_list_json_backend(self):
+        loads = mock.Mock(side_effect=json.loads)
+        self.cloud.json_backend = _json.JSONBackend('fake', loads, json.dumps)
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"resources": [{"id": 1}]}'
+        self.session.get.return_value = mock_response
+
+        results = list(self.sot.list(self.session, paginated=False))
+
+        self.assertEqual([1], [result.id for result in results])
+        loads.assert_called_once_with(mock_response.content)
+        mock_response.json.assert_not_called()
+
     def test_list_response_paginated_with_links_and_query(self):
         q_limit = 1
         ids = [1, 2]
@@ -2597,7 +3208,7 @@ class TestResourceActions(base.TestCase):
 
     @mock.patch.object(resource.Resource, 'list')
     def test_list_dns_with_headers(self, mock_resource_list):
-        dns.v2._base.Resource.list(
+        dns_base.Resource.list(
             self.session,
             project_id='1234',
             all_projects=True,
@@ -2688,6 +3299,155 @@ class TestResourceActions(base.TestCase):
         self.assertEqual(1, len(res))
         self.assertEqual("2", res[0].b)
 
+    def test_list_client_filters_not_built(self):
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {
+            "resources": [
+                {"id": "1", "size": "1", "tags": ["a"], "meta": {"x": 1}},
+                {"id": "2", "size": "5", "tags": ["b"], "meta": {"x": 2}},
+                {"id": "3", "size": "7", "tags": ["a"], "meta": {"x": 3}},
+                {"id": "4", "size": "9", "meta": None},
+            ]
+        }
+        self.session.get.return_value = mock_response
+
+        class Test(self.test_class):
+            size = resource.Body("size", type=int)
+            tags = resource.Body("tags", type=list)
+            meta = resource.Body("meta", type=dict)
+
+        with mock.patch.object(
+            Test, 'existing', side_effect=Test.existing
+        ) as mock_existing:
+            res = list(
+                Test.list(
+                    self.session,
+                    paginated=False,
+                    size=resource.AnyOf(range(2, 10)),
+                    meta={'x': resource.AnyOf([2, 3])},
+                )
+            )
+
+        self.assertEqual(['2', '3'], [r.id for r in res])
+        self.assertEqual(2, mock_existing.call_count)
+
+        self.session.get.return_value = mock_response
+        res = list(
+            Test.list(self.session, paginated=False, tags=['a'], size=7)
+        )
+        self.assertEqual(['3'], [r.id for r in res])
+
+    def test_list_client_filters_set_equality(self):
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {
+            "resources": [
+                {"id": "1", "tags": ["a", "b"], "flavor": "a"},
+                {"id": "2", "tags": ["a"], "flavor": "b"},
+                {"id": "3", "tags": ["b", "a"], "flavor": "c"},
+            ]
+        }
+        self.session.get.return_value = mock_response
+
+        class Test(self.test_class):
+            tags = resource.Body("tags", type=set)
+            flavor = resource.Body("flavor")
+
+        # Sets are values like any other, not sets of accepted values
+        res = list(Test.list(self.session, paginated=False, tags={'a', 'b'}))
+        self.assertEqual(['1', '3'], [r.id for r in res])
+
+        res = list(Test.list(self.session, paginated=False, flavor={'a'}))
+        self.assertEqual([], res)
+
+        res = list(
+            Test.list(
+                self.session,
+                paginated=False,
+                tags=resource.AnyOf([{'a'}, {'c'}]),
+                flavor=resource.AnyOf({'a', 'b', 'c'}),
+            )
+        )
+        self.assertEqual(['2'], [r.id for r in res])
+
+    def test_any_of(self):
+        self.assertIn(3, resource.AnyOf(range(2, 10)))
+        self.assertNotIn(10, resource.AnyOf(range(2, 10)))
+        self.assertIn('a', resource.AnyOf(x for x in 'ab'))
+        # Unhashable values aren't members of sets rather than errors
+        self.assertNotIn(['a'], resource.AnyOf({'a'}))
+        self.assertEqual("AnyOf(('a', 'b'))", repr(resource.AnyOf('ab')))
+
+    def test_list_client_filters_marker(self):
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.side_effect = [
+            {"resources": [{"id": "1", "b": "x"}, {"id": "2", "b": "y"}]},
+            {"resources": []},
+        ]
+        self.session.get.return_value = mock_response
+
+        class Test(self.test_class):
+            b = resource.Body("b")
+
+        res = list(Test.list(self.session, limit=2, b='x'))
+
+        self.assertEqual(['1'], [r.id for r in res])
+        # The marker is taken from the last resource, even filtered out
+        self.assertEqual(
+            {'limit': 2, 'marker': '2'},
+            self.session.get.call_args_list[1][1]['params'],
+        )
+
+    def test_list_client_filters_alias(self):
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {
+            "resources": [
+                {"id": "1", "availability_zone": "nova"},
+                {"id": "2", "availability_zone": "other"},
+                {"id": "3", "az": "nova"},
+            ]
+        }
+        self.session.get.return_value = mock_response
+
+        class Test(self.test_class):
+            zone = resource.Body("availability_zone")
+            az = resource.Body("az", alias="zone")
+
+        res = list(Test.list(self.session, paginated=False, az='nova'))
+
+        self.assertEqual(['1', '3'], [r.id for r in res])
+
+    def test_list_client_filters_hooks(self):
+        mock_response = mock.Mock()
+        mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.json.return_value = {
+            "resources": [
+                {"id": "1", "Name": "foo"},
+                {"id": "2", "Name": "bar"},
+            ]
+        }
+        self.session.get.return_value = mock_response
+
+        class Test(self.test_class):
+            name = resource.Body("name")
+
+            def _consume_body_attrs(self, attrs):
+                if 'Name' in attrs:
+                    attrs['name'] = attrs.pop('Name')
+                return super()._consume_body_attrs(attrs)
+
+        res = list(Test.list(self.session, paginated=False, name='foo'))
+
+        self.assertEqual(['1'], [r.id for r in res])
+
     def test_values_as_list_params(self):
         id = 1
         qp = "query param!"
@@ -3742,6 +4502,234 @@ class TestWaitForDelete(TestWait):
         )
 
 
+class TestWaitForMany(TestWait):
+    class Res(resource.Resource):
+        allow_list = True
+        status = resource.Body('status')
+
+    def setUp(self):
+        super().setUp()
+        self.session = mock.Mock()
+        self.listings = []
+
+        def list_(session, base_path=None, **query):
+            # Keep returning the last listing
+            if len(self.listings) > 1:
+                statuses = self.listings.pop(0)
+            else:
+                statuses = self.listings[0] if self.listings else {}
+            return [
+                self.Res(id=res_id, status=status)
+                for res_id, status in statuses.items()
+            ]
+
+        patcher = mock.patch.object(self.Res, 'list', side_effect=list_)
+        self.list = patcher.start()
+        self.addCleanup(patcher.stop)
+        sleep = mock.patch('time.sleep')
+        sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def _resources(self, *ids):
+        return [self.Res(id=res_id, status='building') for res_id in ids]
+
+    def test_status(self):
+        self.listings = [
+            {'a': 'building', 'b': 'ERROR', 'c': 'building'},
+            {'a': 'active', 'c': 'building'},
+            {'other': 'active'},
+        ]
+
+        result = resource.wait_for_many(
+            self.session,
+            self._resources('a', 'b', 'c', 'd'),
+            'ACTIVE',
+            interval=1,
+            base_path='/res/detail',
+            all_projects=True,
+        )
+
+        self.assertEqual(['a', 'b', 'c', 'd'], list(result))
+        self.assertEqual('active', result['a'].status)
+        self.assertIsInstance(result['b'], exceptions.ResourceFailure)
+        # Missing from the third listing
+        self.assertIsInstance(result['c'], exceptions.ResourceFailure)
+        # Missing from the first listing
+        self.assertIsInstance(result['d'], exceptions.ResourceFailure)
+        self.assertEqual(3, self.list.call_count)
+        self.list.assert_called_with(
+            self.session, base_path='/res/detail', all_projects=True
+        )
+
+    def test_immediate_status(self):
+        res = self._resources('a')
+
+        result = resource.wait_for_many(self.session, res, 'building')
+
+        self.assertEqual({'a': res[0]}, result)
+        self.list.assert_not_called()
+
+    def test_delete(self):
+        self.listings = [
+            {'a': 'deleting', 'b': 'deleting'},
+            {'a': 'deleting', 'b': 'deleted'},
+            {},
+        ]
+        res = self._resources('a', 'b')
+
+        result = resource.wait_for_many(self.session, res, None, interval=1)
+
+        self.assertIs(res[0], result['a'])
+        self.assertEqual('deleted', result['b'].status)
+        self.assertEqual(3, self.list.call_count)
+
+    def test_timeout(self):
+        self.listings = [{'a': 'active', 'b': 'building'}]
+
+        result = resource.wait_for_many(
+            self.session,
+            self._resources('a', 'b'),
+            'active',
+            interval=0.01,
+            wait=0.05,
+        )
+
+        self.assertEqual('active', result['a'].status)
+        self.assertIsInstance(result['b'], exceptions.ResourceTimeout)
+
+    def test_mixed_types(self):
+        class Other(resource.Resource):
+            pass
+
+        self.assertRaises(
+            ValueError,
+            resource.wait_for_many,
+            self.session,
+            [self.Res(id='a'), Other(id='b')],
+            'active',
+        )
+
+
+class TestWaitWithRegistry(TestWait):
+    class Res(resource.Resource):
+        status = resource.Body('status')
+
+    def setUp(self):
+        super().setUp()
+        self.session = mock.Mock()
+        self.registry = resource.WaiterRegistry(deadline=0.01)
+        self.statuses = []
+        self.events = []
+
+        def fetch(res, session, skip_cache=False):
+            if self.statuses:
+                res._update(status=self.statuses.pop(0))
+            # Changes happening once the waiter polled the resource
+            for attrs in self.events:
+                self.registry.publish('Res', res.id, attrs)
+            self.events = []
+            return res
+
+        patcher = mock.patch.object(
+            self.Res, 'fetch', autospec=True, side_effect=fetch
+        )
+        self.fetch = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.res = self.Res(id='a', status='building')
+
+    def test_status_event(self):
+        self.registry.deadline = 60
+        self.statuses = ['building']
+        self.events = [{'status': 'building'}, {'status': 'ACTIVE'}]
+
+        result = resource.wait_for_status(
+            self.session, self.res, 'ACTIVE', wait=60, registry=self.registry
+        )
+
+        self.assertEqual('ACTIVE', result.status)
+        self.assertEqual(1, self.fetch.call_count)
+
+    def test_deadline(self):
+        # Without events, waiters poll every deadline
+        self.statuses = ['building', 'building', 'ACTIVE']
+
+        result = resource.wait_for_status(
+            self.session, self.res, 'ACTIVE', wait=60, registry=self.registry
+        )
+
+        self.assertEqual('ACTIVE', result.status)
+        self.assertEqual(3, self.fetch.call_count)
+
+    def test_timeout(self):
+        self.registry.deadline = 60
+
+        self.assertRaises(
+            exceptions.ResourceTimeout,
+            resource.wait_for_status,
+            self.session,
+            self.res,
+            'ACTIVE',
+            wait=0.05,
+            registry=self.registry,
+        )
+        self.assertEqual(1, self.fetch.call_count)
+
+    def test_delete_event(self):
+        self.registry.deadline = 60
+        self.events = [{'status': 'deleting'}, None]
+
+        result = resource.wait_for_delete(
+            self.session, self.res, wait=60, registry=self.registry
+        )
+
+        self.assertIs(self.res, result)
+        self.assertEqual(1, self.fetch.call_count)
+
+    def test_connection_registry(self):
+        self.registry.deadline = 60
+        self.session._get_connection.return_value.waiter_registry = (
+            self.registry
+        )
+        self.events = [{'status': 'ACTIVE'}]
+
+        result = resource.wait_for_status(
+            self.session, self.res, 'ACTIVE', wait=60
+        )
+
+        self.assertEqual('ACTIVE', result.status)
+        self.assertEqual(1, self.fetch.call_count)
+
+    def test_local_event_source(self):
+        self.registry.deadline = 60
+        events = queue.Queue()
+        source = resource.LocalEventSource(self.registry, events)
+        source.start()
+        self.addCleanup(source.stop)
+
+        def fetch(res, session, skip_cache=False):
+            events.put(('Res', res.id, {'status': 'ACTIVE'}))
+            return res
+
+        self.fetch.side_effect = fetch
+
+        result = resource.wait_for_status(
+            self.session, self.res, 'ACTIVE', wait=60, registry=self.registry
+        )
+
+        self.assertEqual('ACTIVE', result.status)
+        self.assertEqual(1, self.fetch.call_count)
+
+    def test_event_source_abstract(self):
+        self.assertRaises(TypeError, resource.EventSource, self.registry)
+
+    def test_publish_unwatched(self):
+        self.assertFalse(self.registry.publish('Res', 'a', {}))
+        with self.registry.watch('Res', 'a') as watch:
+            self.assertTrue(self.registry.publish('Res', 'a', None))
+            self.assertIsNone(watch.get_nowait())
+        self.assertFalse(self.registry.publish('Res', 'a', {}))
+
+
 @mock.patch.object(resource.Resource, '_get_microversion', autospec=True)
 class TestAssertMicroversionFor(base.TestCase):
     session = mock.Mock()
@@ -28,6 +28,7 @@ import prometheus_client
 from requests import exceptions as rexceptions
 import testtools.content
 
+from openstack import _metrics
 from openstack.tests.unit import base
 
 
@@ -359,6 +360,16 @@ class TestStats(base.TestCase):
         )
 
 
+class TestStatsAsync(TestStats):
+    def setUp(self):
+        super().setUp()
+        # Proxies, and their statsd clients, are created on first use
+        self.cloud.config._metrics_pipeline = _metrics.MetricsPipeline(
+            flush_interval=0.01
+        )
+        self.addCleanup(self.cloud.config.close_metrics)
+
+
 class TestNoStats(base.TestCase):
     def setUp(self):
         super().setUp()
@@ -11,6 +11,7 @@
 # under the License.
 
 import concurrent.futures
+import json
 import logging
 import sys
 from unittest import mock
@@ -130,6 +131,39 @@ class Test_urljoin(base.TestCase):
         self.assertEqual(result, "http://www.example.com/ascii/extra_chars-™")
 
 
+class TestImportSubmodule(base.TestCase):
+    def test_import(self):
+        from openstack.tests.unit.fake.v1 import fake
+
+        self.assertIs(
+            fake,
+            utils.import_submodule('openstack.tests.unit.fake.v1', 'fake'),
+        )
+
+    def test_missing(self):
+        self.assertRaises(
+            AttributeError,
+            utils.import_submodule,
+            'openstack.tests.unit.fake.v1',
+            'missing',
+        )
+
+    def test_dunder(self):
+        with mock.patch('importlib.import_module') as mock_import:
+            self.assertRaises(
+                AttributeError,
+                utils.import_submodule,
+                'openstack.tests.unit.fake.v1',
+                '__wrapped__',
+            )
+        mock_import.assert_not_called()
+
+    def test_service_package(self):
+        from openstack.dns.v2 import zone
+
+        self.assertIs(zone, openstack.dns.v2.zone)
+
+
 class TestSupportsMicroversion(base.TestCase):
     def setUp(self):
         super().setUp()
@@ -219,6 +253,66 @@ class TestMaximumSupportedMicroversion(base.TestCase):
             utils.maximum_supported_microversion(self.adapter, '1.2')
         )
 
+    def test_cached(self):
+        utils.reset_microversion_cache_stats()
+
+        for _ in range(3):
+            self.assertEqual(
+                '1.42',
+                utils.maximum_supported_microversion(self.adapter, '1.42'),
+            )
+        self.assertEqual(
+            '1.99', utils.maximum_supported_microversion(self.adapter, '1.104')
+        )
+
+        self.assertEqual(2, self.adapter.get_endpoint_data.call_count)
+        self.assertEqual(
+            {'hits': 2, 'misses': 2, 'invalidations': 0},
+            utils.get_microversion_cache_stats(),
+        )
+
+    def test_cache_invalidated_on_reauth(self):
+        utils.reset_microversion_cache_stats()
+        self.adapter.auth = mock.Mock(auth_ref=mock.sentinel.token1)
+
+        utils.maximum_supported_microversion(self.adapter, '1.42')
+        self.endpoint_data.max_microversion = '1.10'
+        self.assertEqual(
+            '1.42', utils.maximum_supported_microversion(self.adapter, '1.42')
+        )
+
+        self.adapter.auth.auth_ref = mock.sentinel.token2
+        self.assertEqual(
+            '1.10', utils.maximum_supported_microversion(self.adapter, '1.42')
+        )
+        self.assertEqual(
+            {'hits': 1, 'misses': 2, 'invalidations': 1},
+            utils.get_microversion_cache_stats(),
+        )
+
+    def test_cache_invalidated(self):
+        utils.maximum_supported_microversion(self.adapter, '1.42')
+        self.endpoint_data.max_microversion = '1.10'
+
+        utils.invalidate_microversion_cache(self.adapter)
+
+        self.assertEqual(
+            '1.10', utils.maximum_supported_microversion(self.adapter, '1.42')
+        )
+
+    def test_discovery_failure_not_cached(self):
+        self.adapter.service_type = 'compute'
+        self.adapter.get_endpoint_data.return_value = None
+
+        self.assertIsNone(
+            utils.maximum_supported_microversion(self.adapter, '1.42')
+        )
+
+        self.adapter.get_endpoint_data.return_value = self.endpoint_data
+        self.assertEqual(
+            '1.42', utils.maximum_supported_microversion(self.adapter, '1.42')
+        )
+
 
 class TestOsServiceTypesVersion(base.TestCase):
     def test_ost_version(self):
@@ -231,6 +325,49 @@ class TestOsServiceTypesVersion(base.TestCase):
         )
 
 
+class TestIterJsonList(base.TestCase):
+    def _chunks(self, doc, size):
+        data = json.dumps(doc, indent=2).encode('utf-8')
+        return [data[i : i + size] for i in range(0, len(data), size)]
+
+    def test_iter_json_list(self):
+        doc = {
+            'count': 123,
+            'servers': [
+                {'id': i, 'name': f'srv-\u2713-{i}', 'ram': 1.5 * i}
+                for i in range(50)
+            ],
+            'servers_links': [{'rel': 'next', 'href': 'next'}],
+        }
+
+        for size in (1, 7, 4096):
+            members = {}
+            items = list(
+                utils.iter_json_list(
+                    self._chunks(doc, size), 'servers', members
+                )
+            )
+            self.assertEqual(doc['servers'], items)
+            self.assertEqual(
+                {'count': 123, 'servers_links': doc['servers_links']},
+                members,
+            )
+
+    def test_iter_json_list_not_list(self):
+        members = {}
+        items = list(
+            utils.iter_json_list([b'{"server": {"id": 1}}'], 'server', members)
+        )
+        self.assertEqual([], items)
+        self.assertEqual({'server': {'id': 1}}, members)
+
+    def test_iter_json_list_invalid(self):
+        for doc in (b'[1, 2]', b'{"servers": [1, 2}', b'{"a": 1} 2'):
+            self.assertRaises(
+                ValueError, list, utils.iter_json_list([doc], 'servers', {})
+            )
+
+
 class TestTinyDAG(base.TestCase):
     test_graph = {
         'a': ['b', 'd', 'f'],
@@ -374,3 +511,105 @@ class TestGetFileSize(base.TestCase):
         size = utils.get_file_size(data)
 
         self.assertIsNone(size)  # string objects don't have seek/tell
+
+
+class TestPollingStrategy(base.TestCase):
+    def _delays(self, strategy, interval=2, count=6):
+        delays = strategy.delays(interval)
+        return [next(delays) for _ in range(count)]
+
+    def test_fixed(self):
+        self.assertEqual([2] * 6, self._delays(utils.PollingStrategy()))
+
+    def test_exponential(self):
+        self.assertEqual(
+            [2, 4, 8, 16, 20, 20],
+            self._delays(utils.ExponentialBackoff(max_interval=20)),
+        )
+
+    def test_jitter(self):
+        delays = self._delays(
+            utils.DecorrelatedJitter(max_interval=20), count=100
+        )
+        self.assertTrue(all(2 <= delay <= 20 for delay in delays))
+        self.assertGreater(len(set(delays)), 1)
+
+    def test_initial_delay(self):
+        strategy = utils.PollingStrategy(initial_delays={'Server': 10})
+        self.assertEqual(10, strategy.get_initial_delay('Server'))
+        self.assertEqual(0, strategy.get_initial_delay('Volume'))
+        self.assertEqual(0, strategy.get_initial_delay(None))
+
+
+class TestIterateTimeout(base.TestCase):
+    @mock.patch('time.sleep')
+    def test_strategy(self, mock_sleep):
+        strategy = utils.ExponentialBackoff(initial_delays={'Server': 10})
+        stats = utils.PollingStats()
+
+        for count in utils.iterate_timeout(
+            60,
+            'message',
+            wait=1,
+            strategy=strategy,
+            resource_type='Server',
+            stats=stats,
+        ):
+            if count == 4:
+                break
+
+        self.assertEqual(
+            [mock.call(10), mock.call(1), mock.call(2), mock.call(4)],
+            mock_sleep.call_args_list,
+        )
+        self.assertEqual({'Server': {'waiters': 1, 'polls': 4}}, stats.get())
+
+    @mock.patch('time.sleep')
+    def test_initial_delay_timeout(self, mock_sleep):
+        strategy = utils.PollingStrategy(initial_delays={'Server': 600})
+
+        for count in utils.iterate_timeout(
+            60, 'message', wait=5, strategy=strategy, resource_type='Server'
+        ):
+            break
+
+        mock_sleep.assert_called_once_with(55)
+
+    def test_stats_timeout(self):
+        stats = utils.PollingStats()
+
+        self.assertRaises(
+            exceptions.ResourceTimeout,
+            list,
+            utils.iterate_timeout(0.05, 'message', wait=0.01, stats=stats),
+        )
+
+        counts = stats.get()['unknown']
+        self.assertEqual(1, counts['waiters'])
+        self.assertGreaterEqual(counts['polls'], 1)
+
+        stats.reset()
+        self.assertEqual({}, stats.get())
+
+    def test_get_polling_options(self):
+        self.cloud.config.config['polling_strategy'] = 'jitter'
+        self.cloud.config.config['polling_max_interval'] = 10
+
+        options = utils.get_polling_options(self.cloud.compute, 'Server')
+
+        self.assertIsInstance(options['strategy'], utils.DecorrelatedJitter)
+        self.assertEqual(10, options['strategy'].max_interval)
+        self.assertEqual('Server', options['resource_type'])
+        self.assertIs(self.cloud._polling_stats, options['stats'])
+
+        strategy = utils.ExponentialBackoff()
+        options = utils.get_polling_options(self.cloud, 'Server', strategy)
+        self.assertIs(strategy, options['strategy'])
+
+    def test_get_polling_options_default(self):
+        options = utils.get_polling_options(mock.Mock(), 'Server')
+
+        self.assertEqual(
+            {'strategy': None, 'resource_type': 'Server', 'stats': None},
+            options,
+        )
@@ -10,17 +10,22 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import codecs
 from collections.abc import Mapping
 import errno
 import hashlib
+import importlib
 import io
+import json
 import os
 import queue
+import random
 import string
 import threading
 import time
+import types
 from typing import Any, Literal, TYPE_CHECKING, TypeVar, cast, overload
-from collections.abc import Generator, Iterable
+from collections.abc import Generator, Iterable, Iterator
 
 import keystoneauth1
 from keystoneauth1 import adapter as ks_adapter
@@ -50,10 +55,200 @@ def urljoin(*args: str | None) -> str:
     return '/'.join(str(a or '').strip('/') for a in args)
 
 
+def import_submodule(package: str, name: str) -> types.ModuleType:
+    """Import a submodule of a package on attribute access.
+
+    Service packages no longer import their proxy, and all the resources it
+    uses, with ``import openstack``. Their module ``__getattr__`` uses this
+    so that ``openstack.compute.v2.server`` keeps working without importing
+    the module first.
+
+    :param package: The name of the package.
+    :param name: The name of the attribute.
+    :returns: The submodule.
+    :raises: :class:`AttributeError` if the package has no such submodule.
+    """
+    module_name = f'{package}.{name}'
+    if not name.startswith('__'):
+        try:
+            return importlib.import_module(module_name)
+        except ModuleNotFoundError as e:
+            if e.name != module_name:
+                raise
+    raise AttributeError(f'module {package!r} has no attribute {name!r}')
+
+
+class PollingStrategy:
+    """How long waiters sleep between two polls of a resource.
+
+    This base strategy sleeps the interval requested by the waiter every
+    time, which is the default. Subclasses vary the delays so that many
+    waiters started together do not keep polling in lockstep.
+
+    :param initial_delays: A dict of the names of resource classes, such as
+        ``Server`` or ``Node``, to a number of seconds to sleep before the
+        first poll, such as the time their creation is expected to take at
+        least. Waiters that know the type of the resource they wait on skip
+        polls that cannot succeed this way.
+    """
+
+    def __init__(self, initial_delays: Mapping[str, float] | None = None):
+        self.initial_delays = {
+            name: float(delay)
+            for name, delay in (initial_delays or {}).items()
+        }
+
+    def get_initial_delay(self, resource_type: str | None) -> float:
+        """Return how long to sleep before the first poll.
+
+        :param resource_type: The name of the class of the resource waited
+            on, if known.
+        """
+        if resource_type is None:
+            return 0.0
+        return self.initial_delays.get(resource_type, 0.0)
+
+    def delays(self, interval: float) -> Iterator[float]:
+        """Yield how long to sleep before each poll after the first one.
+
+        :param interval: The interval requested by the waiter.
+        """
+        while True:
+            yield interval
+
+
+class ExponentialBackoff(PollingStrategy):
+    """Multiply the delay between polls by ``factor`` after each poll.
+
+    The first delay is the interval requested by the waiter, so that changes
+    happening quickly are detected as early as with the default strategy.
+
+    :param factor: The factor to multiply delays by.
+    :param max_interval: The maximum delay in seconds.
+    :param initial_delays: See :class:`PollingStrategy`.
+    """
+
+    def __init__(
+        self,
+        factor: float = 2.0,
+        max_interval: float = 30.0,
+        initial_delays: Mapping[str, float] | None = None,
+    ):
+        super().__init__(initial_delays)
+        self.factor = float(factor)
+        self.max_interval = float(max_interval)
+
+    def delays(self, interval: float) -> Iterator[float]:
+        delay = interval
+        while True:
+            yield min(delay, self.max_interval)
+            delay *= self.factor
+
+
+class DecorrelatedJitter(PollingStrategy):
+    """Sleep a random delay growing with the previous one.
+
+    Each delay is picked between the interval requested by the waiter and
+    three times the previous delay, as described in
+    https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/,
+    which spreads the polls of waiters started together over time.
+
+    :param max_interval: The maximum delay in seconds.
+    :param initial_delays: See :class:`PollingStrategy`.
+    """
+
+    def __init__(
+        self,
+        max_interval: float = 30.0,
+        initial_delays: Mapping[str, float] | None = None,
+    ):
+        super().__init__(initial_delays)
+        self.max_interval = float(max_interval)
+
+    def delays(self, interval: float) -> Iterator[float]:
+        delay = interval
+        while True:
+            delay = min(
+                self.max_interval,
+                random.uniform(interval, delay * 3),  # noqa: S311
+            )
+            yield delay
+
+
+#: The polling strategies selectable with the ``polling_strategy`` setting.
+POLLING_STRATEGIES: dict[str, type[PollingStrategy]] = {
+    'fixed': PollingStrategy,
+    'exponential': ExponentialBackoff,
+    'jitter': DecorrelatedJitter,
+}
+
+
+class PollingStats:
+    """Thread-safe counters of the polls issued by waiters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: dict[str, dict[str, int]] = {}
+
+    def record(self, resource_type: str, polls: int) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(
+                resource_type, {'waiters': 0, 'polls': 0}
+            )
+            counts['waiters'] += 1
+            counts['polls'] += polls
+
+    def get(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {
+                name: dict(counts) for name, counts in self._counts.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = {}
+
+
+def get_polling_options(
+    session: Any,
+    resource_type: str | None = None,
+    strategy: PollingStrategy | None = None,
+) -> dict[str, Any]:
+    """Return the polling arguments of :func:`iterate_timeout` for a waiter.
+
+    :param session: The proxy or connection the waiter polls with. The
+        polling strategy configured for its cloud is used, and its polls are
+        counted in the statistics of its connection.
+    :param resource_type: The name of the class of the resource waited on.
+    :param strategy: A polling strategy overriding the configured one.
+    :returns: A dict of ``strategy``, ``resource_type`` and ``stats``.
+    """
+    conn = session
+    get_connection = getattr(session, '_get_connection', None)
+    if callable(get_connection):
+        conn = get_connection()
+    stats = getattr(conn, '_polling_stats', None)
+    if strategy is None:
+        config = getattr(conn, 'config', None)
+        get_polling_strategy = getattr(config, 'get_polling_strategy', None)
+        if callable(get_polling_strategy):
+            strategy = get_polling_strategy()
+    return {
+        'strategy': (
+            strategy if isinstance(strategy, PollingStrategy) else None
+        ),
+        'resource_type': resource_type,
+        'stats': stats if isinstance(stats, PollingStats) else None,
+    }
+
+
 def iterate_timeout(
     timeout: int | float | None,
     message: str,
     wait: int | float | None = 2,
+    strategy: PollingStrategy | None = None,
+    resource_type: str | None = None,
+    stats: PollingStats | None = None,
 ) -> Generator[int, None, None]:
     """Iterate and raise an exception on timeout.
 
@@ -67,6 +262,12 @@ def iterate_timeout(
         reached.
     :param wait: Number of seconds to wait between checks. Set to ``None``
         to use the default interval.
+    :param strategy: The :class:`PollingStrategy` deciding how long to sleep
+        between checks, based on ``wait``. Defaults to sleeping ``wait``
+        seconds every time.
+    :param resource_type: The name of the class of the resource waited on,
+        used to pick the initial delay of ``strategy`` and to count checks.
+    :param stats: The :class:`PollingStats` to count the checks in.
 
     :returns: None
     :raises: :class:`~openstack.exceptions.ResourceTimeout` transition
@@ -91,16 +292,35 @@ def iterate_timeout(
             f"Wait value must be an int or float value. {wait!r} given instead"
         )
 
+    if strategy is None:
+        strategy = _DEFAULT_POLLING_STRATEGY
+    delays = strategy.delays(wait)
+
     start = time.time()
     count = 0
-    while (timeout is None) or (time.time() < start + timeout):
-        count += 1
-        yield count
-        log.debug('Waiting %s seconds', wait)
-        time.sleep(wait)
+    try:
+        initial_delay = strategy.get_initial_delay(resource_type)
+        if initial_delay:
+            if timeout is not None:
+                # Leave time for at least one check
+                initial_delay = min(initial_delay, max(timeout - wait, 0))
+            log.debug('Waiting %s seconds before polling', initial_delay)
+            time.sleep(initial_delay)
+        while (timeout is None) or (time.time() < start + timeout):
+            count += 1
+            yield count
+            delay = next(delays)
+            log.debug('Waiting %s seconds', delay)
+            time.sleep(delay)
+    finally:
+        if stats is not None:
+            stats.record(resource_type or 'unknown', count)
     raise exceptions.ResourceTimeout(message)
 
 
+_DEFAULT_POLLING_STRATEGY = PollingStrategy()
+
+
 class _AccessSaver:
     __slots__ = ('keys',)
 
@@ -355,12 +575,82 @@ def pick_microversion(
     return discover.version_to_string(required_normalized)
 
 
+class _MicroversionCache:
+    """Counters for the negotiated microversion cache.
+
+    The negotiated microversions themselves are stored on each adapter, see
+    :func:`maximum_supported_microversion`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def record(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.invalidations = 0
+
+
+_microversion_cache = _MicroversionCache()
+
+
+def get_microversion_cache_stats() -> dict[str, int]:
+    """Return the counters of the negotiated microversion cache.
+
+    :returns: A dict with the number of ``hits``, ``misses`` and
+        ``invalidations`` since the process started or the last call to
+        :func:`reset_microversion_cache_stats`.
+    """
+    return _microversion_cache.stats()
+
+
+def reset_microversion_cache_stats() -> None:
+    """Reset the counters of the negotiated microversion cache."""
+    _microversion_cache.reset()
+
+
+def invalidate_microversion_cache(adapter: ks_adapter.Adapter) -> None:
+    """Forget the microversions negotiated for an adapter.
+
+    This is done automatically when the adapter re-authenticates.
+
+    :param adapter: :class:`~keystoneauth1.adapter.Adapter` instance.
+    """
+    if vars(adapter).pop('_microversion_cache', None) is not None:
+        _microversion_cache.record('invalidations')
+
+
+def _get_auth_ref(adapter: ks_adapter.Adapter) -> Any:
+    auth = getattr(adapter, 'auth', None) or getattr(
+        getattr(adapter, 'session', None), 'auth', None
+    )
+    return getattr(auth, 'auth_ref', None)
+
+
 def maximum_supported_microversion(
     adapter: ks_adapter.Adapter,
     client_maximum: str | None,
 ) -> str | None:
     """Determine the maximum microversion supported by both client and server.
 
+    The result is cached on the adapter, per endpoint and client maximum,
+    until the adapter re-authenticates or
+    :func:`invalidate_microversion_cache` is called.
+
     :param adapter: :class:`~keystoneauth1.adapter.Adapter` instance.
     :param client_maximum: Maximum microversion supported by the client.
         If ``None``, ``None`` is returned.
@@ -370,6 +660,28 @@ def maximum_supported_microversion(
     if client_maximum is None:
         return None
 
+    # A new token may come with a new catalog, so forget everything we
+    # negotiated with the previous one.
+    auth_ref = _get_auth_ref(adapter)
+    cache: tuple[Any, dict[tuple[str | None, str], str | None]] | None
+    cache = vars(adapter).get('_microversion_cache')
+    if cache is None or cache[0] is not auth_ref:
+        if cache is not None:
+            _microversion_cache.record('invalidations')
+        cache = (auth_ref, {})
+        adapter._microversion_cache = cache  # type: ignore[attr-defined]
+
+    key = (getattr(adapter, 'endpoint_override', None), client_maximum)
+    try:
+        result = cache[1][key]
+    except KeyError:
+        pass
+    else:
+        _microversion_cache.record('hits')
+        return result
+
+    _microversion_cache.record('misses')
+
     # NOTE(dtantsur): if we cannot determine supported microversions, fall back
     # to the default one.
     try:
@@ -383,27 +695,31 @@ def maximum_supported_microversion(
             'Cannot determine endpoint data for service %s',
             adapter.service_type or adapter.service_name,
         )
+        # Don't cache this: discovery may well succeed next time.
         return None
 
-    if not endpoint_data.max_microversion:
-        return None
-
-    client_max = discover.normalize_version_number(client_maximum)
-    server_max = discover.normalize_version_number(
-        endpoint_data.max_microversion
-    )
-
-    if endpoint_data.min_microversion:
-        server_min = discover.normalize_version_number(
-            endpoint_data.min_microversion
+    result = None
+    if endpoint_data.max_microversion:
+        client_max = discover.normalize_version_number(client_maximum)
+        server_max = discover.normalize_version_number(
+            endpoint_data.max_microversion
+        )
+        server_min = (
+            discover.normalize_version_number(endpoint_data.min_microversion)
+            if endpoint_data.min_microversion
+            else None
         )
-        if client_max < server_min:
-            # NOTE(dtantsur): we may want to raise in this case, but this keeps
-            # the current behavior intact.
-            return None
+        # NOTE(dtantsur): we may want to raise if the client maximum is below
+        # the server minimum, but this keeps the current behavior intact.
+        if server_min is None or client_max >= server_min:
+            result = discover.version_to_string(min(client_max, server_max))
 
-    result = min(client_max, server_max)
-    return discover.version_to_string(result)
+    if _get_auth_ref(adapter) is not auth_ref:
+        # Discovery may have (re-)authenticated the adapter.
+        cache = (_get_auth_ref(adapter), {})
+        adapter._microversion_cache = cache  # type: ignore[attr-defined]
+    cache[1][key] = result
+    return result
 
 
 def _hashes_up_to_date(
@@ -491,6 +807,134 @@ def get_file_size(file_obj: Any) -> int | None:
     return None
 
 
+class _JSONStreamReader:
+    """Buffer over a JSON document received in chunks.
+
+    Values are decoded with :meth:`json.JSONDecoder.raw_decode` once enough
+    of the document has been received, and dropped from the buffer once
+    decoded.
+    """
+
+    _decoder = json.JSONDecoder()
+    _whitespace = ' \t\n\r'
+
+    def __init__(self, chunks: Iterable[str | bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _read(self) -> bool:
+        """Append the next chunk to the buffer, returning False at the end."""
+        if self._eof:
+            return False
+        # Drop what has already been decoded
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        for chunk in self._chunks:
+            if isinstance(chunk, bytes):
+                chunk = self._text.decode(chunk)
+            if chunk:
+                self._buffer += chunk
+                return True
+        self._buffer += self._text.decode(b'', final=True)
+        self._eof = True
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, or '' at the end."""
+        while True:
+            while (
+                self._pos < len(self._buffer)
+                and self._buffer[self._pos] in self._whitespace
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                return ''
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, one of ``chars``."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(
+                f'Expected one of {chars!r} at position {self._pos} of the '
+                f'JSON document, got {char!r}'
+            )
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next value."""
+        self.peek()
+        available = len(self._buffer) - self._pos
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                if self._eof:
+                    raise
+            else:
+                # Numbers could go on in the next chunk
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            # Grow the buffer geometrically so that large values aren't
+            # decoded over and over again.
+            available *= 2
+            while len(self._buffer) - self._pos < available and self._read():
+                pass
+            available = len(self._buffer) - self._pos
+
+
+def iter_json_list(
+    chunks: Iterable[str | bytes], key: str, members: dict[str, Any]
+) -> Iterator[Any]:
+    """Yield the items of a list in a JSON object as they are decoded.
+
+    The JSON document is decoded incrementally from ``chunks``, such as
+    :meth:`requests.Response.iter_content`, so that the whole document
+    doesn't have to be held in memory. Other members of the object are
+    added to ``members``, which is complete once the generator is exhausted.
+    If the value of ``key`` isn't a list it is added to ``members`` instead.
+
+    :param chunks: An iterable of chunks of the JSON document, as UTF-8
+        encoded bytes or as strings.
+    :param key: The key of the list to yield the items of.
+    :param members: A dict to add other members of the object to.
+    :raises: ``ValueError`` if the document isn't a valid JSON object.
+    """
+    reader = _JSONStreamReader(chunks)
+    reader.expect('{')
+    if reader.peek() == '}':
+        reader.expect('}')
+        return
+
+    while True:
+        name = reader.value()
+        if not isinstance(name, str):
+            raise ValueError('Expected a string as name of a JSON member')
+        reader.expect(':')
+        if name == key and reader.peek() == '[':
+            reader.expect('[')
+            if reader.peek() == ']':
+                reader.expect(']')
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.expect(',]') == ']':
+                        break
+        else:
+            members[name] = reader.value()
+        if reader.expect(',}') == '}':
+            break
+
+    if reader.peek():
+        raise ValueError('Extra data after the JSON document')
+
+
 class TinyDAG:
     """Tiny DAG
 
@@ -545,12 +989,14 @@ class TinyDAG:
 
     def node_done(self, node: str) -> None:
         """Mark node as "processed" and put following items into the queue"""
-        self._done.add(node)
-
-        for v in self._graph[node]:
-            self._run_in_degree[v] -= 1
-            if self._run_in_degree[v] == 0:
-                self._queue.put(v)
+        # Nodes are marked done from the threads processing them
+        with self._lock:
+            self._done.add(node)
+
+            for v in self._graph[node]:
+                self._run_in_degree[v] -= 1
+                if self._run_in_degree[v] == 0:
+                    self._queue.put(v)
 
     def _start_traverse(self) -> None:
         """Initialize graph traversing"""
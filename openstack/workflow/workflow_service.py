@@ -10,15 +10,21 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from typing import TYPE_CHECKING
+
 from openstack import service_description
-from openstack.workflow.v2 import _proxy
+
+if TYPE_CHECKING:
+    from openstack.workflow.v2 import _proxy  # noqa: F401
 
 
 class WorkflowService(
-    service_description.ServiceDescription[_proxy.Proxy],
+    service_description.ServiceDescription['_proxy.Proxy'],
 ):
     """The workflow service."""
 
-    supported_versions = {
-        '2': _proxy.Proxy,
-    }
+    supported_versions = service_description.ProxyVersions(
+        {
+            '2': 'openstack.workflow.v2._proxy.Proxy',
+        }
+    )
@@ -0,0 +1,170 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Compare the ``json_backend`` options on large list/bulk_create payloads.
+
+Runs entirely offline against canned responses served by requests_mock::
+
+    python tools/json_benchmark.py --count 20000 --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import time
+import uuid
+
+import requests_mock
+
+from openstack import _json
+from openstack import connection
+from openstack import exceptions
+from openstack.network.v2 import security_group_rule
+
+ENDPOINT = 'https://network.example.com'
+VERSIONS = {
+    'versions': [
+        {
+            'id': 'v2.0',
+            'status': 'CURRENT',
+            'links': [{'href': f'{ENDPOINT}/v2.0', 'rel': 'self'}],
+        }
+    ]
+}
+
+
+def make_ports(count):
+    return [
+        {
+            'id': str(uuid.uuid4()),
+            'name': f'port-{i}',
+            'network_id': str(uuid.uuid4()),
+            'mac_address': 'fa:16:3e:00:00:00',
+            'admin_state_up': True,
+            'status': 'ACTIVE',
+            'device_owner': 'compute:nova',
+            'fixed_ips': [
+                {'subnet_id': str(uuid.uuid4()), 'ip_address': '10.0.0.1'}
+            ],
+            'security_groups': [str(uuid.uuid4())],
+            'tags': ['benchmark'],
+            'binding:vnic_type': 'normal',
+            'created_at': '2024-01-01T00:00:00Z',
+        }
+        for i in range(count)
+    ]
+
+
+def make_rules(count):
+    group_id = str(uuid.uuid4())
+    return [
+        {
+            'security_group_id': group_id,
+            'direction': 'ingress',
+            'ethertype': 'IPv4',
+            'protocol': 'tcp',
+            'port_range_min': 1000 + i % 60000,
+            'port_range_max': 1000 + i % 60000,
+            'remote_ip_prefix': '10.0.0.0/8',
+        }
+        for i in range(count)
+    ]
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def run(backend, ports_body, rules, rules_body, repeat):
+    with requests_mock.Mocker() as mock:
+        mock.get(f'{ENDPOINT}/', json=VERSIONS)
+        mock.get(f'{ENDPOINT}/v2.0', json=VERSIONS)
+        mock.get(
+            f'{ENDPOINT}/v2.0/ports',
+            content=ports_body,
+            headers={'Content-Type': 'application/json'},
+        )
+        mock.post(
+            f'{ENDPOINT}/v2.0/security-group-rules',
+            content=rules_body,
+            headers={'Content-Type': 'application/json'},
+        )
+        conn = connection.Connection(
+            auth_type='none',
+            network_endpoint_override=f'{ENDPOINT}/v2.0',
+            json_backend=backend,
+        )
+
+        def list_ports():
+            for _ in conn.network.ports(paginated=False):
+                pass
+
+        def bulk_create():
+            list(
+                security_group_rule.SecurityGroupRule.bulk_create(
+                    conn.network, rules
+                )
+            )
+
+        # Prime the proxy and version discovery.
+        list_ports()
+        return timed(list_ports, repeat), timed(bulk_create, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    ports_body = json.dumps({'ports': make_ports(args.count)}).encode()
+    rules = make_rules(args.count)
+    rules_body = json.dumps(
+        {
+            'security_group_rules': [
+                dict(rule, id=str(uuid.uuid4())) for rule in rules
+            ]
+        }
+    ).encode()
+
+    print(f'{args.count} items, median of {args.repeat} runs')
+    print(
+        f'{"backend":<12}{"decode (s)":>12}{"encode (s)":>12}'
+        f'{"list (s)":>12}{"bulk_create (s)":>18}'
+    )
+    for name in ('json', *_json.AUTO_BACKENDS):
+        try:
+            backend = _json.get_backend(name)
+        except exceptions.ConfigException:
+            print(f'{name:<12}{"not installed":>12}')
+            continue
+        decode_time = timed(lambda: backend.loads(ports_body), args.repeat)
+        encode_time = timed(
+            lambda: backend.dumps({'security_group_rules': rules}),
+            args.repeat,
+        )
+        list_time, create_time = run(
+            name, ports_body, rules, rules_body, args.repeat
+        )
+        print(
+            f'{name:<12}{decode_time:>12.3f}{encode_time:>12.3f}'
+            f'{list_time:>12.3f}{create_time:>18.3f}'
+        )
+
+
+if __name__ == '__main__':
+    main()